@@ -0,0 +1,9 @@
+"""
+Benchmark scripts for the project.
+
+Each module is runnable on its own from the project root, e.g.:
+
+    python -m benchmarks.login_lookup
+
+Benchmarks run against a throwaway test database and never touch db.sqlite3.
+"""
@@ -0,0 +1,158 @@
+"""
+Compare WSGI and ASGI throughput and tail latency on the auth endpoints.
+
+Runs the same request mix through three stacks in-process:
+
+    wsgi        WSGIHandler + sync views, served by a thread pool
+    asgi-sync   ASGIHandler + sync views (each view hops to a thread)
+    asgi-async  ASGIHandler + the native async views (ASYNC_VIEWS=True)
+
+with ``--concurrency`` threads (WSGI) or tasks (ASGI) in flight. Endpoints:
+dashboard (GET), login (POST), verify-email-code (POST, wrong code) and
+resend-verification (POST, inside the cooldown after the first call).
+
+Rate limiting is disabled and MD5 password hashing is used so the numbers
+reflect request handling rather than the limiter or the hasher. Against
+SQLite the database serialises writes, so run it against PostgreSQL for
+numbers that say something about production.
+
+Usage:
+    python -m benchmarks.asgi_vs_wsgi --requests 500 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import importlib
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlencode
+
+from benchmarks.harness import (asgi_request, create_user, format_summary,
+                                session_cookie, setup_django, summarize,
+                                temporary_database, wsgi_request)
+
+PASSWORD = "benchmark-password-1"
+CSRF_TOKEN = "b" * 32
+
+
+def endpoints(cookie):
+    """Return ``{name: (method, path, body, headers)}`` for the request mix."""
+    csrf = {"x-csrftoken": CSRF_TOKEN}
+    form = {"content-type": "application/x-www-form-urlencoded"}
+    logged_in = {"cookie": f"{cookie}; csrftoken={CSRF_TOKEN}", **csrf, **form}
+    anonymous = {"cookie": f"csrftoken={CSRF_TOKEN}", **csrf, **form}
+    login_body = urlencode({"email": "Bench@Example.com", "password": PASSWORD})
+    return {
+        "dashboard": ("GET", "/dashboard/", b"", logged_in),
+        "login": ("POST", "/auth/login/", login_body.encode(), anonymous),
+        "verify": ("POST", "/auth/verify-email-code/", b"code=000000", logged_in),
+        "resend": ("POST", "/auth/resend-verification/", b"", logged_in),
+    }
+
+
+def use_async_views(enabled):
+    """Rebuild the URLconf with ASYNC_VIEWS switched on or off."""
+    from django.conf import settings
+    from django.urls import clear_url_caches
+
+    settings.ASYNC_VIEWS = enabled
+    for module in ("core.urls", "users.urls", settings.ROOT_URLCONF):
+        importlib.reload(importlib.import_module(module))
+    clear_url_caches()
+
+
+def run_wsgi(request, count, concurrency):
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.db import connections
+
+    handler = WSGIHandler()
+
+    def worker(n):
+        samples, statuses = [], set()
+        for _ in range(n):
+            start = time.perf_counter()
+            statuses.add(wsgi_request(handler, *request))
+            samples.append((time.perf_counter() - start) * 1000)
+        connections.close_all()
+        return samples, statuses
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(worker, [count // concurrency] * concurrency))
+    return results, time.perf_counter() - start
+
+
+def run_asgi(request, count, concurrency):
+    from django.core.handlers.asgi import ASGIHandler
+
+    application = ASGIHandler()
+
+    async def worker(n):
+        samples, statuses = [], set()
+        for _ in range(n):
+            start = time.perf_counter()
+            statuses.add(await asgi_request(application, *request))
+            samples.append((time.perf_counter() - start) * 1000)
+        return samples, statuses
+
+    async def main():
+        return await asyncio.gather(
+            *(worker(count // concurrency) for _ in range(concurrency))
+        )
+
+    start = time.perf_counter()
+    results = asyncio.run(main())
+    return results, time.perf_counter() - start
+
+
+STACKS = {
+    "wsgi": (run_wsgi, False),
+    "asgi-sync": (run_asgi, False),
+    "asgi-async": (run_asgi, True),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500, help="per endpoint")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--stacks", default=",".join(STACKS))
+    parser.add_argument("--endpoints", default="dashboard,login,verify,resend")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    settings.RATELIMIT_ENABLED = False
+    settings.QUERY_BUDGET_RAISE = False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with temporary_database(sqlite_path=Path(tmp) / "bench.sqlite3"):
+            user = create_user("bench@example.com", PASSWORD)
+            requests = endpoints(session_cookie(user))
+            print(f"--- {connection.vendor}, concurrency {args.concurrency}")
+            for stack in args.stacks.split(","):
+                runner, async_views = STACKS[stack]
+                use_async_views(async_views)
+                for name in args.endpoints.split(","):
+                    results, elapsed = runner(
+                        requests[name], args.requests, args.concurrency
+                    )
+                    samples = [s for worker_samples, _ in results for s in worker_samples]
+                    statuses = set().union(*(st for _, st in results))
+                    print(
+                        f"{format_summary(f'{stack} {name}', summarize(samples))} "
+                        f"{len(samples) / elapsed:.0f} req/s {sorted(statuses)}"
+                    )
+            connection.close()
+
+
+if __name__ == "__main__":
+    main()
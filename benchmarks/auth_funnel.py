@@ -0,0 +1,416 @@
+"""
+Drive the whole auth funnel and record per-endpoint latency and query counts.
+
+Seeds ``--users`` accounts with ``users.bulk`` (pre-hashed passwords, one
+bulk insert per batch), then runs ``--iterations`` new visitors through
+
+    signup_form -> signup -> logout -> login -> dashboard -> settings
+    -> settings_update -> resend -> verify -> logout
+
+with ``--concurrency`` of them in flight, either through Django's test
+Client (``--driver client``) or over HTTP against a threaded local server
+(``--driver server``). Verification codes are read from the locmem mail
+outbox, so everything runs offline.
+
+For each endpoint it reports p50/p95/p99 latency, throughput of a single
+client (requests/s at the mean latency), errors and the query count taken
+from the Server-Timing header. ``--trace-memory`` adds the peak Python
+allocation per request (tracemalloc; attribution is only exact with
+``--concurrency 1``). Peak RSS of the process is always reported.
+
+Rate limiting is disabled and MD5 password hashing is used unless
+``--real-hashing`` is given, so the numbers reflect request handling.
+
+``--output`` writes the results as JSON. With ``--baseline`` the run is
+compared to an earlier one and the script exits with status 1 if an
+endpoint's p95 grew by more than ``--tolerance``, its query count went up,
+or it returned errors. CI can keep a baseline file and run:
+
+    python -m benchmarks.auth_funnel --baseline bench/baseline.json
+
+Usage:
+    python -m benchmarks.auth_funnel --users 10000 --iterations 200 \\
+        --concurrency 4 --driver server --output results.json
+"""
+
+import argparse
+import json
+import platform
+import re
+import resource
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from benchmarks.harness import (format_summary, setup_django, summarize,
+                                temporary_database)
+
+PASSWORD = "benchmark-password-1"
+QUERIES_RE = re.compile(r'"(\d+) queries"')
+CODE_RE = re.compile(r"\b(\d{6})\b")
+
+# Accepted status codes per step; anything else counts as an error.
+EXPECTED = {
+    "signup_form": {200},
+    "signup": {302},
+    "logout": {302},
+    "login": {302},
+    "dashboard": {200},
+    "settings": {200},
+    "settings_update": {302},
+    "resend": {200},
+    "verify": {200},
+}
+
+
+# ---------------------------
+#   Drivers
+# ---------------------------
+
+
+class ClientDriver:
+    """One visitor's browser, backed by the test Client."""
+
+    def __init__(self, base_url=None):
+        from django.test import Client
+
+        self.client = Client()
+
+    def request(self, method, path, data=None):
+        if method == "GET":
+            response = self.client.get(path)
+        else:
+            response = self.client.post(path, data or {})
+        return response.status_code, response.get("Server-Timing", "")
+
+
+class ServerDriver:
+    """One visitor's browser talking HTTP to the local server."""
+
+    def __init__(self, base_url):
+        import requests
+
+        self.base_url = base_url
+        self.session = requests.Session()
+
+    def request(self, method, path, data=None):
+        headers = {}
+        token = self.session.cookies.get("csrftoken")
+        if token:
+            headers["X-CSRFToken"] = token
+        response = self.session.request(
+            method,
+            self.base_url + path,
+            data=data,
+            headers=headers,
+            allow_redirects=False,
+        )
+        return response.status_code, response.headers.get("Server-Timing", "")
+
+
+def start_server():
+    """Serve the project on a free local port from a background thread."""
+    import logging
+
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.core.servers.basehttp import (ThreadedWSGIServer,
+                                              WSGIRequestHandler)
+
+    logging.getLogger("django.server").setLevel(logging.WARNING)
+    server = ThreadedWSGIServer(("127.0.0.1", 0), WSGIRequestHandler)
+    server.set_app(WSGIHandler())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+# ---------------------------
+#   Funnel
+# ---------------------------
+
+
+class Recorder:
+    """Collect per-step samples from all visitor threads."""
+
+    def __init__(self, trace_memory):
+        self.trace_memory = trace_memory
+        self.lock = threading.Lock()
+        self.steps = {}
+
+    def call(self, driver, step, method, path, data=None):
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        status, server_timing = driver.request(method, path, data)
+        elapsed = (time.perf_counter() - start) * 1000
+        alloc_kb = None
+        if self.trace_memory:
+            alloc_kb = (tracemalloc.get_traced_memory()[1] - before) / 1024
+        match = QUERIES_RE.search(server_timing)
+        with self.lock:
+            samples = self.steps.setdefault(
+                step, {"ms": [], "queries": [], "alloc_kb": [], "errors": 0}
+            )
+            samples["ms"].append(elapsed)
+            if match:
+                samples["queries"].append(int(match.group(1)))
+            if alloc_kb is not None:
+                samples["alloc_kb"].append(alloc_kb)
+            if status not in EXPECTED[step]:
+                samples["errors"] += 1
+        return status
+
+
+def latest_code(email):
+    from django.core import mail
+
+    for message in reversed(mail.outbox):
+        if email in message.to:
+            match = CODE_RE.search(message.body)
+            if match:
+                return match.group(1)
+    return "000000"
+
+
+def run_visitor(driver, recorder, index):
+    email = f"visitor{index}@example.com"
+    call = recorder.call
+    call(driver, "signup_form", "GET", "/auth/signup/")
+    call(
+        driver,
+        "signup",
+        "POST",
+        "/auth/signup/",
+        {"email": email, "password1": PASSWORD, "password2": PASSWORD},
+    )
+    call(driver, "logout", "POST", "/auth/logout/")
+    login = {"email": email, "password": PASSWORD}
+    call(driver, "login", "POST", "/auth/login/", login)
+    call(driver, "dashboard", "GET", "/dashboard/")
+    call(driver, "settings", "GET", "/auth/settings/")
+    call(
+        driver,
+        "settings_update",
+        "POST",
+        "/auth/settings/",
+        {"first_name": "Bench", "last_name": str(index), "bio": "Benchmarking."},
+    )
+    call(driver, "resend", "POST", "/auth/resend-verification/")
+    code = {"code": latest_code(email)}
+    call(driver, "verify", "POST", "/auth/verify-email-code/", code)
+    call(driver, "logout", "POST", "/auth/logout/")
+
+
+def seed_users(count, batch_size=1000):
+    from django.contrib.auth.hashers import make_password
+
+    from users.bulk import batched, import_batch
+
+    password = make_password(PASSWORD)
+    rows = (
+        {"email": f"seed{i}@example.com", "password": password, "email_verified": "1"}
+        for i in range(count)
+    )
+    for batch in batched(rows, batch_size):
+        import_batch(batch)
+
+
+def run_funnel(driver_class, base_url, iterations, concurrency, recorder):
+    from django.db import connections
+
+    def worker(indexes):
+        for index in indexes:
+            run_visitor(driver_class(base_url), recorder, index)
+        connections.close_all()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(
+            executor.map(
+                worker, [range(i, iterations, concurrency) for i in range(concurrency)]
+            )
+        )
+    return time.perf_counter() - start
+
+
+# ---------------------------
+#   Results
+# ---------------------------
+
+
+def build_results(args, recorder, elapsed, vendor, hasher):
+    import django
+
+    endpoints = {}
+    for step, samples in recorder.steps.items():
+        summary = summarize(samples["ms"])
+        queries = samples["queries"]
+        endpoints[step] = {
+            **summary,
+            "rps": 1000 / summary["mean"] if summary["mean"] else 0,
+            "errors": samples["errors"],
+            "queries_max": max(queries) if queries else None,
+            "queries_mean": sum(queries) / len(queries) if queries else None,
+        }
+        if samples["alloc_kb"]:
+            endpoints[step]["alloc_kb_p95"] = summarize(samples["alloc_kb"])["p95"]
+    requests_made = sum(len(samples["ms"]) for samples in recorder.steps.values())
+    # ru_maxrss is in KiB on Linux, bytes on macOS.
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_rss_mb = peak_rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+    return {
+        "meta": {
+            "driver": args.driver,
+            "users": args.users,
+            "iterations": args.iterations,
+            "concurrency": args.concurrency,
+            "database": vendor,
+            "hasher": hasher,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "funnel": {
+            "elapsed_s": elapsed,
+            "funnels_per_s": args.iterations / elapsed,
+            "requests_per_s": requests_made / elapsed,
+        },
+        "memory": {"peak_rss_mb": peak_rss_mb},
+        "endpoints": endpoints,
+    }
+
+
+def print_results(results):
+    for step, endpoint in results["endpoints"].items():
+        extra = f" {endpoint['rps']:.0f} req/s"
+        if endpoint["queries_max"] is not None:
+            extra += f" queries<={endpoint['queries_max']}"
+        if "alloc_kb_p95" in endpoint:
+            extra += f" alloc_p95={endpoint['alloc_kb_p95']:.0f}KiB"
+        if endpoint["errors"]:
+            extra += f" ERRORS={endpoint['errors']}"
+        print(format_summary(step, endpoint) + extra)
+    funnel = results["funnel"]
+    print(
+        f"{funnel['funnels_per_s']:.1f} funnels/s, "
+        f"{funnel['requests_per_s']:.0f} requests/s, "
+        f"peak RSS {results['memory']['peak_rss_mb']:.0f} MiB"
+    )
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of regressions of ``results`` against ``baseline``."""
+    regressions = []
+    for step, current in results["endpoints"].items():
+        if current["errors"]:
+            regressions.append(f"{step}: {current['errors']} errors")
+        previous = baseline["endpoints"].get(step)
+        if previous is None:
+            continue
+        if current["p95"] > previous["p95"] * (1 + tolerance):
+            regressions.append(
+                f"{step}: p95 {current['p95']:.2f}ms vs {previous['p95']:.2f}ms"
+            )
+        if (
+            current["queries_max"] is not None
+            and previous.get("queries_max") is not None
+            and current["queries_max"] > previous["queries_max"]
+        ):
+            regressions.append(
+                f"{step}: {current['queries_max']} queries vs {previous['queries_max']}"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=1000, help="accounts to seed")
+    parser.add_argument("--iterations", type=int, default=100, help="visitors")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--driver", choices=["client", "server"], default="client")
+    parser.add_argument("--real-hashing", action="store_true")
+    parser.add_argument("--trace-memory", action="store_true")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="allowed p95 growth (0.2 = 20%%)"
+    )
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    # Switches the mail backend to locmem (mail.outbox).
+    setup_test_environment()
+    settings.EMAIL_QUEUE_ENABLED = False
+    settings.RATELIMIT_ENABLED = False
+    settings.QUERY_BUDGET_RAISE = False
+    settings.SERVER_TIMING_HEADER = True
+    settings.ALLOWED_HOSTS = ["*"]
+    if not args.real_hashing:
+        settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+    if args.trace_memory:
+        tracemalloc.start()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # A file database, so the server threads share it.
+        with temporary_database(sqlite_path=Path(tmp) / "bench.sqlite3"):
+            from django.contrib.auth.hashers import get_hasher
+
+            seed_users(args.users)
+            hasher = get_hasher().algorithm
+            print(
+                f"--- {connection.vendor}, {args.driver} driver, {args.users} users, "
+                f"{args.iterations} visitors, concurrency {args.concurrency}, {hasher}"
+            )
+            recorder = Recorder(args.trace_memory)
+            if args.driver == "server":
+                server, base_url = start_server()
+                try:
+                    elapsed = run_funnel(
+                        ServerDriver,
+                        base_url,
+                        args.iterations,
+                        args.concurrency,
+                        recorder,
+                    )
+                finally:
+                    server.shutdown()
+                    server.server_close()
+            else:
+                elapsed = run_funnel(
+                    ClientDriver, None, args.iterations, args.concurrency, recorder
+                )
+            results = build_results(args, recorder, elapsed, connection.vendor, hasher)
+            connection.close()
+
+    print_results(results)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        for key in ("driver", "concurrency", "database", "hasher"):
+            if baseline["meta"].get(key) != results["meta"][key]:
+                print(
+                    f"Warning: baseline {key} is {baseline['meta'].get(key)!r}, "
+                    f"this run used {results['meta'][key]!r}."
+                )
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.baseline}.")
+
+
+if __name__ == "__main__":
+    main()
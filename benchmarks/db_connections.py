@@ -0,0 +1,122 @@
+"""
+Compare request throughput across database connection modes.
+
+Drives the WSGI handler directly (the same path a real server takes, so
+``close_old_connections`` runs on request start/finish) with several threads
+issuing authenticated dashboard requests, under each mode:
+
+    close       CONN_MAX_AGE=0, a new connection per request
+    persistent  CONN_MAX_AGE=60 without health checks
+    checked     CONN_MAX_AGE=60 with CONN_HEALTH_CHECKS
+    pool        Django's psycopg 3 pool (PostgreSQL with psycopg[pool] only)
+
+Runs against a throwaway copy of the configured database; SQLite uses a file
+so connections are really opened and closed.
+
+Usage:
+    python -m benchmarks.db_connections --requests 2000 --threads 8
+"""
+
+import argparse
+import importlib.util
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from benchmarks.harness import (create_user, format_summary, session_cookie,
+                                setup_django, summarize, temporary_database,
+                                wsgi_request)
+
+MODES = {
+    "close": {"CONN_MAX_AGE": 0, "CONN_HEALTH_CHECKS": False},
+    "persistent": {"CONN_MAX_AGE": 60, "CONN_HEALTH_CHECKS": False},
+    "checked": {"CONN_MAX_AGE": 60, "CONN_HEALTH_CHECKS": True},
+    "pool": {"CONN_MAX_AGE": 0, "CONN_HEALTH_CHECKS": False},
+}
+
+
+def pool_available(connection):
+    if connection.vendor != "postgresql":
+        return False
+    if importlib.util.find_spec("psycopg_pool") is None:
+        return False
+    from django.db.backends.postgresql.base import is_psycopg3
+
+    return is_psycopg3
+
+
+def run_mode(handler, path, cookie, requests, threads):
+    from django.db import connections
+
+    def worker(count):
+        samples = []
+        statuses = set()
+        for _ in range(count):
+            start = time.perf_counter()
+            statuses.add(
+                wsgi_request(handler, "GET", path, headers={"cookie": cookie})
+            )
+            samples.append((time.perf_counter() - start) * 1000)
+        connections.close_all()
+        return samples, statuses
+
+    per_thread = max(1, requests // threads)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(worker, [per_thread] * threads))
+    elapsed = time.perf_counter() - start
+
+    samples = [sample for thread_samples, _ in results for sample in thread_samples]
+    statuses = set().union(*(thread_statuses for _, thread_statuses in results))
+    return samples, statuses, len(samples) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--path", default="/dashboard/")
+    parser.add_argument("--modes", default=",".join(MODES))
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.db import connection, connections
+
+    handler = WSGIHandler()
+    db_settings = connections.settings["default"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with temporary_database(sqlite_path=Path(tmp) / "bench.sqlite3"):
+            cookie = session_cookie(create_user())
+            print(f"--- {connection.vendor}, {args.threads} threads, {args.path}")
+            for mode in args.modes.split(","):
+                if mode == "pool" and not pool_available(connection):
+                    print(f"{mode:<32} skipped (needs PostgreSQL and psycopg[pool])")
+                    continue
+                connections.close_all()
+                db_settings.update(MODES[mode])
+                if mode == "pool":
+                    db_settings["OPTIONS"]["pool"] = {
+                        "min_size": args.threads,
+                        "max_size": args.threads,
+                    }
+                try:
+                    samples, statuses, rps = run_mode(
+                        handler, args.path, cookie, args.requests, args.threads
+                    )
+                finally:
+                    if mode == "pool":
+                        connection.close_pool()
+                        del db_settings["OPTIONS"]["pool"]
+                print(
+                    f"{format_summary(mode, summarize(samples))} "
+                    f"{rps:.0f} req/s {sorted(statuses)}"
+                )
+            connections.close_all()
+
+
+if __name__ == "__main__":
+    main()
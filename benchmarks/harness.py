@@ -0,0 +1,178 @@
+"""
+Shared helpers for the benchmark scripts.
+"""
+
+import asyncio
+import contextlib
+import io
+import os
+import statistics
+import time
+
+
+def setup_django():
+    """Configure Django for a standalone benchmark script."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "hcot.settings")
+
+    import django
+
+    django.setup()
+
+
+@contextlib.contextmanager
+def temporary_database(sqlite_path=None):
+    """
+    Create a migrated throwaway database for the duration of the block.
+
+    SQLite test databases live in memory by default; pass ``sqlite_path`` to
+    use a file instead (needed when several connections or processes must
+    share the database).
+    """
+    from django.db import connection
+
+    old_name = connection.settings_dict["NAME"]
+    if sqlite_path and connection.vendor == "sqlite":
+        connection.settings_dict.setdefault("TEST", {})["NAME"] = str(sqlite_path)
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+def timed(fn, iterations):
+    """Call ``fn`` ``iterations`` times and return the per-call durations in ms."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def summarize(samples):
+    """Return p50/p95/p99/mean (ms) for a list of samples."""
+    ordered = sorted(samples)
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+    return {
+        "count": len(ordered),
+        "mean": statistics.fmean(ordered),
+        "p50": pct(0.50),
+        "p95": pct(0.95),
+        "p99": pct(0.99),
+    }
+
+
+def format_summary(label, summary):
+    return (
+        f"{label:<32} n={summary['count']:<6} "
+        f"p50={summary['p50']:.3f}ms p95={summary['p95']:.3f}ms "
+        f"p99={summary['p99']:.3f}ms"
+    )
+
+
+def create_user(email="bench@example.com", password="benchmark-password-1"):
+    from django.contrib.auth.models import User
+
+    return User.objects.create_user(email, email, password)
+
+
+def session_cookie(user):
+    """Create a logged-in session for ``user`` and return a Cookie header value."""
+    from importlib import import_module
+
+    from django.conf import settings
+    from django.contrib.auth import (BACKEND_SESSION_KEY, HASH_SESSION_KEY,
+                                     SESSION_KEY)
+
+    session = import_module(settings.SESSION_ENGINE).SessionStore()
+    session[SESSION_KEY] = str(user.pk)
+    session[BACKEND_SESSION_KEY] = "users.backends.EmailBackend"
+    session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+    session.save()
+    return f"{settings.SESSION_COOKIE_NAME}={session.session_key}"
+
+
+def wsgi_request(handler, method, path, body=b"", headers=None):
+    """
+    Send one request straight through a WSGI handler and return the status code.
+
+    Unlike the test Client this takes the same path as a real server, so
+    ``request_started``/``request_finished`` (and with them connection reuse
+    and CONN_MAX_AGE) behave as in production. ``headers`` maps lower-case
+    header names to values.
+    """
+    environ = {
+        "REQUEST_METHOD": method,
+        "PATH_INFO": path,
+        "QUERY_STRING": "",
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "80",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "REMOTE_ADDR": "127.0.0.1",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.url_scheme": "http",
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": io.StringIO(),
+    }
+    for name, value in {"host": "localhost", **(headers or {})}.items():
+        key = name.upper().replace("-", "_")
+        if key != "CONTENT_TYPE":
+            key = f"HTTP_{key}"
+        environ[key] = value
+
+    status = []
+    response = handler(environ, lambda s, headers, exc_info=None: status.append(s))
+    try:
+        b"".join(response)
+    finally:
+        # Fires request_finished, as a WSGI server would.
+        response.close()
+    return int(status[0].split()[0])
+
+
+async def asgi_request(application, method, path, body=b"", headers=None):
+    """ASGI counterpart of ``wsgi_request()``."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (name.encode(), value.encode())
+            for name, value in {"host": "localhost", **(headers or {})}.items()
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("localhost", 80),
+    }
+    done = asyncio.Event()
+    status = []
+    sent_body = False
+
+    async def receive():
+        nonlocal sent_body
+        if not sent_body:
+            sent_body = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # Django watches for a disconnect while the view runs; only report
+        # one once the response is complete.
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+        elif message["type"] == "http.response.body" and not message.get("more_body"):
+            done.set()
+
+    await application(scope, receive, send)
+    done.set()
+    return status[0]
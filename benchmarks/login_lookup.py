@@ -0,0 +1,87 @@
+"""
+Benchmark the email -> user lookup used by login and signup.
+
+Seeds the user table at increasing sizes and times EmailBackend.authenticate()
+against the legacy ``User.objects.get(email=...)`` lookup. With the LOWER(email)
+index the backend latency should stay flat as the table grows.
+
+Usage:
+    python -m benchmarks.login_lookup --sizes 1000,10000,100000
+"""
+
+import argparse
+import random
+
+from benchmarks.harness import (format_summary, setup_django, summarize,
+                                temporary_database, timed)
+
+PASSWORD = "benchmark-password-1"
+
+
+def seed_users(count, start, password_hash):
+    from django.contrib.auth.models import User
+
+    batch = []
+    for i in range(start, count):
+        email = f"user{i}@example.com"
+        batch.append(User(username=email, email=email, password=password_hash))
+        if len(batch) >= 5000:
+            User.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        User.objects.bulk_create(batch)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.contrib.auth.hashers import make_password
+    from django.contrib.auth.models import User
+
+    from users.backends import EmailBackend, users_by_email
+
+    # Isolate the lookup from password hashing cost.
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    password_hash = make_password(PASSWORD)
+    backend = EmailBackend()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    with temporary_database():
+        seeded = 0
+        for size in sizes:
+            seed_users(size, seeded, password_hash)
+            seeded = size
+
+            def emails():
+                return f"USER{random.randrange(size)}@Example.com"
+
+            indexed = summarize(
+                timed(
+                    lambda: backend.authenticate(
+                        None, email=emails(), password=PASSWORD
+                    ),
+                    args.iterations,
+                )
+            )
+            legacy = summarize(
+                timed(
+                    lambda: User.objects.filter(email__iexact=emails()).first(),
+                    args.iterations,
+                )
+            )
+            print(f"--- {size} users")
+            print(format_summary("EmailBackend.authenticate", indexed))
+            print(format_summary("email__iexact lookup (unindexed)", legacy))
+
+        print("--- query plan")
+        print(users_by_email("user1@example.com").explain())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Measure logins/sec per core with inline vs pooled password hashing.
+
+Seeds one user, then has ``--threads`` threads call EmailBackend.authenticate()
+in a loop for ``--duration`` seconds, first with hashing inline on the
+request threads (PASSWORD_HASHER_POOL_SIZE=0) and then in the process pool.
+A probe thread meanwhile times a small pure-Python task, standing in for
+the other requests sharing the worker; its p99 shows how much the hashing
+starves them. Logins rejected by pool backpressure are counted separately.
+
+Usage:
+    python -m benchmarks.password_hashing --threads 8 --duration 10
+"""
+
+import argparse
+import os
+import threading
+import time
+
+from benchmarks.harness import (create_user, format_summary, setup_django,
+                                summarize, temporary_database)
+
+PASSWORD = "benchmark-password-1"
+
+
+def probe(stop, samples):
+    while not stop.is_set():
+        start = time.perf_counter()
+        sum(i * i for i in range(20000))
+        samples.append((time.perf_counter() - start) * 1000)
+        time.sleep(0.01)
+
+
+def run(threads, duration):
+    from users.backends import EmailBackend
+    from users.hashers import PasswordHasherBusy
+
+    backend = EmailBackend()
+    stop = threading.Event()
+    counts = {"ok": 0, "busy": 0}
+    lock = threading.Lock()
+    probe_samples = []
+
+    def login_loop():
+        while not stop.is_set():
+            try:
+                user = backend.authenticate(
+                    None, email="bench@example.com", password=PASSWORD
+                )
+                result = "ok" if user is not None else "failed"
+            except PasswordHasherBusy:
+                result = "busy"
+                time.sleep(0.01)
+            with lock:
+                counts[result] = counts.get(result, 0) + 1
+
+    workers = [threading.Thread(target=login_loop) for _ in range(threads)]
+    workers.append(threading.Thread(target=probe, args=(stop, probe_samples)))
+    for worker in workers:
+        worker.start()
+    time.sleep(duration)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    return counts, probe_samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--pool-size", type=int, default=os.cpu_count())
+    parser.add_argument("--max-pending", type=int, default=0)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.contrib.auth.hashers import get_hasher
+
+    from users.hashers import shutdown_pool
+
+    settings.PASSWORD_HASHER_MAX_PENDING = args.max_pending
+    cores = os.cpu_count()
+
+    with temporary_database():
+        create_user("bench@example.com", PASSWORD)
+        hasher = get_hasher()
+        print(
+            f"--- {hasher.algorithm}, {args.threads} threads, {cores} cores, "
+            f"pool size {args.pool_size}"
+        )
+        for mode, pool_size in (("inline", 0), ("pooled", args.pool_size)):
+            settings.PASSWORD_HASHER_POOL_SIZE = pool_size
+            try:
+                counts, probe_samples = run(args.threads, args.duration)
+            finally:
+                shutdown_pool()
+            rate = counts["ok"] / args.duration
+            print(
+                f"{mode:<8} {rate:.1f} logins/s ({rate / cores:.1f} per core), "
+                f"{counts['busy']} rejected as busy"
+            )
+            print(format_summary(f"  probe latency ({mode})", summarize(probe_samples)))
+
+
+if __name__ == "__main__":
+    main()
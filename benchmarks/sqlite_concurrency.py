@@ -0,0 +1,117 @@
+"""
+Drive parallel signups and logins against SQLite and count lock errors.
+
+Forks several worker processes (like several gunicorn workers sharing one
+db.sqlite3) that each sign up, log out and log back in a series of users
+through the real views, once with stock SQLite settings and once with
+SQLITE_PRODUCTION_OPTIONS (WAL, tuned pragmas, busy timeout, IMMEDIATE
+transactions). Reports throughput, latency and "database is locked" errors.
+
+Usage:
+    python -m benchmarks.sqlite_concurrency --workers 8 --users 50
+"""
+
+import argparse
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.harness import (format_summary, setup_django, summarize,
+                                temporary_database)
+
+PASSWORD = "benchmark-password-1"
+
+
+def run_worker(prefix, users):
+    """Sign up, log out and log in ``users`` users; return (samples, errors)."""
+    from django.db import OperationalError, connections
+    from django.test import Client
+
+    samples = []
+    errors = 0
+    client = Client()
+    for i in range(users):
+        email = f"{prefix}-{i}@example.com"
+        steps = (
+            (
+                "/auth/signup/",
+                {"email": email, "password1": PASSWORD, "password2": PASSWORD},
+            ),
+            ("/auth/logout/", {}),
+            ("/auth/login/", {"email": email, "password": PASSWORD}),
+            ("/auth/logout/", {}),
+        )
+        for path, data in steps:
+            start = time.perf_counter()
+            try:
+                client.post(path, data)
+            except OperationalError as exc:
+                if "locked" not in str(exc):
+                    raise
+                errors += 1
+                continue
+            samples.append((time.perf_counter() - start) * 1000)
+    connections.close_all()
+    return samples, errors
+
+
+def run_mode(mode, options, workers, users):
+    from django.db import connection, connections
+
+    connection.settings_dict["OPTIONS"] = options
+    connections.settings["default"]["OPTIONS"] = options
+    # journal_mode is stored in the database file, so reset it between modes.
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA journal_mode=DELETE")
+    connections.close_all()
+
+    context = multiprocessing.get_context("fork")
+    start = time.perf_counter()
+    with context.Pool(workers) as pool:
+        results = pool.starmap(
+            run_worker, [(f"{mode}{w}", users) for w in range(workers)]
+        )
+    elapsed = time.perf_counter() - start
+
+    samples = [sample for worker_samples, _ in results for sample in worker_samples]
+    errors = sum(worker_errors for _, worker_errors in results)
+    return samples, errors, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--users", type=int, default=50, help="users per worker")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    if connection.vendor != "sqlite":
+        raise SystemExit("This benchmark needs DATABASE_ENGINE=sqlite3.")
+
+    setup_test_environment()
+    # Measure the database, not password hashing or the rate limiter.
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    settings.RATELIMIT_ENABLED = False
+
+    modes = {"stock": {}, "production": settings.SQLITE_PRODUCTION_OPTIONS}
+    with tempfile.TemporaryDirectory() as tmp:
+        with temporary_database(sqlite_path=Path(tmp) / "bench.sqlite3"):
+            print(f"--- {args.workers} workers x {args.users} users")
+            for mode, options in modes.items():
+                samples, errors, elapsed = run_mode(
+                    mode, options, args.workers, args.users
+                )
+                print(
+                    f"{format_summary(mode, summarize(samples))} "
+                    f"{len(samples) / elapsed:.0f} req/s, {errors} lock errors"
+                )
+
+
+if __name__ == "__main__":
+    main()
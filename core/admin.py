@@ -1,3 +1,89 @@
 from django.contrib import admin
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ORDER_VAR, ChangeList
+from django.utils import timezone
 
-# Register your models here.
+from .models import OutboundEmail
+from .pagination import EstimatedCountPaginator, keyset_page
+
+# Query parameter holding the keyset cursor (the last pk of the previous page)
+CURSOR_VAR = "after"
+
+
+class KeysetChangeList(ChangeList):
+    """
+    Changelist paged by primary key cursor instead of page number.
+
+    While the list is in its default newest-first order, "Next" links carry
+    ``?after=<last pk>`` and each page is an index range scan. Sorting by a
+    column falls back to numbered pages.
+    """
+
+    def __init__(self, request, *args, **kwargs):
+        self.cursor = request.GET.get(CURSOR_VAR)
+        if self.cursor is not None:
+            # The admin treats unknown query parameters as field lookups.
+            request.GET = request.GET.copy()
+            del request.GET[CURSOR_VAR]
+        super().__init__(request, *args, **kwargs)
+
+    def get_results(self, request):
+        self.keyset = ORDER_VAR not in self.params and not self.show_all
+        if not self.keyset:
+            return super().get_results(request)
+        try:
+            cursor = int(self.cursor) if self.cursor is not None else None
+        except ValueError:
+            raise IncorrectLookupParameters
+        paginator = self.model_admin.get_paginator(
+            request, self.queryset, self.list_per_page
+        )
+        self.result_list, next_cursor = keyset_page(
+            self.queryset, self.list_per_page, after=cursor
+        )
+        self.result_count = paginator.count
+        self.full_result_count = None
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.can_show_all = False
+        self.multi_page = cursor is not None or next_cursor is not None
+        self.paginator = paginator
+        self.first_page_url = self.get_query_string() if cursor is not None else None
+        self.next_page_url = (
+            self.get_query_string({CURSOR_VAR: next_cursor})
+            if next_cursor is not None
+            else None
+        )
+
+
+class ScalableAdminMixin:
+    """
+    ModelAdmin defaults for tables with millions of rows.
+
+    No ``COUNT(*)`` over the whole table (estimated and capped counts, no
+    facet counts) and keyset pagination, newest first. Put it before the
+    ModelAdmin class in the bases.
+    """
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    show_facets = admin.ShowFacets.NEVER
+    ordering = ("-pk",)
+    change_list_template = "admin/keyset_change_list.html"
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(ScalableAdminMixin, admin.ModelAdmin):
+    list_display = ["subject", "status", "attempts", "next_attempt_at", "created_at"]
+    list_filter = ["status"]
+    readonly_fields = ["created_at", "sent_at", "last_error"]
+    actions = ["requeue"]
+
+    @admin.action(description="Requeue selected messages")
+    def requeue(self, request, queryset):
+        queryset.exclude(status=OutboundEmail.Status.SENT).update(
+            status=OutboundEmail.Status.QUEUED, next_attempt_at=timezone.now()
+        )
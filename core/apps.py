@@ -1,6 +1,23 @@
+import logging
+
 from django.apps import AppConfig
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
 
 
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "core"
+
+    def ready(self):
+        if settings.TEMPLATE_WARMUP:
+            self.warm_templates()
+
+    def warm_templates(self):
+        from .template_cache import warm_templates
+
+        loaded, failures, seconds = warm_templates()
+        for name, error in failures.items():
+            logger.warning("Template warm-up failed for %s: %s", name, error)
+        logger.info("Warmed %d templates in %.0f ms", loaded, seconds * 1000)
@@ -0,0 +1,41 @@
+import time
+
+from django.db import router
+
+
+def delete_in_batches(queryset, batch_size=1000, pause=0, raw=False, on_batch=None):
+    """
+    Delete the rows matched by ``queryset`` in primary-key chunks.
+
+    Each chunk is a short ``DELETE ... WHERE pk IN (...)`` so locks are held
+    briefly and the transaction log stays small, unlike one giant DELETE.
+    ``pause`` sleeps between chunks to leave room for other writers.
+
+    With ``raw=True`` the chunks skip Django's deletion collector: no objects
+    are loaded, no signals are sent and nothing is cascaded, so the caller
+    must delete dependent rows first. ``on_batch(count)`` is called after
+    each chunk.
+
+    Returns the number of rows deleted.
+    """
+    model = queryset.model
+    pks_query = queryset.order_by().values_list("pk", flat=True)
+    using = router.db_for_write(model)
+    total = 0
+    while True:
+        pks = list(pks_query[:batch_size])
+        if not pks:
+            break
+        chunk = model._base_manager.using(using).filter(pk__in=pks)
+        if raw:
+            deleted = chunk._raw_delete(using)
+        else:
+            deleted, _ = chunk.delete()
+        total += deleted
+        if on_batch:
+            on_batch(deleted)
+        if len(pks) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+    return total
@@ -0,0 +1,186 @@
+"""
+Two-tier cache backend.
+
+``TieredCache`` fronts a shared cache alias (Redis, database, file, ...) with
+an optional in-process L1 that evicts by TTL and LRU. Values are pickled in
+the L1 so callers can't mutate cached objects in place, mirroring
+LocMemCache.
+
+L1 entries are never invalidated across processes, so keep ``L1_TIMEOUT``
+short. Atomic operations (add/incr/decr) always go to the shared tier.
+
+Every lookup is counted in ``core.metrics`` as
+``cache_requests_total{cache, tier, result}``.
+"""
+
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.utils.functional import cached_property
+
+from . import metrics
+
+_MISSING = object()
+
+
+class TieredCache(BaseCache):
+    """
+    Cache backend with an in-process L1 in front of a shared cache.
+
+    ``LOCATION`` is the alias of the shared cache. ``OPTIONS``:
+
+    - ``L1_MAX_ENTRIES``: size of the in-process tier; 0 disables it.
+    - ``L1_TIMEOUT``: upper bound in seconds for how long an entry stays in L1.
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self._shared_alias = location
+        self._l1_max_entries = int(options.get("L1_MAX_ENTRIES", 0))
+        self._l1_timeout = float(options.get("L1_TIMEOUT", 5))
+        self._l1 = OrderedDict()
+        self._l1_lock = threading.Lock()
+
+    @cached_property
+    def shared(self):
+        return caches[self._shared_alias]
+
+    # ---------------------------
+    #   L1 tier
+    # ---------------------------
+
+    def _l1_key(self, key, version):
+        return self.shared.make_and_validate_key(key, version=version)
+
+    def _l1_get(self, l1_key):
+        with self._l1_lock:
+            entry = self._l1.get(l1_key)
+            if entry is None:
+                return _MISSING
+            expires, pickled = entry
+            if expires <= time.monotonic():
+                del self._l1[l1_key]
+                return _MISSING
+            self._l1.move_to_end(l1_key)
+        return pickle.loads(pickled)
+
+    def _l1_set(self, l1_key, value, timeout=DEFAULT_TIMEOUT):
+        if not self._l1_max_entries:
+            return
+        ttl = self._l1_timeout
+        if timeout is not DEFAULT_TIMEOUT and timeout is not None:
+            ttl = min(ttl, timeout)
+        if ttl <= 0:
+            self._l1_delete(l1_key)
+            return
+        pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._l1_lock:
+            self._l1[l1_key] = (time.monotonic() + ttl, pickled)
+            self._l1.move_to_end(l1_key)
+            while len(self._l1) > self._l1_max_entries:
+                self._l1.popitem(last=False)
+
+    def _l1_delete(self, l1_key):
+        if self._l1_max_entries:
+            with self._l1_lock:
+                self._l1.pop(l1_key, None)
+
+    def _record(self, tier, hit):
+        metrics.inc(
+            "cache_requests_total",
+            cache=self._shared_alias,
+            tier=tier,
+            result="hit" if hit else "miss",
+        )
+
+    # ---------------------------
+    #   Cache API
+    # ---------------------------
+
+    def get(self, key, default=None, version=None):
+        l1_key = self._l1_key(key, version)
+        if self._l1_max_entries:
+            value = self._l1_get(l1_key)
+            self._record("l1", value is not _MISSING)
+            if value is not _MISSING:
+                return value
+        value = self.shared.get(key, _MISSING, version=version)
+        self._record("shared", value is not _MISSING)
+        if value is _MISSING:
+            return default
+        self._l1_set(l1_key, value)
+        return value
+
+    def get_many(self, keys, version=None):
+        found = {}
+        remaining = []
+        for key in keys:
+            if self._l1_max_entries:
+                value = self._l1_get(self._l1_key(key, version))
+                self._record("l1", value is not _MISSING)
+                if value is not _MISSING:
+                    found[key] = value
+                    continue
+            remaining.append(key)
+        if remaining:
+            shared = self.shared.get_many(remaining, version=version)
+            for key in remaining:
+                self._record("shared", key in shared)
+            for key, value in shared.items():
+                self._l1_set(self._l1_key(key, version), value)
+            found.update(shared)
+        return found
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set(key, value, timeout=timeout, version=version)
+        self._l1_set(self._l1_key(key, version), value, timeout)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.shared.set_many(data, timeout=timeout, version=version)
+        for key, value in data.items():
+            if key not in failed:
+                self._l1_set(self._l1_key(key, version), value, timeout)
+        return failed
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self._l1_delete(self._l1_key(key, version))
+        return self.shared.add(key, value, timeout=timeout, version=version)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.shared.touch(key, timeout=timeout, version=version)
+
+    def delete(self, key, version=None):
+        self._l1_delete(self._l1_key(key, version))
+        return self.shared.delete(key, version=version)
+
+    def delete_many(self, keys, version=None):
+        for key in keys:
+            self._l1_delete(self._l1_key(key, version))
+        self.shared.delete_many(keys, version=version)
+
+    def has_key(self, key, version=None):
+        if self._l1_max_entries:
+            if self._l1_get(self._l1_key(key, version)) is not _MISSING:
+                return True
+        return self.shared.has_key(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        self._l1_delete(self._l1_key(key, version))
+        return self.shared.incr(key, delta, version=version)
+
+    def decr(self, key, delta=1, version=None):
+        self._l1_delete(self._l1_key(key, version))
+        return self.shared.decr(key, delta, version=version)
+
+    def clear(self):
+        with self._l1_lock:
+            self._l1.clear()
+        self.shared.clear()
+
+    def close(self, **kwargs):
+        self.shared.close(**kwargs)
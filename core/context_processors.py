@@ -6,5 +6,6 @@ from django.contrib.auth.models import User
 def global_context(request):
     return {
         "project_name": getattr(settings, "PROJECT_NAME", "hcot"),
+        "social_providers": settings.SOCIAL_PROVIDERS,
         # add more as needed
     }
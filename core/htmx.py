@@ -0,0 +1,106 @@
+"""
+Fragment rendering for HTMX requests.
+
+Pages extend ``theme/base.html``, so a full render carries the whole layout.
+For requests made by HTMX only the swapped element needs to come back:
+``HtmxFragmentMixin`` maps the request's ``HX-Target`` to a ``{% block %}``
+of the view's template and renders just that block. Messages added during
+the request travel in an ``HX-Trigger`` header instead of the page, and
+``theme/base.html`` shows them as toasts.
+"""
+
+import json
+
+from django.contrib import messages
+from django.http import HttpResponse, HttpResponseRedirect
+from django.template.context import make_context
+from django.template.loader import get_template
+from django.template.loader_tags import BlockNode
+from django.utils.cache import patch_vary_headers
+
+
+def is_htmx(request):
+    """True for requests sent by HTMX, except history-restore requests."""
+    return (
+        request.headers.get("HX-Request") == "true"
+        and request.headers.get("HX-History-Restore-Request") != "true"
+    )
+
+
+def render_block_to_string(template_name, block_name, context=None, request=None):
+    """
+    Render a single ``{% block %}`` of a template, with its context processors.
+
+    The block is rendered as written in ``template_name`` itself (not as
+    overridden by templates extending it). Raises ValueError if the block
+    doesn't exist.
+    """
+    template = get_template(template_name).template
+    for node in template.nodelist.get_nodes_by_type(BlockNode):
+        if node.name == block_name:
+            break
+    else:
+        raise ValueError(f"Block {block_name!r} not found in {template_name!r}.")
+
+    context = make_context(context, request, autoescape=template.engine.autoescape)
+    with context.render_context.push_state(template):
+        with context.bind_template(template):
+            return node.render(context)
+
+
+def add_messages_trigger(request, response):
+    """Move pending messages into the ``messages`` event of ``HX-Trigger``."""
+    pending = [
+        {"message": str(message), "tags": message.tags}
+        for message in messages.get_messages(request)
+    ]
+    if not pending:
+        return response
+    trigger = response.headers.get("HX-Trigger")
+    try:
+        events = json.loads(trigger) if trigger else {}
+    except ValueError:
+        # A bare event name.
+        events = {trigger: None}
+    events["messages"] = pending
+    response["HX-Trigger"] = json.dumps(events)
+    return response
+
+
+class HtmxFragmentMixin:
+    """
+    Render only a block of the template for HTMX requests.
+
+    ``htmx_blocks`` maps the id of the element HTMX is swapping (the
+    ``HX-Target`` header) to the block that renders it. Other requests get
+    the full page. A redirect after a successful form submission is replaced
+    by the re-rendered fragment, since the swap target is still on the page.
+    """
+
+    htmx_blocks = {}
+
+    def get_htmx_block(self):
+        if not is_htmx(self.request):
+            return None
+        return self.htmx_blocks.get(self.request.headers.get("HX-Target"))
+
+    def render_to_response(self, context, **response_kwargs):
+        block = self.get_htmx_block()
+        if block is None:
+            response = super().render_to_response(context, **response_kwargs)
+        else:
+            response = HttpResponse(
+                render_block_to_string(
+                    self.get_template_names()[0], block, context, self.request
+                ),
+                status=response_kwargs.get("status", 200),
+            )
+            add_messages_trigger(self.request, response)
+        patch_vary_headers(response, ["HX-Request", "HX-Target"])
+        return response
+
+    def form_valid(self, form):
+        response = super().form_valid(form)
+        if self.get_htmx_block() and isinstance(response, HttpResponseRedirect):
+            return self.render_to_response(self.get_context_data())
+        return response
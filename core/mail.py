@@ -0,0 +1,213 @@
+"""
+Outbound email queue.
+
+``QueuedEmailBackend`` is installed as ``EMAIL_BACKEND`` when
+``EMAIL_QUEUE_ENABLED`` is on. Every ``send_mail()`` call -- ours and
+allauth's password-reset/confirmation emails alike -- then only inserts an
+``OutboundEmail`` row and returns. The ``run_mail_worker`` command drains the
+queue in batches over a single connection to ``EMAIL_DELIVERY_BACKEND``,
+retrying failures with exponential backoff. Delivered messages keep only
+their envelope; ``purge_outbound_email`` deletes old sent and failed rows.
+
+Async views use ``asend_mail()``, which enqueues through the async ORM.
+"""
+
+import logging
+import random
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+# How long a claimed message is hidden from other workers. If a worker dies
+# mid-batch the message becomes due again once the lease runs out.
+CLAIM_LEASE = timedelta(minutes=5)
+
+
+class QueuedEmailBackend(BaseEmailBackend):
+    """Email backend that writes messages to the outbox instead of sending them."""
+
+    def _partition(self, email_messages):
+        queued = []
+        direct = []
+        for message in email_messages:
+            if not message.recipients():
+                continue
+            # Attachments are not serialized into the outbox; send those inline.
+            if message.attachments:
+                direct.append(message)
+            else:
+                queued.append(OutboundEmail.from_message(message))
+        return queued, direct
+
+    def _send_direct(self, messages):
+        connection = get_connection(
+            settings.EMAIL_DELIVERY_BACKEND, fail_silently=self.fail_silently
+        )
+        return connection.send_messages(messages) or 0
+
+    def send_messages(self, email_messages):
+        queued, direct = self._partition(email_messages)
+        try:
+            OutboundEmail.objects.bulk_create(queued)
+        except Exception:
+            if not self.fail_silently:
+                raise
+            return 0
+
+        sent = len(queued)
+        if direct:
+            sent += self._send_direct(direct)
+        return sent
+
+    async def asend_messages(self, email_messages):
+        """Async counterpart of ``send_messages()`` used by ``asend_mail()``."""
+        queued, direct = self._partition(email_messages)
+        try:
+            await OutboundEmail.objects.abulk_create(queued)
+        except Exception:
+            if not self.fail_silently:
+                raise
+            return 0
+
+        sent = len(queued)
+        if direct:
+            sent += await sync_to_async(self._send_direct, thread_sensitive=False)(
+                direct
+            )
+        return sent
+
+
+async def asend_mail(
+    subject,
+    message,
+    from_email,
+    recipient_list,
+    fail_silently=False,
+    html_message=None,
+):
+    """
+    Async version of ``django.core.mail.send_mail()`` for async views.
+
+    With the outbox enabled this is a single async insert. Other backends have
+    no async API, so the (possibly slow) SMTP exchange runs in a worker
+    thread outside the thread that serves sync ORM calls.
+    """
+    connection = get_connection(fail_silently=fail_silently)
+    mail = EmailMultiAlternatives(
+        subject, message, from_email, recipient_list, connection=connection
+    )
+    if html_message:
+        mail.attach_alternative(html_message, "text/html")
+
+    if hasattr(connection, "asend_messages"):
+        return await connection.asend_messages([mail])
+    return await sync_to_async(connection.send_messages, thread_sensitive=False)(
+        [mail]
+    )
+
+
+def retry_delay(attempts):
+    """Exponential backoff with jitter for the given attempt number."""
+    base = settings.EMAIL_QUEUE_RETRY_BACKOFF * 2 ** max(attempts - 1, 0)
+    delay = min(base, settings.EMAIL_QUEUE_RETRY_BACKOFF_MAX)
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+def claim_batch(batch_size):
+    """
+    Claim up to ``batch_size`` due messages for this worker.
+
+    Claimed rows get their attempt counter bumped and are leased for
+    ``CLAIM_LEASE`` so concurrent workers skip them.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        ids = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True)
+            .filter(status=OutboundEmail.Status.QUEUED, next_attempt_at__lte=now)
+            .order_by("next_attempt_at")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not ids:
+            return []
+        OutboundEmail.objects.filter(pk__in=ids).update(
+            attempts=F("attempts") + 1, next_attempt_at=now + CLAIM_LEASE
+        )
+    return list(OutboundEmail.objects.filter(pk__in=ids).order_by("pk"))
+
+
+def _mark_failed(outbound, error):
+    if outbound.attempts >= settings.EMAIL_QUEUE_MAX_ATTEMPTS:
+        status = OutboundEmail.Status.FAILED
+        next_attempt_at = outbound.next_attempt_at
+    else:
+        status = OutboundEmail.Status.QUEUED
+        next_attempt_at = timezone.now() + retry_delay(outbound.attempts)
+    OutboundEmail.objects.filter(pk=outbound.pk).update(
+        status=status, next_attempt_at=next_attempt_at, last_error=str(error)[:2000]
+    )
+    logger.warning(
+        "Delivery of outbound email %s failed (attempt %s): %s",
+        outbound.pk,
+        outbound.attempts,
+        error,
+    )
+
+
+def deliver_batch(batch_size=None):
+    """
+    Deliver one batch of queued messages.
+
+    Returns a ``(sent, failed)`` tuple. All messages in the batch share one
+    connection to the delivery backend.
+    """
+    batch = claim_batch(batch_size or settings.EMAIL_QUEUE_BATCH_SIZE)
+    if not batch:
+        return 0, 0
+
+    connection = get_connection(settings.EMAIL_DELIVERY_BACKEND, fail_silently=False)
+    sent_ids = []
+    failed = 0
+    try:
+        connection.open()
+    except Exception as e:
+        for outbound in batch:
+            _mark_failed(outbound, e)
+        return 0, len(batch)
+
+    try:
+        for outbound in batch:
+            try:
+                connection.send_messages([outbound.to_message(connection)])
+            except Exception as e:
+                failed += 1
+                _mark_failed(outbound, e)
+            else:
+                sent_ids.append(outbound.pk)
+    finally:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    if sent_ids:
+        # Bodies hold verification codes and password reset links; don't
+        # keep them once they're delivered.
+        OutboundEmail.objects.filter(pk__in=sent_ids).update(
+            status=OutboundEmail.Status.SENT,
+            sent_at=timezone.now(),
+            last_error="",
+            body="",
+            alternatives=[],
+        )
+    return len(sent_ids), failed
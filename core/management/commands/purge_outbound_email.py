@@ -0,0 +1,51 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.batching import delete_in_batches
+from core.models import OutboundEmail
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete sent and failed outbound emails older than the retention "
+        "period in chunks. Run it from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.EMAIL_QUEUE_RETENTION_DAYS,
+            help="Keep messages younger than this (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Messages deleted per statement (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0,
+            help="Seconds to sleep between batches (default: %(default)s).",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        # next_attempt_at is the time of the last attempt (plus the claim
+        # lease), so this is a range scan of core_outbox_due_idx per status.
+        done = OutboundEmail.objects.filter(
+            status__in=[OutboundEmail.Status.SENT, OutboundEmail.Status.FAILED],
+            next_attempt_at__lt=cutoff,
+        )
+        deleted = delete_in_batches(
+            done,
+            batch_size=options["batch_size"],
+            pause=options["pause"],
+            raw=True,
+        )
+        self.stdout.write(f"Deleted {deleted} outbound emails.")
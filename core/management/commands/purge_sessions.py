@@ -0,0 +1,44 @@
+from importlib import import_module
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.batching import delete_in_batches
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired database sessions in chunks. Unlike clearsessions, this "
+        "never issues one giant DELETE."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Sessions deleted per statement (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0,
+            help="Seconds to sleep between chunks (default: %(default)s).",
+        )
+
+    def handle(self, *args, **options):
+        engine = import_module(settings.SESSION_ENGINE)
+        if not hasattr(engine.SessionStore, "get_model_class"):
+            self.stdout.write(
+                f"{settings.SESSION_ENGINE} does not store sessions in the "
+                "database; nothing to purge."
+            )
+            return
+
+        model = engine.SessionStore.get_model_class()
+        expired = model.objects.filter(expire_date__lt=timezone.now())
+        deleted = delete_in_batches(
+            expired, batch_size=options["batch_size"], pause=options["pause"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired sessions."))
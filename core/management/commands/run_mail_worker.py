@@ -0,0 +1,47 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.mail import deliver_batch
+
+
+class Command(BaseCommand):
+    help = "Deliver queued outbound emails in batches over a pooled connection."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.EMAIL_QUEUE_BATCH_SIZE,
+            help="Messages delivered per connection (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.EMAIL_QUEUE_POLL_INTERVAL,
+            help="Seconds to sleep when the queue is empty (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the currently due messages and exit.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        self.stdout.write(f"Mail worker started (batch size {batch_size}).")
+        try:
+            while True:
+                close_old_connections()
+                sent, failed = deliver_batch(batch_size)
+                if sent or failed:
+                    self.stdout.write(f"Delivered {sent}, failed {failed}.")
+                if sent + failed < batch_size:
+                    if options["once"]:
+                        break
+                    time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write("Mail worker stopped.")
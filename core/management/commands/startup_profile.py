@@ -0,0 +1,163 @@
+import json
+import re
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Runs in a fresh interpreter under -X importtime: boot Django and build the
+# URL resolver the way a worker does before its first request.
+CHILD = """
+import json, os, resource, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+setup_done = time.perf_counter()
+from django.urls import get_resolver
+get_resolver().url_patterns
+urls_done = time.perf_counter()
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == "darwin":
+    rss //= 1024
+print(json.dumps({
+    "setup_ms": (setup_done - start) * 1000,
+    "urls_ms": (urls_done - setup_done) * 1000,
+    "rss_kb": rss,
+}))
+"""
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def parse_importtime(stderr):
+    """Return ``(module, self_us, cumulative_us, depth)`` per imported module."""
+    modules = []
+    for line in stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return modules
+
+
+def owner(module, apps):
+    """Return the installed app (longest prefix) or top-level package of a module."""
+    for app in apps:
+        if module == app or module.startswith(app + "."):
+            return app
+    return module.split(".")[0]
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure worker boot: time django.setup() and URL loading in a fresh "
+        "interpreter and report import time per installed app and package."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--runs",
+            type=int,
+            default=3,
+            help="Fresh interpreters to start; medians are reported "
+            "(default: %(default)s).",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="Apps/packages and modules to list (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--tree",
+            action="store_true",
+            help="Also print the import tree of the last run.",
+        )
+        parser.add_argument(
+            "--min-ms",
+            type=float,
+            default=1.0,
+            help="Hide tree entries with a smaller cumulative time "
+            "(default: %(default)s).",
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Print the report as JSON.",
+        )
+
+    def profile_once(self):
+        # The child inherits DJANGO_SETTINGS_MODULE and the .env overrides.
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", CHILD],
+            capture_output=True,
+            text=True,
+            cwd=settings.BASE_DIR,
+        )
+        if result.returncode:
+            raise CommandError(f"Django failed to start:\n{result.stderr[-2000:]}")
+        timings = json.loads(result.stdout.strip().splitlines()[-1])
+        return timings, parse_importtime(result.stderr)
+
+    def handle(self, *args, **options):
+        runs = [self.profile_once() for _ in range(max(options["runs"], 1))]
+        # Longest names first, so "allauth.account" wins over "allauth".
+        apps = sorted(settings.INSTALLED_APPS, key=len, reverse=True)
+
+        by_app = {}
+        by_module = {}
+        for _, modules in runs:
+            totals = {}
+            for name, self_us, cumulative_us, _ in modules:
+                totals[owner(name, apps)] = totals.get(owner(name, apps), 0) + self_us
+                by_module.setdefault(name, []).append(cumulative_us)
+            for name, self_us in totals.items():
+                by_app.setdefault(name, []).append(self_us)
+
+        def slowest(times):
+            # Modules missing from a run count as 0 in that run.
+            medians = {
+                name: statistics.median(values + [0] * (len(runs) - len(values))) / 1000
+                for name, values in times.items()
+            }
+            ranked = sorted(medians.items(), key=lambda item: item[1], reverse=True)
+            return ranked[: options["limit"]]
+
+        report = {
+            "runs": len(runs),
+            "installed_apps": list(settings.INSTALLED_APPS),
+            "modules_imported": len(runs[-1][1]),
+            **{
+                key: statistics.median(timings[key] for timings, _ in runs)
+                for key in ("setup_ms", "urls_ms", "rss_kb")
+            },
+            "by_app": slowest(by_app),
+            "slowest_modules": slowest(by_module),
+        }
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write(
+            f"Boot (median of {report['runs']}): django.setup() "
+            f"{report['setup_ms']:.0f} ms, URLconf {report['urls_ms']:.0f} ms, "
+            f"max RSS {report['rss_kb'] / 1024:.1f} MiB, "
+            f"{report['modules_imported']} modules imported."
+        )
+        self.stdout.write("\nImport time by app/package (self time):")
+        for name, ms in report["by_app"]:
+            self.stdout.write(f"  {ms:8.1f} ms  {name}")
+        self.stdout.write("\nSlowest modules (cumulative):")
+        for name, ms in report["slowest_modules"]:
+            self.stdout.write(f"  {ms:8.1f} ms  {name}")
+
+        if options["tree"]:
+            self.stdout.write("\nImport tree (last run, cumulative):")
+            # importtime logs children before their parent; reverse for a
+            # top-down view.
+            for name, _, cumulative_us, depth in reversed(runs[-1][1]):
+                if cumulative_us / 1000 >= options["min_ms"]:
+                    ms = cumulative_us / 1000
+                    self.stdout.write(f"  {ms:8.1f} ms  {'  ' * depth}{name}")
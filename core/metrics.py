@@ -0,0 +1,112 @@
+"""
+In-process metrics registry.
+
+Counters and histograms live in the memory of each worker process and are
+exposed in the Prometheus text format by ``core.views.MetricsView``. Scrape
+every worker (or aggregate upstream) to get totals across processes.
+"""
+
+import bisect
+import math
+import threading
+from collections import defaultdict
+
+_lock = threading.Lock()
+_counters = defaultdict(int)
+_histograms = {}
+
+# Default histogram buckets, suited to durations in milliseconds.
+DURATION_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def _key(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+
+def inc(name, value=1, **labels):
+    """Increment the counter ``name`` with the given labels."""
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] += value
+
+
+def get(name, **labels):
+    """Return the current value of a counter (0 if never incremented)."""
+    with _lock:
+        return _counters.get(_key(name, labels), 0)
+
+
+def observe(name, value, buckets=DURATION_BUCKETS, **labels):
+    """Record ``value`` in the histogram ``name`` with the given labels."""
+    key = _key(name, labels)
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = _histograms[key] = {
+                "buckets": tuple(buckets),
+                "counts": [0] * (len(buckets) + 1),
+                "sum": 0.0,
+                "count": 0,
+            }
+        histogram["counts"][bisect.bisect_left(histogram["buckets"], value)] += 1
+        histogram["sum"] += value
+        histogram["count"] += 1
+
+
+def histograms(name):
+    """Return ``{labels: {"count", "sum", "buckets"}}`` for one histogram name."""
+    with _lock:
+        return {
+            labels: {
+                "count": data["count"],
+                "sum": data["sum"],
+                "buckets": dict(zip(data["buckets"] + (math.inf,), data["counts"])),
+            }
+            for (hist_name, labels), data in _histograms.items()
+            if hist_name == name
+        }
+
+
+def reset():
+    """Clear all metrics (for tests and benchmarks)."""
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    inner = ",".join(f'{name}="{value}"' for name, value in labels)
+    return "{" + inner + "}"
+
+
+def render_text():
+    """Render every metric in the Prometheus text exposition format."""
+    with _lock:
+        counters = sorted(_counters.items())
+        hists = sorted(
+            (key, dict(data, counts=list(data["counts"])))
+            for key, data in _histograms.items()
+        )
+    lines = []
+    current = None
+    for (name, labels), value in counters:
+        if name != current:
+            lines.append(f"# TYPE {name} counter")
+            current = name
+        lines.append(f"{name}{_format_labels(labels)} {value}")
+
+    current = None
+    for (name, labels), data in hists:
+        if name != current:
+            lines.append(f"# TYPE {name} histogram")
+            current = name
+        cumulative = 0
+        for bound, count in zip(data["buckets"] + ("+Inf",), data["counts"]):
+            cumulative += count
+            bucket_labels = labels + (("le", bound),)
+            lines.append(f"{name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {data['sum']}")
+        lines.append(f"{name}_count{_format_labels(labels)} {data['count']}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,154 @@
+import logging
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import (iscoroutinefunction, markcoroutinefunction,
+                          sync_to_async)
+from django.conf import settings
+from django.db import connections
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+# Not counted as queries: tests run every atomic block as a savepoint, and
+# budgets must hold in tests and production alike.
+TRANSACTION_CONTROL = ("BEGIN", "SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO")
+
+
+class QueryBudgetExceeded(Exception):
+    """A view ran more SQL queries than its declared ``query_budget``."""
+
+
+def query_budget(limit):
+    """
+    Declare the maximum number of SQL queries a function view may run.
+
+    Class-based views set a ``query_budget`` class attribute instead.
+    """
+
+    def decorator(view_func):
+        view_func.query_budget = limit
+        return view_func
+
+    return decorator
+
+
+class RequestStats:
+    """Per-request counters filled in by RequestMetricsMiddleware."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_ms = 0.0
+        self.template_ms = 0.0
+        self.query_budget = None
+
+    def __call__(self, execute, sql, params, many, context):
+        # Installed as a database execute_wrapper for the whole request.
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            if not sql.lstrip().upper().startswith(TRANSACTION_CONTROL):
+                self.queries += 1
+            self.db_ms += (time.perf_counter() - start) * 1000
+
+
+class RequestMetricsMiddleware:
+    """
+    Record query count, DB time, template render time and wall time per request.
+
+    Timings are sent back in a ``Server-Timing`` header and aggregated into
+    per-view histograms served at /metrics/. Views may declare a
+    ``query_budget``; exceeding it raises QueryBudgetExceeded when
+    QUERY_BUDGET_RAISE is on (tests) and logs a warning otherwise.
+
+    Template time covers TemplateResponse rendering. Keep this middleware
+    first in MIDDLEWARE so it renders after every other middleware has run.
+    It is async-capable, so it does not force async views under ASGI back
+    through a thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        stats = request.request_stats = RequestStats()
+        start = time.perf_counter()
+        with self.wrap_connections(stats):
+            response = self.get_response(request)
+        return self.finish(request, response, stats, start)
+
+    async def __acall__(self, request):
+        stats = request.request_stats = RequestStats()
+        start = time.perf_counter()
+        # Connections are per thread and the async ORM runs queries in the
+        # request's sync thread, so install the wrappers there.
+        stack = await sync_to_async(self.wrap_connections)(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self.finish(request, response, stats, start)
+
+    def wrap_connections(self, stats):
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(stats))
+        return stack
+
+    def finish(self, request, response, stats, start):
+        total_ms = (time.perf_counter() - start) * 1000
+
+        view_name = self.get_view_name(request)
+        metrics.observe("request_duration_ms", total_ms, view=view_name)
+        metrics.observe("request_db_ms", stats.db_ms, view=view_name)
+        metrics.observe("request_template_ms", stats.template_ms, view=view_name)
+        metrics.observe(
+            "request_queries", stats.queries, buckets=QUERY_COUNT_BUCKETS, view=view_name
+        )
+
+        if settings.SERVER_TIMING_HEADER:
+            response["Server-Timing"] = (
+                f'db;dur={stats.db_ms:.1f};desc="{stats.queries} queries", '
+                f"tpl;dur={stats.template_ms:.1f}, "
+                f"total;dur={total_ms:.1f}"
+            )
+
+        self.check_budget(request, stats, view_name)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view = getattr(view_func, "view_class", view_func)
+        request.request_stats.query_budget = getattr(view, "query_budget", None)
+
+    def process_template_response(self, request, response):
+        start = time.perf_counter()
+        response.render()
+        request.request_stats.template_ms += (time.perf_counter() - start) * 1000
+        return response
+
+    def get_view_name(self, request):
+        match = getattr(request, "resolver_match", None)
+        return match.view_name if match else "unresolved"
+
+    def check_budget(self, request, stats, view_name):
+        budget = stats.query_budget
+        if budget is None or stats.queries <= budget:
+            return
+        message = (
+            f"{view_name} ran {stats.queries} queries for {request.method} "
+            f"{request.path} (budget: {budget})"
+        )
+        metrics.inc("query_budget_exceeded_total", view=view_name)
+        if settings.QUERY_BUDGET_RAISE:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
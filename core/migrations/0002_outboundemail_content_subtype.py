@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-17 01:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outboundemail',
+            name='content_subtype',
+            field=models.CharField(default='plain', max_length=20),
+        ),
+    ]
@@ -0,0 +1,27 @@
+"""
+View mixins for native async class-based views.
+
+Django's LoginRequiredMixin reads ``request.user``, a lazy object that loads
+the user synchronously and raises SynchronousOnlyOperation inside an async
+view. These mixins resolve the user with ``request.auser()`` instead and
+store the result back on ``request.user`` so later code (templates, rate
+limit keys) sees an already-loaded user.
+"""
+
+from django.contrib.auth.mixins import AccessMixin
+
+
+async def resolve_user(request):
+    """Load the session user without blocking and cache it on the request."""
+    request.user = await request.auser()
+    return request.user
+
+
+class AsyncLoginRequiredMixin(AccessMixin):
+    """Async counterpart of ``LoginRequiredMixin`` for views with async handlers."""
+
+    async def dispatch(self, request, *args, **kwargs):
+        user = await resolve_user(request)
+        if not user.is_authenticated:
+            return self.handle_no_permission()
+        return await super().dispatch(request, *args, **kwargs)
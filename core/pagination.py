@@ -0,0 +1,106 @@
+"""
+Pagination for tables too large to count or to page through with OFFSET.
+
+``Paginator`` runs ``SELECT COUNT(*)`` for every page, which reads the whole
+table (or the whole filtered result), and fetches page N with ``OFFSET``,
+which reads and discards every row before it. Both get slower as the table
+grows. Instead:
+
+- ``EstimatedCountPaginator`` reports an estimate for unfiltered tables
+  and stops counting filtered results at ``count_limit``.
+- ``keyset_page()`` fetches the rows after a cursor (the last key of the
+  previous page), which is an index range scan however deep the page is.
+"""
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import AutoField, BigAutoField, Max, SmallAutoField
+from django.utils.functional import cached_property
+
+
+def estimate_row_count(model, using="default"):
+    """
+    Return a cheap estimate of the number of rows in ``model``'s table.
+
+    PostgreSQL reports the planner statistic (``pg_class.reltuples``), which
+    is refreshed by (auto)vacuum and ANALYZE. Other databases get the largest
+    auto-increment primary key, an upper bound that is read from the end of
+    the primary key index and never goes stale. Returns None if neither is
+    available.
+    """
+    connection = connections[using]
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+                [connection.ops.quote_name(model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+        # -1 until the table has been vacuumed or analyzed
+        if row and row[0] >= 0:
+            return row[0]
+        return None
+    if isinstance(model._meta.pk, (AutoField, BigAutoField, SmallAutoField)):
+        return model._base_manager.using(using).aggregate(last=Max("pk"))["last"] or 0
+    return None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that never counts more than ``count_limit`` rows.
+
+    An unfiltered queryset whose table is estimated to hold at least
+    ``count_limit`` rows reports the estimate (``count_is_estimate``).
+    A filtered queryset is counted up to ``count_limit`` rows; beyond that
+    ``count`` is ``count_limit`` and ``count_is_capped`` is set.
+    """
+
+    count_limit = 10_000
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_is_estimate = False
+        self.count_is_capped = False
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = estimate_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate >= self.count_limit:
+                self.count_is_estimate = True
+                return estimate
+            return super().count
+        count = queryset.values("pk")[: self.count_limit + 1].count()
+        if count > self.count_limit:
+            self.count_is_capped = True
+            return self.count_limit
+        return count
+
+    @property
+    def count_display(self):
+        """The count for humans: "about 1,204,310", "10,000+" or "42"."""
+        if self.count_is_estimate:
+            return f"about {self.count:,}"
+        if self.count_is_capped:
+            return f"{self.count:,}+"
+        return f"{self.count:,}"
+
+
+def keyset_page(queryset, size, after=None, key="pk", descending=True):
+    """
+    Return ``(items, next_cursor)`` for the page of ``queryset`` after ``after``.
+
+    ``key`` must be unique and indexed (normally the primary key); the
+    queryset is ordered by it, newest first unless ``descending`` is False.
+    ``next_cursor`` is the cursor of the following page, or None on the
+    last page.
+    """
+    if after is not None:
+        lookup = "lt" if descending else "gt"
+        queryset = queryset.filter(**{f"{key}__{lookup}": after})
+    items = list(queryset.order_by(f"-{key}" if descending else key)[: size + 1])
+    if len(items) <= size:
+        return items, None
+    items = items[:size]
+    return items, getattr(items[-1], key)
@@ -0,0 +1,295 @@
+"""
+Rate limiting over the shared cache.
+
+Two algorithms are available:
+
+- ``sliding_window``: two fixed-window counters weighted by how far we are
+  into the current window. Uses only ``add``/``incr``, which are atomic on
+  every Django cache backend that can be shared between workers.
+- ``token_bucket``: allows bursts up to the limit and refills continuously.
+  Its state update is guarded by a short ``add``-based lock.
+
+Use ``RateLimitMixin`` on class-based views (sync or async) or the
+``ratelimit`` decorator on function views. Rejected requests get a 429 with a
+``Retry-After`` header and never reach the view (and so never reach
+``authenticate()``).
+
+A rule with ``failures_only=True`` counts only the requests the view reports
+through ``RateLimitMixin.ratelimit_failure()``, e.g. failed logins, so
+successful requests can't be used to exhaust someone else's limit.
+"""
+
+import hashlib
+import math
+import re
+import time
+from dataclasses import dataclass
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+
+from . import metrics
+
+RATE_RE = re.compile(r"^(\d+)/(\d*)([smhd])$")
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_rate(rate):
+    """Parse ``"10/m"`` or ``"100/15m"`` into ``(limit, period_seconds)``."""
+    match = RATE_RE.match(rate.strip())
+    if not match:
+        raise ValueError(f"Invalid rate {rate!r}; expected e.g. '10/m' or '5/15m'.")
+    limit, multiplier, unit = match.groups()
+    return int(limit), int(multiplier or 1) * PERIODS[unit]
+
+
+@dataclass
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    retry_after: int = 0
+
+
+def get_cache():
+    return caches[settings.RATELIMIT_CACHE_ALIAS]
+
+
+def client_ip(request):
+    """Return the client IP, honouring RATELIMIT_IP_HEADER behind a proxy."""
+    header = settings.RATELIMIT_IP_HEADER
+    if header and request.META.get(header):
+        # X-Forwarded-For: client, proxy1, proxy2
+        return request.META[header].split(",")[0].strip()
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def sliding_window(cache, key, limit, period, hit=True):
+    now = time.time()
+    window = int(now // period)
+    elapsed = now - window * period
+    current_key = f"rl:{key}:{window}"
+
+    if hit:
+        cache.add(current_key, 0, timeout=period * 2)
+        try:
+            current = cache.incr(current_key)
+        except ValueError:
+            # Key expired between add() and incr().
+            cache.set(current_key, 1, timeout=period * 2)
+            current = 1
+    else:
+        # Would one more hit go over the limit?
+        current = cache.get(current_key, 0) + 1
+    previous = cache.get(f"rl:{key}:{window - 1}", 0)
+
+    weight = (period - elapsed) / period
+    if previous * weight + current <= limit:
+        return RateLimitResult(True, limit)
+
+    if current > limit:
+        # Blocked at least until this window becomes the previous one.
+        retry_after = period - elapsed
+    else:
+        # Wait until the previous window's share has decayed enough.
+        retry_after = (period - elapsed) - (limit - current) * period / previous
+    return RateLimitResult(False, limit, max(1, math.ceil(retry_after)))
+
+
+def token_bucket(cache, key, limit, period, hit=True):
+    now = time.time()
+    refill_rate = limit / period  # tokens per second
+    state_key = f"rl:{key}:bucket"
+    lock_key = f"rl:{key}:lock"
+
+    if not hit:
+        # Would one more hit find a token?
+        tokens, updated = cache.get(state_key, (limit, now))
+        tokens = min(limit, tokens + (now - updated) * refill_rate)
+        if tokens >= 1:
+            return RateLimitResult(True, limit)
+        retry_after = math.ceil((1 - tokens) / refill_rate)
+        return RateLimitResult(False, limit, max(1, retry_after))
+
+    for _ in range(5):
+        if cache.add(lock_key, 1, timeout=2):
+            break
+        time.sleep(0.005)
+    else:
+        # Heavy concurrent traffic on one key; treat it as over the limit.
+        return RateLimitResult(False, limit, 1)
+
+    try:
+        tokens, updated = cache.get(state_key, (limit, now))
+        tokens = min(limit, tokens + (now - updated) * refill_rate)
+        if tokens >= 1:
+            cache.set(state_key, (tokens - 1, now), timeout=period)
+            return RateLimitResult(True, limit)
+        cache.set(state_key, (tokens, now), timeout=period)
+        return RateLimitResult(False, limit, max(1, math.ceil((1 - tokens) / refill_rate)))
+    finally:
+        cache.delete(lock_key)
+
+
+ALGORITHMS = {
+    "sliding_window": sliding_window,
+    "token_bucket": token_bucket,
+}
+
+
+class Rule:
+    """
+    One rate limit.
+
+    ``rate`` is a ``"10/m"``-style string or the name of a setting holding one
+    (read at request time; an empty value disables the rule). ``key`` is
+    ``"ip"``, ``"user"``, ``"user_or_ip"``, ``"post:<field>"``, several of
+    those joined with ``+`` (``"ip+post:email"``) or a callable taking the
+    request. Requests whose key is empty are not limited. With
+    ``failures_only`` the rule blocks once the failures reported by the view
+    reach the limit, but doesn't count other requests.
+    """
+
+    def __init__(
+        self,
+        rate,
+        key="ip",
+        methods=("POST",),
+        algorithm="sliding_window",
+        scope=None,
+        failures_only=False,
+    ):
+        self.rate = rate
+        self.key = key
+        self.methods = {method.upper() for method in methods}
+        self.algorithm = ALGORITHMS[algorithm]
+        self.scope = scope
+        self.failures_only = failures_only
+
+    def get_rate(self):
+        if "/" in self.rate:
+            return self.rate
+        return getattr(settings, self.rate, "")
+
+    def get_key(self, request):
+        if callable(self.key):
+            return self.key(request)
+        values = [self.get_key_part(request, part) for part in self.key.split("+")]
+        return "|".join(values) if all(values) else None
+
+    def get_key_part(self, request, key):
+        if key == "ip":
+            return client_ip(request)
+        if key in ("user", "user_or_ip"):
+            user = getattr(request, "user", None)
+            if user is not None and user.is_authenticated:
+                return f"user:{user.pk}"
+            return client_ip(request) if key == "user_or_ip" else None
+        if key.startswith("post:"):
+            return request.POST.get(key[5:], "").strip().lower()
+        raise ValueError(f"Unknown rate limit key {key!r}.")
+
+    def check(self, request, scope=None, failure=False):
+        """
+        Count this request; return a RateLimitResult or None if not limited.
+
+        ``failures_only`` rules are only looked at, unless ``failure`` says
+        the request failed; other rules ignore failures.
+        """
+        if not settings.RATELIMIT_ENABLED or request.method not in self.methods:
+            return None
+        if failure and not self.failures_only:
+            return None
+        rate = self.get_rate()
+        value = self.get_key(request)
+        if not rate or not value:
+            return None
+
+        limit, period = parse_rate(rate)
+        scope = self.scope or scope or "global"
+        digest = hashlib.sha256(str(value).encode()).hexdigest()[:32]
+        key_name = self.key if isinstance(self.key, str) else "custom"
+        result = self.algorithm(
+            get_cache(),
+            f"{scope}:{key_name}:{digest}",
+            limit,
+            period,
+            hit=failure or not self.failures_only,
+        )
+        if not result.allowed and not failure:
+            metrics.inc("ratelimit_blocked_total", scope=scope, key=key_name)
+        return result
+
+
+def too_many_requests(result, message="Too many requests. Please try again later."):
+    response = HttpResponse(message, status=429, content_type="text/plain")
+    response["Retry-After"] = str(result.retry_after)
+    return response
+
+
+def check_rules(rules, request, scope):
+    """Return the first blocking RateLimitResult for ``rules``, or None."""
+    for rule in rules:
+        result = rule.check(request, scope=scope)
+        if result is not None and not result.allowed:
+            return result
+    return None
+
+
+class RateLimitMixin:
+    """
+    Reject requests over the limits in ``ratelimit_rules`` before dispatch.
+
+    Override ``ratelimited()`` to customise the 429 response.
+    """
+
+    ratelimit_rules = ()
+
+    def get_ratelimit_rules(self):
+        return self.ratelimit_rules
+
+    def dispatch(self, request, *args, **kwargs):
+        if self.view_is_async:
+            return self._aratelimit_dispatch(request, *args, **kwargs)
+        result = check_rules(
+            self.get_ratelimit_rules(), request, scope=type(self).__name__
+        )
+        if result is not None:
+            return self.ratelimited(request, result)
+        return super().dispatch(request, *args, **kwargs)
+
+    async def _aratelimit_dispatch(self, request, *args, **kwargs):
+        # The cache API is synchronous; run the checks off the event loop.
+        result = await sync_to_async(check_rules)(
+            self.get_ratelimit_rules(), request, scope=type(self).__name__
+        )
+        if result is not None:
+            return self.ratelimited(request, result)
+        return await super().dispatch(request, *args, **kwargs)
+
+    def ratelimited(self, request, result):
+        return too_many_requests(result)
+
+    def ratelimit_failure(self, request):
+        """Count a failed request against the ``failures_only`` rules."""
+        for rule in self.get_ratelimit_rules():
+            rule.check(request, scope=type(self).__name__, failure=True)
+
+
+def ratelimit(rate, key="ip", methods=("POST",), algorithm="sliding_window", scope=None):
+    """Decorator form of ``RateLimitMixin`` for function-based views."""
+    rule = Rule(rate, key=key, methods=methods, algorithm=algorithm, scope=scope)
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapped(request, *args, **kwargs):
+            result = check_rules([rule], request, scope=view_func.__qualname__)
+            if result is not None:
+                return too_many_requests(result)
+            return view_func(request, *args, **kwargs)
+
+        return wrapped
+
+    return decorator
@@ -0,0 +1,53 @@
+"""
+Session engines that coalesce writes.
+
+SessionBase marks the session as modified on every assignment, even when the
+value is unchanged, and SessionMiddleware then writes it back. The engines in
+this package snapshot the session when it is loaded and skip the backend
+write when the data at the end of the request is identical, so a request
+costs at most one session write and often none.
+
+Select one with SESSION_BACKEND in .env (see hcot/settings.py).
+"""
+
+from django.conf import settings
+
+
+class CoalescingSessionMixin:
+    """Turn ``save()`` into a no-op when the loaded session data is unchanged."""
+
+    _snapshot = None
+
+    def _freeze(self, data):
+        return self.serializer().dumps(data)
+
+    def _is_unchanged(self, must_create):
+        if must_create or self._snapshot is None or self.session_key is None:
+            return False
+        if settings.SESSION_SAVE_EVERY_REQUEST:
+            # Saving refreshes the expiry, which is the point of that setting.
+            return False
+        data = getattr(self, "_session_cache", None)
+        return data is not None and self._freeze(data) == self._snapshot
+
+    def load(self):
+        data = super().load()
+        self._snapshot = self._freeze(data)
+        return data
+
+    async def aload(self):
+        data = await super().aload()
+        self._snapshot = self._freeze(data)
+        return data
+
+    def save(self, must_create=False):
+        if self._is_unchanged(must_create):
+            return
+        super().save(must_create=must_create)
+        self._snapshot = self._freeze(self._get_session(no_load=must_create))
+
+    async def asave(self, must_create=False):
+        if self._is_unchanged(must_create):
+            return
+        await super().asave(must_create=must_create)
+        self._snapshot = self._freeze(await self._aget_session(no_load=must_create))
@@ -0,0 +1,7 @@
+from django.contrib.sessions.backends import cache
+
+from . import CoalescingSessionMixin
+
+
+class SessionStore(CoalescingSessionMixin, cache.SessionStore):
+    pass
@@ -0,0 +1,7 @@
+from django.contrib.sessions.backends import cached_db
+
+from . import CoalescingSessionMixin
+
+
+class SessionStore(CoalescingSessionMixin, cached_db.SessionStore):
+    pass
@@ -0,0 +1,7 @@
+from django.contrib.sessions.backends import db
+
+from . import CoalescingSessionMixin
+
+
+class SessionStore(CoalescingSessionMixin, db.SessionStore):
+    pass
@@ -0,0 +1,118 @@
+"""
+Template warm-up and a persistent cache for cotton-compiled templates.
+
+Django's cached loader fills lazily in each process, so after a deploy every
+worker compiles ``dashboard.html``, ``settings.html`` and each ``<c-*>``
+component on its first request for them. Two things help:
+
+- ``warm_templates()`` (``manage.py warm_templates`` or the TEMPLATE_WARMUP
+  startup hook) loads every project template up front, filling the cached
+  loader of the current process.
+- ``Loader`` is django-cotton's loader with its compiled-source cache also
+  kept in TEMPLATE_CACHE_DIR, keyed by path, mtime and size, so a restarted
+  worker skips the cotton compilation step. Django's node trees can't be
+  serialized, so parsing still happens once per process.
+"""
+
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.template import engines
+from django_cotton.cotton_loader import CottonTemplateCacheHandler
+from django_cotton.cotton_loader import Loader as CottonLoader
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCottonCacheHandler(CottonTemplateCacheHandler):
+    """Cotton's in-memory cache, backed by one file per compiled template."""
+
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = Path(directory)
+
+    def get_cache_key(self, origin):
+        key = super().get_cache_key(origin)
+        # Same-second edits keep the mtime; the size usually changes.
+        return self.generate_hash([key, str(os.path.getsize(origin.name))])
+
+    def get_cached_template(self, cache_key):
+        compiled = super().get_cached_template(cache_key)
+        if compiled is None:
+            try:
+                compiled = (self.directory / cache_key).read_text(encoding="utf-8")
+            except OSError:
+                return None
+            super().cache_template(cache_key, compiled)
+        return compiled
+
+    def cache_template(self, cache_key, compiled_template):
+        super().cache_template(cache_key, compiled_template)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write then rename so other workers never read a partial file.
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(compiled_template)
+            os.replace(tmp_path, self.directory / cache_key)
+        except OSError as e:
+            logger.warning("Could not persist compiled template: %s", e)
+
+
+class Loader(CottonLoader):
+    """django-cotton loader whose compiled templates survive restarts."""
+
+    def __init__(self, engine, dirs=None):
+        super().__init__(engine, dirs)
+        if settings.TEMPLATE_CACHE_DIR:
+            self.cache_handler = DiskCottonCacheHandler(settings.TEMPLATE_CACHE_DIR)
+
+
+def project_template_names():
+    """
+    Yield the name of every template in the project's template directories.
+
+    Covers each app's ``templates/`` directory inside BASE_DIR (core, users,
+    theme, ...) and the root ``templates/`` directory holding the cotton
+    components; third-party templates are loaded on demand as usual.
+    """
+    base_dir = Path(settings.BASE_DIR).resolve()
+    seen = set()
+    for engine in engines.all():
+        for loader in engine.engine.template_loaders:
+            for inner in getattr(loader, "loaders", [loader]):
+                get_dirs = getattr(inner, "get_dirs", None)
+                for directory in get_dirs() if get_dirs else []:
+                    directory = Path(directory).resolve()
+                    if base_dir not in directory.parents or directory in seen:
+                        continue
+                    seen.add(directory)
+                    for path in sorted(directory.rglob("*.html")):
+                        yield path.relative_to(directory).as_posix()
+
+
+def warm_templates():
+    """
+    Compile every project template into the cached loader of this process.
+
+    Returns ``(loaded, failures, seconds)`` where ``failures`` maps template
+    names to the error raised while compiling them.
+    """
+    start = time.perf_counter()
+    loaded = 0
+    failures = {}
+    names = dict.fromkeys(project_template_names())
+    for engine in engines.all():
+        for name in names:
+            try:
+                engine.get_template(name)
+            except Exception as e:
+                failures[name] = e
+            else:
+                loaded += 1
+    return loaded, failures, time.perf_counter() - start
+
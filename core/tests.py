@@ -1,3 +1,526 @@
-from django.test import TestCase
+import json
+import os
+import shutil
+import smtplib
+import subprocess
+import sys
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.conf import settings
+from django.core.cache import caches
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.management import CommandError, call_command
+from django.contrib.sessions.models import Session
+from django.db import connection, transaction
+from django.http import HttpResponse
+from django.template import Origin
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import path, reverse
+from django.utils import timezone
+
+from users.models import Profile
+
+from .cache import TieredCache
+from .mail import CLAIM_LEASE, claim_batch, deliver_batch, retry_delay
+from .middleware import QueryBudgetExceeded, query_budget
+from .models import OutboundEmail
+from .ratelimit import Rule, get_cache, ratelimit, sliding_window, token_bucket
+from .session_backends import cache as cache_sessions
+from .session_backends import db as db_sessions
+from .template_cache import DiskCottonCacheHandler, project_template_names
+
+
+def clear_caches():
+    # Rate limit counters live in the cache and would leak between tests.
+    for alias in settings.CACHES:
+        caches[alias].clear()
+
+
+class FailingEmailBackend(BaseEmailBackend):
+    """Delivery backend whose relay refuses every message."""
+
+    def send_messages(self, email_messages):
+        raise smtplib.SMTPServerDisconnected("relay unavailable")
+
+
+@override_settings(
+    EMAIL_BACKEND="core.mail.QueuedEmailBackend",
+    EMAIL_DELIVERY_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    EMAIL_QUEUE_MAX_ATTEMPTS=3,
+    EMAIL_QUEUE_RETRY_BACKOFF=30,
+    EMAIL_QUEUE_RETRY_BACKOFF_MAX=3600,
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
+)
+class OutboundEmailQueueTests(TestCase):
+    def send(self, subject="Your code", body="123456"):
+        mail.send_mail(subject, body, "noreply@example.com", ["jane@example.com"])
+
+    def test_send_mail_only_enqueues(self):
+        self.send()
+        self.assertEqual(mail.outbox, [])
+        outbound = OutboundEmail.objects.get()
+        self.assertEqual(outbound.status, OutboundEmail.Status.QUEUED)
+        self.assertEqual(outbound.to, ["jane@example.com"])
+
+    def test_deliver_batch_sends_and_drops_the_body(self):
+        mail.send_mail(
+            "Your code",
+            "123456",
+            "noreply@example.com",
+            ["jane@example.com"],
+            html_message="<p>123456</p>",
+        )
+        self.assertEqual(deliver_batch(), (1, 0))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].body, "123456")
+        self.assertEqual(mail.outbox[0].alternatives[0][0], "<p>123456</p>")
+        outbound = OutboundEmail.objects.get()
+        self.assertEqual(outbound.status, OutboundEmail.Status.SENT)
+        self.assertEqual((outbound.body, outbound.alternatives), ("", []))
+        self.assertIsNotNone(outbound.sent_at)
+
+    def test_html_only_messages_stay_html(self):
+        message = mail.EmailMessage(
+            "Your code", "<p>123456</p>", "noreply@example.com", ["jane@example.com"]
+        )
+        message.content_subtype = "html"
+        message.send()
+        self.assertEqual(deliver_batch(), (1, 0))
+        delivered = mail.outbox[0].message()
+        self.assertEqual(delivered.get_content_type(), "text/html")
+
+    def test_claimed_messages_are_leased(self):
+        self.send()
+        self.send()
+        claimed = claim_batch(10)
+        self.assertEqual(len(claimed), 2)
+        self.assertEqual([outbound.attempts for outbound in claimed], [1, 1])
+        # Another worker finds nothing until the lease runs out.
+        self.assertEqual(claim_batch(10), [])
+        OutboundEmail.objects.update(
+            next_attempt_at=timezone.now() - timedelta(seconds=1)
+        )
+        self.assertEqual(len(claim_batch(1)), 1)
+
+    def test_lease_outlasts_a_batch(self):
+        self.send()
+        before = timezone.now()
+        claim_batch(10)
+        outbound = OutboundEmail.objects.get()
+        self.assertGreaterEqual(outbound.next_attempt_at, before + CLAIM_LEASE)
+
+    @override_settings(EMAIL_DELIVERY_BACKEND="core.tests.FailingEmailBackend")
+    def test_failures_back_off_then_fail(self):
+        self.send()
+        for attempt in (1, 2):
+            before = timezone.now()
+            with self.assertLogs("core.mail", "WARNING"):
+                self.assertEqual(deliver_batch(), (0, 1))
+            outbound = OutboundEmail.objects.get()
+            self.assertEqual(outbound.status, OutboundEmail.Status.QUEUED)
+            self.assertEqual(outbound.attempts, attempt)
+            self.assertIn("relay unavailable", outbound.last_error)
+            delay = 30 * 2 ** (attempt - 1)
+            self.assertGreaterEqual(
+                outbound.next_attempt_at, before + timedelta(seconds=delay * 0.8)
+            )
+            # Not due yet: the next batch skips it.
+            self.assertEqual(deliver_batch(), (0, 0))
+            OutboundEmail.objects.update(next_attempt_at=timezone.now())
+        with self.assertLogs("core.mail", "WARNING"):
+            self.assertEqual(deliver_batch(), (0, 1))
+        outbound = OutboundEmail.objects.get()
+        self.assertEqual(outbound.status, OutboundEmail.Status.FAILED)
+        # Failed messages keep their body so they can be requeued.
+        self.assertEqual(outbound.body, "123456")
+
+    def test_retry_delay_doubles_up_to_the_cap(self):
+        with mock.patch("core.mail.random.uniform", return_value=1):
+            delays = [retry_delay(attempt).total_seconds() for attempt in range(1, 9)]
+        self.assertEqual(delays, [30, 60, 120, 240, 480, 960, 1920, 3600])
+
+    def test_allauth_password_reset_goes_through_the_queue(self):
+        get_user_model().objects.create_user(
+            "jane", email="jane@example.com", password="secret12345"
+        )
+        clear_caches()
+        response = self.client.post(
+            reverse("account_reset_password"), {"email": "jane@example.com"}
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(mail.outbox, [])
+        self.assertEqual(OutboundEmail.objects.count(), 1)
+        self.assertEqual(deliver_batch(), (1, 0))
+        self.assertIn("/password/reset/key/", mail.outbox[0].body)
+
+    def test_purge_deletes_old_delivered_and_failed_messages(self):
+        for _ in range(3):
+            self.send()
+        sent, failed, queued = OutboundEmail.objects.order_by("pk")
+        old = timezone.now() - timedelta(days=8)
+        OutboundEmail.objects.filter(pk=sent.pk).update(
+            status=OutboundEmail.Status.SENT, next_attempt_at=old
+        )
+        OutboundEmail.objects.filter(pk=failed.pk).update(
+            status=OutboundEmail.Status.FAILED, next_attempt_at=old
+        )
+        OutboundEmail.objects.filter(pk=queued.pk).update(next_attempt_at=old)
+        call_command("purge_outbound_email", "--batch-size", "1", stdout=StringIO())
+        self.assertQuerySetEqual(OutboundEmail.objects.all(), [queued])
+
+
+class TieredCacheTests(SimpleTestCase):
+    def setUp(self):
+        clear_caches()
+        self.shared = caches["shared"]
+        self.cache = TieredCache(
+            "shared", {"OPTIONS": {"L1_MAX_ENTRIES": 2, "L1_TIMEOUT": 5}}
+        )
+
+    def test_hits_are_served_from_l1(self):
+        self.cache.set("a", [1])
+        self.shared.delete("a")
+        self.assertEqual(self.cache.get("a"), [1])
+        # L1 values are copies: mutating one doesn't change the cache.
+        self.cache.get("a").append(2)
+        self.assertEqual(self.cache.get("a"), [1])
+
+    def test_shared_hits_fill_l1(self):
+        self.shared.set("a", 1)
+        self.assertEqual(self.cache.get("a"), 1)
+        self.shared.delete("a")
+        self.assertEqual(self.cache.get("a"), 1)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.get("a")
+        self.cache.set("c", 3)
+        self.shared.clear()
+        self.assertEqual(self.cache.get_many(["a", "b", "c"]), {"a": 1, "c": 3})
+
+    def test_entries_expire_from_l1(self):
+        with mock.patch("core.cache.time.monotonic", return_value=100):
+            self.cache.set("a", 1)
+            self.cache.set("b", 2, timeout=1)
+        self.shared.clear()
+        with mock.patch("core.cache.time.monotonic", return_value=102):
+            self.assertEqual(self.cache.get("a"), 1)
+            self.assertIsNone(self.cache.get("b"))
+        with mock.patch("core.cache.time.monotonic", return_value=106):
+            self.assertIsNone(self.cache.get("a"))
+
+    def test_writes_through_and_deletes_both_tiers(self):
+        self.cache.set("a", 1)
+        self.assertEqual(self.shared.get("a"), 1)
+        self.cache.delete("a")
+        self.assertIsNone(self.cache.get("a"))
+        self.assertIsNone(self.shared.get("a"))
+
+
+class SessionBackendTests(TestCase):
+    def setUp(self):
+        clear_caches()
+
+    def test_unchanged_sessions_are_not_saved(self):
+        session = db_sessions.SessionStore()
+        session["verified"] = False
+        session.save()
+        session = db_sessions.SessionStore(session.session_key)
+        # Assigning marks the session modified even if the value is the same.
+        session["verified"] = False
+        with self.assertNumQueries(0):
+            session.save()
+        session["verified"] = True
+        session.save()
+        self.assertTrue(db_sessions.SessionStore(session.session_key)["verified"])
+
+    @override_settings(SESSION_SAVE_EVERY_REQUEST=True)
+    def test_save_every_request_still_saves(self):
+        session = db_sessions.SessionStore()
+        session["verified"] = False
+        session.save()
+        session = db_sessions.SessionStore(session.session_key)
+        session["verified"] = False
+        with CaptureQueriesContext(connection) as queries:
+            session.save()
+        self.assertTrue(any(q["sql"].startswith("UPDATE") for q in queries))
+
+    def test_cache_sessions_skip_unchanged_writes(self):
+        session = cache_sessions.SessionStore()
+        session["verified"] = False
+        session.save()
+        session = cache_sessions.SessionStore(session.session_key)
+        session["verified"] = False
+        with mock.patch.object(session._cache, "set") as cache_set:
+            session.save()
+            cache_set.assert_not_called()
+            session["verified"] = True
+            session.save()
+            cache_set.assert_called_once()
+
+    def test_purge_sessions_deletes_expired_sessions_in_chunks(self):
+        now = timezone.now()
+        for i in range(5):
+            Session.objects.create(
+                session_key=f"expired{i}",
+                session_data="",
+                expire_date=now - timedelta(seconds=1),
+            )
+        Session.objects.create(
+            session_key="current", session_data="", expire_date=now + timedelta(1)
+        )
+        with CaptureQueriesContext(connection) as queries:
+            call_command("purge_sessions", "--batch-size", "2", stdout=StringIO())
+        deletes = [q for q in queries if q["sql"].startswith("DELETE")]
+        self.assertEqual(len(deletes), 3)
+        self.assertQuerySetEqual(
+            Session.objects.values_list("session_key", flat=True), ["current"]
+        )
+
+
+class TemplateWarmupTests(SimpleTestCase):
+    def test_warm_templates_compiles_every_project_template(self):
+        names = list(project_template_names())
+        self.assertIn("users/login.html", names)
+        self.assertIn("cotton/card.html", names)
+        stdout = StringIO()
+        call_command("warm_templates", stdout=stdout)
+        self.assertIn(f"Compiled {len(names)} templates", stdout.getvalue())
+
+    def test_warm_templates_fails_on_broken_templates(self):
+        with mock.patch(
+            "core.template_cache.project_template_names",
+            return_value=["users/login.html", "missing.html"],
+        ):
+            with self.assertRaisesMessage(CommandError, "1 templates failed"):
+                call_command("warm_templates", stdout=StringIO(), stderr=StringIO())
+
+    def test_compiled_templates_are_kept_on_disk(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "card.html")
+        with open(path, "w") as f:
+            f.write("<c-card />")
+        origin = Origin(path)
+        key = DiskCottonCacheHandler(directory).get_cache_key(origin)
+        DiskCottonCacheHandler(directory).cache_template(key, "compiled")
+        # A new process starts with an empty in-memory cache.
+        self.assertEqual(
+            DiskCottonCacheHandler(directory).get_cached_template(key), "compiled"
+        )
+
+        # An edit within the same second keeps the mtime but not the size.
+        stat = os.stat(path)
+        with open(path, "w") as f:
+            f.write("<c-card title='x' />")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        handler = DiskCottonCacheHandler(directory)
+        self.assertNotEqual(handler.get_cache_key(origin), key)
+        self.assertIsNone(handler.get_cached_template(handler.get_cache_key(origin)))
+
+
+OPTIONAL_APPS_SCRIPT = """
+import json
+import django
+from django.apps import apps
+from django.urls import NoReverseMatch, reverse
+
+django.setup()
+
+def reverses(name):
+    try:
+        reverse(name)
+    except NoReverseMatch:
+        return False
+    return True
+
+print(json.dumps({
+    "apps": [
+        name
+        for name in ["django.contrib.admin", "jazzmin", "allauth.socialaccount"]
+        if apps.is_installed(name)
+    ],
+    "urls": [
+        name
+        for name in ["admin:index", "socialaccount_connections", "account_login"]
+        if reverses(name)
+    ],
+}))
+"""
+
+
+class OptionalAppsTests(SimpleTestCase):
+    """The app flags are read when settings load, so each case starts Python."""
+
+    def load(self, **env):
+        result = subprocess.run(
+            [sys.executable, "-c", OPTIONAL_APPS_SCRIPT],
+            cwd=settings.BASE_DIR,
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": "hcot.settings", **env},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return json.loads(result.stdout)
+
+    def test_everything_is_on_by_default(self):
+        loaded = self.load(ENABLE_ADMIN="True", SOCIAL_PROVIDERS="google")
+        apps = ["django.contrib.admin", "jazzmin", "allauth.socialaccount"]
+        self.assertEqual(loaded["apps"], apps)
+        urls = ["admin:index", "socialaccount_connections", "account_login"]
+        self.assertEqual(loaded["urls"], urls)
+
+    def test_disabled_apps_and_their_urls_are_removed(self):
+        loaded = self.load(ENABLE_ADMIN="False", SOCIAL_PROVIDERS="")
+        self.assertEqual(loaded, {"apps": [], "urls": ["account_login"]})
+
+    def test_jazzmin_can_be_left_out_alone(self):
+        loaded = self.load(ENABLE_ADMIN="True", ENABLE_JAZZMIN="False")
+        self.assertNotIn("jazzmin", loaded["apps"])
+        self.assertIn("admin:index", loaded["urls"])
+
+
+class RateLimitTests(SimpleTestCase):
+    def setUp(self):
+        clear_caches()
+        self.factory = RequestFactory()
+
+    def post(self, ip="10.0.0.1", **data):
+        return self.factory.post("/", data, REMOTE_ADDR=ip)
+
+    def test_sliding_window(self):
+        cache = get_cache()
+        results = [sliding_window(cache, "t", 3, 60) for _ in range(4)]
+        self.assertEqual([r.allowed for r in results], [True, True, True, False])
+        self.assertTrue(1 <= results[-1].retry_after <= 60)
+
+    def test_token_bucket(self):
+        cache = get_cache()
+        results = [token_bucket(cache, "t", 2, 60) for _ in range(3)]
+        self.assertEqual([r.allowed for r in results], [True, True, False])
+        # One token comes back every 30 seconds.
+        self.assertTrue(1 <= results[-1].retry_after <= 30)
+
+    def test_decorator_answers_429_with_retry_after(self):
+        view = ratelimit("2/m")(lambda request: HttpResponse("ok"))
+        statuses = [view(self.post()).status_code for _ in range(3)]
+        self.assertEqual(statuses, [200, 200, 429])
+        response = view(self.post())
+        self.assertTrue(1 <= int(response["Retry-After"]) <= 60)
+        # Other clients have limits of their own.
+        self.assertEqual(view(self.post(ip="10.0.0.2")).status_code, 200)
+
+    def test_only_the_listed_methods_are_limited(self):
+        rule = Rule("1/m")
+        request = self.factory.get("/", REMOTE_ADDR="10.0.0.1")
+        self.assertIsNone(rule.check(request))
+
+    def test_combined_keys(self):
+        rule = Rule("1/m", key="ip+post:email")
+        self.assertTrue(rule.check(self.post(email="a@example.com")).allowed)
+        self.assertFalse(rule.check(self.post(email="A@example.com")).allowed)
+        self.assertTrue(rule.check(self.post(email="b@example.com")).allowed)
+        other_ip = self.post("10.0.0.2", email="a@example.com")
+        self.assertTrue(rule.check(other_ip).allowed)
+        # No email, no limit.
+        self.assertIsNone(rule.check(self.post()))
+
+    def test_failures_only_rules_count_reported_failures(self):
+        rule = Rule("2/m", failures_only=True)
+        for _ in range(5):
+            self.assertTrue(rule.check(self.post()).allowed)
+        rule.check(self.post(), failure=True)
+        self.assertTrue(rule.check(self.post()).allowed)
+        rule.check(self.post(), failure=True)
+        result = rule.check(self.post())
+        self.assertFalse(result.allowed)
+        self.assertGreaterEqual(result.retry_after, 1)
+
+    def test_other_rules_ignore_failures(self):
+        rule = Rule("1/m")
+        self.assertIsNone(rule.check(self.post(), failure=True))
+        self.assertTrue(rule.check(self.post()).allowed)
+
+
+@query_budget(1)
+def two_queries(request):
+    User = get_user_model()
+    User.objects.exists()
+    User.objects.exists()
+    return HttpResponse("ok")
+
+
+@query_budget(1)
+def one_transaction(request):
+    with transaction.atomic():
+        get_user_model().objects.exists()
+    return HttpResponse("ok")
+
+
+urlpatterns = [
+    path("two-queries/", two_queries),
+    path("one-transaction/", one_transaction),
+]
+
+
+@override_settings(ROOT_URLCONF="core.tests", SERVER_TIMING_HEADER=True)
+class QueryBudgetTests(TestCase):
+    def test_exceeding_the_budget_raises_in_tests(self):
+        with self.assertRaisesMessage(QueryBudgetExceeded, "ran 2 queries"):
+            self.client.get("/two-queries/")
+
+    @override_settings(QUERY_BUDGET_RAISE=False)
+    def test_exceeding_the_budget_logs_elsewhere(self):
+        with self.assertLogs("core.middleware", "WARNING") as logs:
+            response = self.client.get("/two-queries/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("(budget: 1)", logs.output[0])
+
+    def test_savepoints_are_not_counted(self):
+        response = self.client.get("/one-transaction/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('desc="1 queries"', response["Server-Timing"])
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class DashboardTests(TestCase):
+    def test_dashboard_within_budget(self):
+        user = get_user_model().objects.create_user(
+            "jane", email="jane@example.com", password="secret12345"
+        )
+        self.client.force_login(user)
+        clear_caches()
+        # Rendered, then served from the per-user fragment cache
+        for _ in range(2):
+            response = self.client.get(reverse("dashboard"))
+            self.assertEqual(response.status_code, 200)
+        self.assertContains(response, reverse("users:activity"))
+
+    def test_dashboard_cache_is_invalidated_by_profile_edits(self):
+        user = get_user_model().objects.create_user(
+            "jane", email="jane@example.com", password="secret12345"
+        )
+        other = get_user_model().objects.create_user(
+            "john", email="john@example.com", password="secret12345"
+        )
+        clear_caches()
+        self.client.force_login(user)
+        self.assertContains(self.client.get(reverse("dashboard")), "No bio added yet")
+        # update() sends no signal, so the cached fragment is still served.
+        Profile.objects.filter(user=user).update(bio="Hiking")
+        self.assertContains(self.client.get(reverse("dashboard")), "No bio added yet")
+        profile = Profile.objects.get(user=user)
+        profile.save()
+        self.assertContains(self.client.get(reverse("dashboard")), "Hiking")
+        # Fragments are cached per user.
+        self.client.force_login(other)
+        response = self.client.get(reverse("dashboard"))
+        self.assertNotContains(response, "Hiking")
+        self.assertContains(response, "john@example.com")
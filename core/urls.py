@@ -1,8 +1,13 @@
-from django.urls import include, path
+from django.conf import settings
+from django.urls import path
 
 from . import views
 
+# Native async views when serving over ASGI (see ASYNC_VIEWS in settings)
+DashboardView = views.AsyncDashboardView if settings.ASYNC_VIEWS else views.DashboardView
+
 urlpatterns = [
     path("", views.IndexView.as_view(), name="index"),
-    path("dashboard/", views.DashboardView.as_view(), name="dashboard"),
+    path("dashboard/", DashboardView.as_view(), name="dashboard"),
+    path("metrics/", views.MetricsView.as_view(), name="metrics"),
 ]
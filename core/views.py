@@ -1,8 +1,13 @@
 from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import HttpResponse, HttpResponseForbidden
 from django.shortcuts import render
 from django.urls import reverse_lazy
-from django.views.generic import RedirectView, TemplateView
+from django.utils.crypto import constant_time_compare
+from django.views.generic import RedirectView, TemplateView, View
+
+from . import metrics
+from .mixins import AsyncLoginRequiredMixin
 
 
 class IndexView(RedirectView):
@@ -26,4 +31,35 @@ class IndexView(RedirectView):
 
 class DashboardView(LoginRequiredMixin, TemplateView):
     template_name = "core/dashboard.html"
+    query_budget = 3  # session + user (joined with profile and email)
     login_url = reverse_lazy("index")  # Redirect to index if not logged in
+
+
+class AsyncDashboardView(AsyncLoginRequiredMixin, DashboardView):
+    """DashboardView with a native async handler; used when ASYNC_VIEWS is on."""
+
+    async def get(self, request, *args, **kwargs):
+        return self.render_to_response(self.get_context_data(**kwargs))
+
+
+class MetricsView(View):
+    """
+    Expose the in-process metrics of this worker in Prometheus text format.
+
+    Available to staff users, or to scrapers sending
+    ``Authorization: Bearer <METRICS_TOKEN>`` when METRICS_TOKEN is set.
+    """
+
+    def has_access(self, request):
+        token = settings.METRICS_TOKEN
+        header = request.headers.get("Authorization", "")
+        if token and constant_time_compare(header, f"Bearer {token}"):
+            return True
+        return request.user.is_authenticated and request.user.is_staff
+
+    def get(self, request, *args, **kwargs):
+        if not self.has_access(request):
+            return HttpResponseForbidden()
+        return HttpResponse(
+            metrics.render_text(), content_type="text/plain; version=0.0.4"
+        )
@@ -1,4 +1,5 @@
 import os
+import sys
 from pathlib import Path
 
 from decouple import Csv, config
@@ -21,15 +22,28 @@ DEBUG = config("DEBUG", default=True, cast=bool)
 
 ALLOWED_HOSTS = config("ALLOWED_HOSTS", default="localhost,127.0.0.1", cast=Csv())
 
+# True while running the test suite
+TESTING = sys.argv[1:2] == ["test"] or "pytest" in sys.modules
+
 
 # Application definition
 
+# Optional apps. Each one costs import time and memory in every worker, so
+# leave out what a deployment doesn't use (see manage.py startup_profile).
+ENABLE_ADMIN = config("ENABLE_ADMIN", default=True, cast=bool)
+ENABLE_JAZZMIN = config("ENABLE_JAZZMIN", default=ENABLE_ADMIN, cast=bool)
+# Social login providers offered on the login/signup pages; empty disables
+# allauth.socialaccount altogether
+SOCIAL_PROVIDERS = config("SOCIAL_PROVIDERS", default="google", cast=Csv())
+
 INSTALLED_APPS = [
     "django.contrib.admin",
     "django.contrib.auth",
     "django.contrib.contenttypes",
     "django.contrib.sessions",
     "django.contrib.messages",
+    # Serve static files through WhiteNoise under runserver too
+    "whitenoise.runserver_nostatic",
     "django.contrib.staticfiles",
     "django.contrib.sites",  # Required for allauth
     # styling
@@ -39,20 +53,32 @@ INSTALLED_APPS = [
     "core",
     "users",
     # third party
-    "django_cotton",
+    # SimpleAppConfig keeps our TEMPLATES loaders (core.template_cache.Loader)
+    # instead of replacing them with the stock cotton loader
+    "django_cotton.apps.SimpleAppConfig",
     "django_viewcomponent",
     "jazzmin",
     # allauth
     "allauth",
     "allauth.account",
-    "allauth.socialaccount",
-    "allauth.socialaccount.providers.google",
 ]
+if not (ENABLE_ADMIN and ENABLE_JAZZMIN):
+    INSTALLED_APPS.remove("jazzmin")
+if not ENABLE_ADMIN:
+    INSTALLED_APPS.remove("django.contrib.admin")
+if SOCIAL_PROVIDERS:
+    INSTALLED_APPS += ["allauth.socialaccount"] + [
+        f"allauth.socialaccount.providers.{provider}" for provider in SOCIAL_PROVIDERS
+    ]
 
 SITE_ID = 1
 
 MIDDLEWARE = [
+    # Must stay first: times the whole request, including template rendering
+    "core.middleware.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    # Static files with far-future caching and gzip/brotli variants
+    "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -60,8 +86,16 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",  # Required for allauth
+    # 503 + Retry-After when the password hashing pool is saturated
+    "users.middleware.PasswordHasherBusyMiddleware",
 ]
 
+# Request instrumentation (core.middleware.RequestMetricsMiddleware)
+# Send query count / DB / template / total timings in a Server-Timing header
+SERVER_TIMING_HEADER = config("SERVER_TIMING_HEADER", default=True, cast=bool)
+# Raise when a view exceeds its query_budget (tests) instead of logging a warning
+QUERY_BUDGET_RAISE = config("QUERY_BUDGET_RAISE", default=TESTING, cast=bool)
+
 ROOT_URLCONF = "hcot.urls"
 
 
@@ -83,7 +117,9 @@ TEMPLATES = [
                 (
                     "django.template.loaders.cached.Loader",
                     [
-                        "django_cotton.cotton_loader.Loader",
+                        # django-cotton's loader plus an on-disk cache of
+                        # compiled components (TEMPLATE_CACHE_DIR)
+                        "core.template_cache.Loader",
                         "django.template.loaders.filesystem.Loader",
                         "django.template.loaders.app_directories.Loader",
                     ],
@@ -94,7 +130,22 @@ TEMPLATES = [
     },
 ]
 
+# Directory for cotton-compiled templates, reused across restarts
+# (empty = keep them in memory only)
+TEMPLATE_CACHE_DIR = config(
+    "TEMPLATE_CACHE_DIR", default="" if DEBUG else str(BASE_DIR / ".template_cache")
+)
+# Compile every project template when the app starts (see core/apps.py)
+# instead of on the first request that uses it
+TEMPLATE_WARMUP = config("TEMPLATE_WARMUP", default=False, cast=bool)
+
 WSGI_APPLICATION = "hcot.wsgi.application"
+ASGI_APPLICATION = "hcot.asgi.application"
+
+# Route the login, email verification and dashboard URLs to native async
+# views. Enable when serving hcot.asgi with an ASGI server (uvicorn, daphne);
+# under WSGI the sync views avoid spinning up an event loop per request.
+ASYNC_VIEWS = config("ASYNC_VIEWS", default=False, cast=bool)
 
 
 # ==============================================================================
@@ -112,11 +163,33 @@ WSGI_APPLICATION = "hcot.wsgi.application"
 #   - Set DATABASE_ENGINE=postgresql in .env
 #   - Configure DATABASE_NAME, DATABASE_USER, DATABASE_PASSWORD, etc.
 #   - Requires psycopg2-binary: pip install psycopg2-binary
+#
+# Connection reuse (both engines):
+#   - DATABASE_CONN_MAX_AGE keeps a connection open for that many seconds
+#     (0 = close after every request, -1 = unlimited)
+#   - DATABASE_CONN_HEALTH_CHECKS pings a reused connection before its first
+#     query in each request, so a dropped connection is replaced transparently
+#
+# Connection pool (PostgreSQL only, requires: pip install "psycopg[pool]"):
+#   - DATABASE_POOL=True uses Django's built-in psycopg 3 pool instead of
+#     persistent connections; CONN_MAX_AGE is forced to 0 in that mode
+#
+# SQLite production mode (SQLITE_PRODUCTION_MODE, default: on when DEBUG=False):
+#   - WAL journaling so readers never block the writer
+#   - synchronous=NORMAL, larger page cache and memory-mapped I/O
+#   - busy timeout + IMMEDIATE transactions so concurrent writers queue for
+#     the write lock instead of failing with "database is locked"
 # ==============================================================================
 
 # Get database engine from environment (defaults to sqlite3)
 DATABASE_ENGINE = config("DATABASE_ENGINE", default="sqlite3")
 
+DATABASE_CONN_MAX_AGE = config("DATABASE_CONN_MAX_AGE", default=60, cast=int)
+DATABASE_CONN_HEALTH_CHECKS = config(
+    "DATABASE_CONN_HEALTH_CHECKS", default=True, cast=bool
+)
+DATABASE_POOL = config("DATABASE_POOL", default=False, cast=bool)
+
 if DATABASE_ENGINE == "postgresql":
     # PostgreSQL Configuration
     # Requires: pip install psycopg2-binary
@@ -128,17 +201,30 @@ if DATABASE_ENGINE == "postgresql":
             "PASSWORD": config("DATABASE_PASSWORD", default=""),
             "HOST": config("DATABASE_HOST", default="localhost"),
             "PORT": config("DATABASE_PORT", default="5432", cast=int),
+            "CONN_MAX_AGE": 0 if DATABASE_POOL else DATABASE_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": DATABASE_CONN_HEALTH_CHECKS,
             # Optional PostgreSQL-specific settings
             "OPTIONS": {
                 # Connection timeout in seconds
                 "connect_timeout": config(
                     "DATABASE_CONNECT_TIMEOUT", default=10, cast=int
                 ),
+                # Server-side limit for a single statement in milliseconds
+                # (0 = no limit); stops runaway queries from holding a connection
+                "options": "-c statement_timeout=%d"
+                % config("DATABASE_STATEMENT_TIMEOUT", default=0, cast=int),
                 # Other options can be added here as needed
                 # Example: "sslmode": "require" for SSL connections
             },
         }
     }
+    if DATABASE_POOL:
+        DATABASES["default"]["OPTIONS"]["pool"] = {
+            "min_size": config("DATABASE_POOL_MIN_SIZE", default=2, cast=int),
+            "max_size": config("DATABASE_POOL_MAX_SIZE", default=10, cast=int),
+            # Seconds a request waits for a free connection before erroring
+            "timeout": config("DATABASE_POOL_TIMEOUT", default=10, cast=int),
+        }
 else:
     # SQLite Configuration (default)
     # No additional configuration needed
@@ -146,8 +232,29 @@ else:
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": BASE_DIR / "db.sqlite3",
+            "CONN_MAX_AGE": DATABASE_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": DATABASE_CONN_HEALTH_CHECKS,
         }
     }
+    SQLITE_PRODUCTION_OPTIONS = {
+        # Applied to every new connection
+        "init_command": (
+            "PRAGMA journal_mode=WAL;"
+            "PRAGMA synchronous=NORMAL;"
+            "PRAGMA temp_store=MEMORY;"
+            f"PRAGMA mmap_size={config('SQLITE_MMAP_SIZE', default=134217728, cast=int)};"
+            # Negative values are KiB rather than pages
+            f"PRAGMA cache_size=-{config('SQLITE_CACHE_SIZE_KB', default=20000, cast=int)};"
+        ),
+        # Take the write lock when a transaction starts, so a transaction
+        # never has to upgrade a read lock (which fails immediately when
+        # another writer is active, regardless of the busy timeout)
+        "transaction_mode": "IMMEDIATE",
+        # Seconds to wait for the write lock (sets busy_timeout)
+        "timeout": config("SQLITE_BUSY_TIMEOUT", default=20, cast=int),
+    }
+    if config("SQLITE_PRODUCTION_MODE", default=not DEBUG, cast=bool):
+        DATABASES["default"]["OPTIONS"] = SQLITE_PRODUCTION_OPTIONS
 
 
 # ==============================================================================
@@ -175,6 +282,50 @@ if PASSWORD_REQUIRE_NUMERIC:
         }
     )
 
+# ==============================================================================
+# PASSWORD HASHING
+# ==============================================================================
+# Hashing can run in a per-worker process pool (users/hashers.py) so it
+# doesn't compete with request threads. Changing the algorithm or a cost
+# setting rehashes each password transparently at its owner's next login.
+
+# "pbkdf2" (default) or "argon2" (requires: pip install argon2-cffi)
+PASSWORD_HASHER = config("PASSWORD_HASHER", default="pbkdf2")
+
+# PBKDF2 iterations (0 = Django's default for this version)
+PASSWORD_HASH_ITERATIONS = config("PASSWORD_HASH_ITERATIONS", default=0, cast=int)
+
+# Argon2 costs (0 = Django's defaults)
+ARGON2_TIME_COST = config("ARGON2_TIME_COST", default=0, cast=int)
+ARGON2_MEMORY_COST = config("ARGON2_MEMORY_COST", default=0, cast=int)  # KiB
+ARGON2_PARALLELISM = config("ARGON2_PARALLELISM", default=0, cast=int)
+
+# Hashing processes per worker (0 = hash inline on the request thread).
+# Measure with `python -m benchmarks.password_hashing` before enabling.
+PASSWORD_HASHER_POOL_SIZE = config("PASSWORD_HASHER_POOL_SIZE", default=0, cast=int)
+# Hashes queued or running per worker before new ones get a 503
+# (0 = twice the pool size)
+PASSWORD_HASHER_MAX_PENDING = config(
+    "PASSWORD_HASHER_MAX_PENDING", default=0, cast=int
+)
+# Seconds to wait for a free slot before answering 503
+PASSWORD_HASHER_QUEUE_TIMEOUT = config(
+    "PASSWORD_HASHER_QUEUE_TIMEOUT", default=0.0, cast=float
+)
+
+_PASSWORD_HASHERS = {
+    "pbkdf2": "users.hashers.PooledPBKDF2PasswordHasher",
+    "argon2": "users.hashers.PooledArgon2PasswordHasher",
+}
+# The first entry hashes new passwords; the rest can still verify old hashes.
+PASSWORD_HASHERS = [
+    _PASSWORD_HASHERS[PASSWORD_HASHER],
+    *(path for name, path in _PASSWORD_HASHERS.items() if name != PASSWORD_HASHER),
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.0/topics/i18n/
@@ -192,6 +343,25 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/5.0/howto/static-files/
 
 STATIC_URL = "/static/"
+STATIC_ROOT = config("STATIC_ROOT", default=str(BASE_DIR / "staticfiles"))
+
+# collectstatic writes content-hashed copies (css/dist/styles.3f2a1c.css)
+# with .gz and .br variants next to them; WhiteNoise serves the hashed files
+# with "Cache-Control: max-age=315360000, immutable". Needs collectstatic to
+# have run, so it's off while developing and testing.
+STATICFILES_MANIFEST = config(
+    "STATICFILES_MANIFEST", default=not DEBUG and not TESTING, cast=bool
+)
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {
+        "BACKEND": (
+            "whitenoise.storage.CompressedManifestStaticFilesStorage"
+            if STATICFILES_MANIFEST
+            else "django.contrib.staticfiles.storage.StaticFilesStorage"
+        )
+    },
+}
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
@@ -213,12 +383,52 @@ if DEBUG:
 # ==============================================================================
 
 AUTHENTICATION_BACKENDS = [
+    # Email + password login through the indexed LOWER(email) lookup
+    "users.backends.EmailBackend",
     # Needed to login by username in Django admin, regardless of allauth
     "django.contrib.auth.backends.ModelBackend",
     # allauth specific authentication methods, such as login by e-mail
     "allauth.account.auth_backends.AuthenticationBackend",
 ]
 
+# Cache the session user (joined with Profile and primary EmailAddress) for
+# this many seconds; 0 disables it. Entries are invalidated on every save.
+# The cached user includes the password hash, so only enable this with a
+# cache backend you trust with that data.
+USER_CACHE_TIMEOUT = config("USER_CACHE_TIMEOUT", default=0, cast=int)
+
+# Cache per-user template fragments ({% usercache %}, e.g. the dashboard body)
+# for this many seconds; 0 disables it. Entries are invalidated on every save,
+# so the timeout only bounds how stale "x minutes ago" texts can get.
+USER_FRAGMENT_CACHE_TIMEOUT = config("USER_FRAGMENT_CACHE_TIMEOUT", default=300, cast=int)
+
+# Members per page of the member directory
+DIRECTORY_PAGE_SIZE = config("DIRECTORY_PAGE_SIZE", default=24, cast=int)
+# Matches ranked per search; broader searches rank only the newest ones
+DIRECTORY_SEARCH_CANDIDATES = config(
+    "DIRECTORY_SEARCH_CANDIDATES", default=1000, cast=int
+)
+
+# Location autocomplete index, built by ``manage.py load_gazetteer``. Without
+# it, locations are plain free text.
+GAZETTEER_PATH = config("GAZETTEER_PATH", default=str(BASE_DIR / "gazetteer.idx"))
+# Suggestions shown per location prefix
+LOCATION_SUGGESTIONS = config("LOCATION_SUGGESTIONS", default=8, cast=int)
+
+# Security audit log (users/audit.py). Events are buffered per process and
+# written in one insert every AUDIT_FLUSH_INTERVAL seconds (must be > 0) or
+# once AUDIT_BUFFER_SIZE are waiting.
+AUDIT_BUFFER_SIZE = config("AUDIT_BUFFER_SIZE", default=200, cast=int)
+AUDIT_FLUSH_INTERVAL = config("AUDIT_FLUSH_INTERVAL", default=2.0, cast=float)
+# Off in tests, which write buffered events with audit.flush() themselves
+AUDIT_BACKGROUND_FLUSH = config(
+    "AUDIT_BACKGROUND_FLUSH", default=not TESTING, cast=bool
+)
+# Age in days at which purge_audit_events deletes events
+AUDIT_RETENTION_DAYS = config("AUDIT_RETENTION_DAYS", default=365, cast=int)
+# Events per page of the dashboard's activity timeline
+ACTIVITY_PAGE_SIZE = config("ACTIVITY_PAGE_SIZE", default=10, cast=int)
+
 # Django Allauth Settings (Updated for latest version)
 ACCOUNT_AUTHENTICATION_METHOD = config("ACCOUNT_AUTHENTICATION_METHOD", default="email")
 ACCOUNT_LOGIN_METHODS = {ACCOUNT_AUTHENTICATION_METHOD}
@@ -244,6 +454,30 @@ EMAIL_VERIFICATION_CODE_EXPIRY = config(
 EMAIL_VERIFICATION_COOLDOWN = config(
     "EMAIL_VERIFICATION_COOLDOWN", default=60, cast=int
 )  # in seconds
+EMAIL_VERIFICATION_MAX_ATTEMPTS = config(
+    "EMAIL_VERIFICATION_MAX_ATTEMPTS", default=5, cast=int
+)  # wrong guesses allowed per code
+
+# Rate Limiting
+# Rates look like "10/m", "100/h" or "5/15m"; an empty value disables a limit.
+# Counters live in the shared cache, so use a shared CACHE_BACKEND (e.g. redis)
+# when running more than one worker.
+RATELIMIT_ENABLED = config("RATELIMIT_ENABLED", default=True, cast=bool)
+RATELIMIT_CACHE_ALIAS = "shared"
+# Request header holding the client IP behind a proxy, e.g. HTTP_X_FORWARDED_FOR
+RATELIMIT_IP_HEADER = config("RATELIMIT_IP_HEADER", default="")
+RATELIMIT_LOGIN = config("RATELIMIT_LOGIN", default="20/m")  # per IP
+# Failed logins per email address and IP
+RATELIMIT_LOGIN_EMAIL = config("RATELIMIT_LOGIN_EMAIL", default="10/15m")
+RATELIMIT_SIGNUP = config("RATELIMIT_SIGNUP", default="10/h")  # per IP
+RATELIMIT_VERIFY_EMAIL = config("RATELIMIT_VERIFY_EMAIL", default="10/m")  # per user
+RATELIMIT_RESEND_VERIFICATION = config(
+    "RATELIMIT_RESEND_VERIFICATION", default="10/h"
+)  # per user
+RATELIMIT_DIRECTORY_SEARCH = config(
+    "RATELIMIT_DIRECTORY_SEARCH", default="120/m"
+)  # per user
+RATELIMIT_AVATAR_UPLOAD = config("RATELIMIT_AVATAR_UPLOAD", default="20/h")  # per user
 
 # Prevent login until email is verified
 ACCOUNT_EMAIL_CONFIRMATION_AUTHENTICATED_REDIRECT_URL = config(
@@ -296,13 +530,13 @@ SOCIALACCOUNT_EMAIL_AUTHENTICATION_AUTO_CONNECT = config(
 # EMAIL SETTINGS
 # ==============================================================================
 
-# Email backend configuration
+# Delivery backend configuration (the backend that actually sends mail)
 # Development: Use console backend (prints emails to console)
 # Production: Use SMTP backend with your email service
 if DEBUG:
-    EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
+    EMAIL_DELIVERY_BACKEND = "django.core.mail.backends.console.EmailBackend"
 else:
-    EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+    EMAIL_DELIVERY_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
     EMAIL_HOST = config("EMAIL_HOST", default="smtp.gmail.com")
     EMAIL_PORT = config("EMAIL_PORT", default=587, cast=int)
     EMAIL_USE_TLS = config("EMAIL_USE_TLS", default=True, cast=bool)
@@ -314,6 +548,28 @@ else:
 # Default "from" email for development
 DEFAULT_FROM_EMAIL = config("DEFAULT_FROM_EMAIL", default="noreply@localhost")
 
+# Outbound email queue
+# When enabled, send_mail() (including allauth's password reset and
+# confirmation emails) only writes to the outbox table and returns at once.
+# Run `python manage.py run_mail_worker` to deliver queued messages.
+EMAIL_QUEUE_ENABLED = config("EMAIL_QUEUE_ENABLED", default=not DEBUG, cast=bool)
+EMAIL_QUEUE_BATCH_SIZE = config("EMAIL_QUEUE_BATCH_SIZE", default=50, cast=int)
+EMAIL_QUEUE_POLL_INTERVAL = config("EMAIL_QUEUE_POLL_INTERVAL", default=2, cast=float)
+EMAIL_QUEUE_MAX_ATTEMPTS = config("EMAIL_QUEUE_MAX_ATTEMPTS", default=6, cast=int)
+EMAIL_QUEUE_RETRY_BACKOFF = config(
+    "EMAIL_QUEUE_RETRY_BACKOFF", default=30, cast=int
+)  # in seconds, doubled after each failed attempt
+EMAIL_QUEUE_RETRY_BACKOFF_MAX = config(
+    "EMAIL_QUEUE_RETRY_BACKOFF_MAX", default=3600, cast=int
+)  # in seconds
+# Age in days at which purge_outbound_email deletes sent and failed messages
+EMAIL_QUEUE_RETENTION_DAYS = config("EMAIL_QUEUE_RETENTION_DAYS", default=7, cast=int)
+
+if EMAIL_QUEUE_ENABLED:
+    EMAIL_BACKEND = "core.mail.QueuedEmailBackend"
+else:
+    EMAIL_BACKEND = EMAIL_DELIVERY_BACKEND
+
 STATICFILES_DIRS = [
     BASE_DIR / "static",  # your project-level static folder
 ]
@@ -322,6 +578,29 @@ STATICFILES_DIRS = [
 # SESSION CONFIGURATION
 # ==============================================================================
 
+# Session storage (set SESSION_BACKEND in .env):
+#   db (default)   - database table, one SELECT per request
+#   cached_db      - write-through cache in front of the database; reads hit
+#                    the cache, sessions survive a cache flush
+#   cache          - cache only; fastest, but sessions are lost on eviction
+#                    and need a shared CACHE_BACKEND (e.g. redis) with >1 worker
+#   signed_cookies - stored client-side in a signed cookie, no server storage
+# The db/cached_db/cache engines skip the backend write when a request didn't
+# actually change the session data. Expired database sessions are removed with:
+#   python manage.py purge_sessions
+SESSION_BACKEND = config("SESSION_BACKEND", default="db")
+
+if SESSION_BACKEND == "signed_cookies":
+    SESSION_ENGINE = "django.contrib.sessions.backends.signed_cookies"
+elif SESSION_BACKEND in ("cached_db", "cache"):
+    SESSION_ENGINE = f"core.session_backends.{SESSION_BACKEND}"
+else:
+    SESSION_ENGINE = "core.session_backends.db"
+
+# Sessions use the shared cache tier directly: an in-process L1 would serve
+# stale session data from other workers.
+SESSION_CACHE_ALIAS = "shared"
+
 # Session cookie age in seconds (default: 1209600 = 2 weeks)
 SESSION_COOKIE_AGE = config("SESSION_COOKIE_AGE", default=1209600, cast=int)
 
@@ -339,3 +618,94 @@ PROJECT_NAME = config(
 
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
+
+# Profile pictures (users/avatars.py): content-addressed files under
+# AVATAR_ROOT, rendered by AVATAR_WORKERS threads per process (0 renders on
+# the request thread).
+AVATAR_ROOT = config("AVATAR_ROOT", default=os.path.join(MEDIA_ROOT, "avatars"))
+AVATAR_WORKERS = config("AVATAR_WORKERS", default=2, cast=int)
+AVATAR_MAX_UPLOAD_SIZE = config(
+    "AVATAR_MAX_UPLOAD_SIZE", default=5 * 1024 * 1024, cast=int
+)  # bytes
+# Larger images are refused before anything is decoded.
+AVATAR_MAX_PIXELS = config("AVATAR_MAX_PIXELS", default=16_000_000, cast=int)
+
+# ==============================================================================
+# CACHE CONFIGURATION
+# ==============================================================================
+# Switch the shared cache by setting CACHE_BACKEND in .env
+#
+# locmem (default):
+#   - Per-process memory, not shared between workers
+#   - Fine for development
+#
+# file:
+#   - Shared by all workers on one host, stored in CACHE_LOCATION
+#
+# database:
+#   - Shared table in the main database
+#   - Create it once with: python manage.py createcachetable
+#
+# redis (production recommended):
+#   - Any Redis-protocol server (Redis, Valkey, KeyDB, ...)
+#   - Uses CACHE_LOCATION, falling back to REDIS_URL
+#   - Requires: pip install redis
+#
+# The "default" cache wraps the shared tier with an optional in-process L1
+# (CACHE_L1_MAX_ENTRIES > 0) and counts hits/misses, served at /metrics/.
+# Keys are prefixed with PROJECT_NAME and CACHE_VERSION; bump the version to
+# invalidate everything after an incompatible deploy.
+# ==============================================================================
+
+CACHE_BACKEND = config("CACHE_BACKEND", default="locmem")
+CACHE_TIMEOUT = config("CACHE_TIMEOUT", default=300, cast=int)  # in seconds
+CACHE_VERSION = config("CACHE_VERSION", default=1, cast=int)
+CACHE_L1_MAX_ENTRIES = config("CACHE_L1_MAX_ENTRIES", default=0, cast=int)
+CACHE_L1_TIMEOUT = config("CACHE_L1_TIMEOUT", default=5, cast=float)  # in seconds
+
+if CACHE_BACKEND == "redis":
+    SHARED_CACHE = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": config(
+            "CACHE_LOCATION",
+            default=config("REDIS_URL", default="redis://localhost:6379/0"),
+        ),
+    }
+elif CACHE_BACKEND == "database":
+    SHARED_CACHE = {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": config("CACHE_LOCATION", default="cache_table"),
+    }
+elif CACHE_BACKEND == "file":
+    SHARED_CACHE = {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": config("CACHE_LOCATION", default=str(BASE_DIR / ".django_cache")),
+    }
+else:
+    SHARED_CACHE = {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": PROJECT_NAME,
+    }
+
+SHARED_CACHE.update(
+    {
+        "TIMEOUT": CACHE_TIMEOUT,
+        "KEY_PREFIX": PROJECT_NAME,
+        "VERSION": CACHE_VERSION,
+    }
+)
+
+CACHES = {
+    "default": {
+        "BACKEND": "core.cache.TieredCache",
+        "LOCATION": "shared",
+        "OPTIONS": {
+            "L1_MAX_ENTRIES": CACHE_L1_MAX_ENTRIES,
+            "L1_TIMEOUT": CACHE_L1_TIMEOUT,
+        },
+    },
+    "shared": SHARED_CACHE,
+}
+
+# Bearer token that lets a metrics scraper read /metrics/ without a staff login
+METRICS_TOKEN = config("METRICS_TOKEN", default="")
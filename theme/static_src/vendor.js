@@ -0,0 +1,23 @@
+/**
+ * Copy the browser libraries used by theme/base*.html from node_modules into
+ * ../static/vendor, so pages don't depend on third-party CDNs. collectstatic
+ * then fingerprints and compresses them like the rest of the static files.
+ */
+const fs = require("fs");
+const path = require("path");
+
+const files = {
+  "htmx.org/dist/htmx.min.js": "htmx.min.js",
+  "alpinejs/dist/cdn.min.js": "alpine.min.js",
+  "toastify-js/src/toastify.js": "toastify.js",
+  "toastify-js/src/toastify.css": "toastify.css",
+};
+
+const outDir = path.join(__dirname, "..", "static", "vendor");
+fs.mkdirSync(outDir, { recursive: true });
+for (const [source, target] of Object.entries(files)) {
+  fs.copyFileSync(
+    path.join(__dirname, "node_modules", source),
+    path.join(outDir, target)
+  );
+}
@@ -0,0 +1,171 @@
+"""
+Security audit log: logins, failed logins, password changes, email
+verification and account deletion requests.
+
+``record()`` appends an unsaved ``AuditEvent`` to a per-process buffer, and
+a background thread writes the buffer with a single ``bulk_create`` every
+AUDIT_FLUSH_INTERVAL seconds, as soon as it holds AUDIT_BUFFER_SIZE events,
+and once more when the process exits. With AUDIT_BACKGROUND_FLUSH off (the
+default in tests) events wait for ``flush()``, except that the ``record()``
+call that fills the buffer writes it. Failed logins are recorded with the
+email that was tried; the flush resolves them to users with one query for
+the whole batch.
+
+Events show up in the timeline up to AUDIT_FLUSH_INTERVAL seconds late,
+and a process killed without a chance to run its exit handlers (SIGKILL,
+OOM) loses the events it still buffers.
+"""
+
+import atexit
+import ipaddress
+import logging
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Q
+
+from core import metrics
+from core.ratelimit import client_ip
+
+from .backends import EmailKey, UserModel
+from .models import AuditEvent
+
+logger = logging.getLogger(__name__)
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+
+class AuditBuffer:
+    """Events waiting to be written, and the thread that writes them."""
+
+    def __init__(self):
+        self.events = []
+        self.lock = threading.Lock()
+        self.full = threading.Event()
+        self.thread = None
+        self.pid = None
+
+    def add(self, event):
+        with self.lock:
+            if self.pid != os.getpid():
+                # A forked worker must not write its parent's events again,
+                # nor count on its parent's thread.
+                self.events = []
+                self.pid = os.getpid()
+                self.thread = None
+                if settings.AUDIT_BACKGROUND_FLUSH:
+                    self.thread = threading.Thread(
+                        target=self.run, name="audit-flush", daemon=True
+                    )
+                    self.thread.start()
+                    atexit.register(self.flush)
+            self.events.append(event)
+            full = len(self.events) >= settings.AUDIT_BUFFER_SIZE
+        if full:
+            if self.thread is None:
+                # Nothing else writes the buffer: don't let it grow.
+                self.flush()
+            else:
+                self.full.set()
+
+    def run(self):
+        while True:
+            self.full.wait(settings.AUDIT_FLUSH_INTERVAL)
+            self.full.clear()
+            # The thread keeps its connection between flushes, closed like a
+            # request's when it is too old or broken.
+            close_old_connections()
+            self.flush()
+
+    def flush(self):
+        """Write the buffered events; returns how many were written."""
+        with self.lock:
+            events, self.events = self.events, []
+        if not events:
+            return 0
+        try:
+            resolve_failed_logins(events)
+            AuditEvent.objects.bulk_create(events, batch_size=500)
+        except Exception:
+            logger.exception("Could not write %d audit events", len(events))
+            metrics.inc("audit_events_dropped_total", len(events))
+            return 0
+        metrics.inc("audit_events_written_total", len(events))
+        return len(events)
+
+
+_buffer = AuditBuffer()
+
+
+def flush():
+    """Write this process's buffered events now."""
+    return _buffer.flush()
+
+
+def resolve_failed_logins(events):
+    unresolved = [event for event in events if event.user_id is None and event.email]
+    if not unresolved:
+        return
+    keys = {event.email.lower() for event in unresolved}
+    users = dict(
+        UserModel._default_manager.annotate(email_key=EmailKey("email"))
+        .filter(email_key__in=keys)
+        .values_list("email_key", "pk")
+    )
+    for event in unresolved:
+        event.user_id = users.get(event.email.lower())
+
+
+def _ip(request):
+    # The address may come from a proxy header; an invalid one would fail
+    # the whole batch on PostgreSQL's inet column.
+    try:
+        return str(ipaddress.ip_address(client_ip(request)))
+    except ValueError:
+        return None
+
+
+def record(kind, request=None, user=None, email=""):
+    """Buffer an event for ``user``, or for whoever uses ``email``."""
+    event = AuditEvent(
+        kind=kind,
+        user_id=getattr(user, "pk", None),
+        email="" if user is not None else email[:254],
+    )
+    if request is not None:
+        event.ip = _ip(request)
+        event.user_agent = request.headers.get("User-Agent", "")[:200]
+    _buffer.add(event)
+
+
+def timeline(user_id, size, after=None):
+    """
+    Return a page of the user's events, newest first, and the next cursor.
+
+    Pages are keyed on ``(created_at, id)`` so each one is a range scan of
+    ``users_audit_user_time_idx`` however deep it is. The cursor is
+    ``<microseconds since the epoch>_<id>``; a malformed one starts from the
+    top.
+    """
+    events = AuditEvent.objects.filter(user_id=user_id)
+    micros, _, pk = (after or "").partition("_")
+    try:
+        created_at, pk = EPOCH + int(micros) * MICROSECOND, int(pk)
+    except (ValueError, OverflowError):
+        pass
+    else:
+        # The first condition alone bounds the index range; the second
+        # skips the rows of the previous page that share its last timestamp.
+        events = events.filter(created_at__lte=created_at).filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk)
+        )
+    items = list(events.order_by("-created_at", "-pk")[: size + 1])
+    if len(items) <= size:
+        return items, None
+    items = items[:size]
+    last = items[-1]
+    return items, f"{(last.created_at - EPOCH) // MICROSECOND}_{last.pk}"
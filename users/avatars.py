@@ -0,0 +1,274 @@
+"""
+Profile pictures in content-addressed storage.
+
+An upload is streamed to a temporary file in 64 KiB chunks by
+``AvatarUploadHandler``, which hashes it on the way, so no upload is ever
+held in memory. The SHA-256 of the file names its directory under
+AVATAR_ROOT::
+
+    <digest[:2]>/<digest>/original
+    <digest[:2]>/<digest>/<size>.webp, <size>.jpg   for each of SIZES
+
+Identical uploads share one directory and are rendered once. Rendering
+(decoding, cropping and resizing) runs in a per-process thread pool of
+AVATAR_WORKERS threads: the request only stores the original and records
+it as ``Profile.avatar_pending``, and the job moves it to
+``Profile.avatar`` when the sizes are written. Files are never changed once
+written, so ``AvatarImageView`` serves them as immutable.
+
+Replaced avatars stay on disk until ``manage.py process_avatars`` deletes
+the directories no profile refers to.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.move import file_move_safe
+from django.core.files.uploadhandler import SkipFile, TemporaryFileUploadHandler
+from django.db import close_old_connections, transaction
+from PIL import Image, ImageOps
+
+from core import metrics
+
+from .cache import bump_user_version
+from .models import Profile
+
+logger = logging.getLogger(__name__)
+
+DIGEST = re.compile(r"[0-9a-f]{64}")
+ORIGINAL = "original"
+# Square sizes rendered for every avatar; templates ask for 1x and 2x.
+SIZES = (64, 128, 256)
+# extension: (Pillow format, content type, save options)
+FORMATS = {
+    "webp": ("WEBP", "image/webp", {"quality": 80, "method": 4}),
+    "jpg": ("JPEG", "image/jpeg", {"quality": 85, "optimize": True}),
+}
+UPLOAD_FORMATS = {"JPEG", "PNG", "WEBP", "GIF"}
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+class AvatarUploadHandler(TemporaryFileUploadHandler):
+    """
+    Stream uploaded files to disk, hashing them chunk by chunk.
+
+    The file gets a ``sha256`` attribute. Files larger than
+    AVATAR_MAX_UPLOAD_SIZE are dropped as soon as they exceed it.
+    """
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.sha256 = hashlib.sha256()
+        self.received = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.received > settings.AVATAR_MAX_UPLOAD_SIZE:
+            self.file.close()
+            raise SkipFile
+        self.sha256.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        file = super().file_complete(file_size)
+        file.sha256 = self.sha256.hexdigest()
+        return file
+
+
+def avatar_directory(digest):
+    return os.path.join(settings.AVATAR_ROOT, digest[:2], digest)
+
+
+def image_path(digest, size, extension):
+    return os.path.join(avatar_directory(digest), f"{size}.{extension}")
+
+
+def is_rendered(digest):
+    # The largest JPEG is written last.
+    return os.path.exists(image_path(digest, SIZES[-1], "jpg"))
+
+
+def check_image(path):
+    """
+    Raise ValueError unless ``path`` is an image we can render.
+
+    Only the header is read; nothing is decoded.
+    """
+    try:
+        with Image.open(path) as image:
+            if image.format not in UPLOAD_FORMATS:
+                raise ValueError("Upload a JPEG, PNG, WebP or GIF image.")
+            if image.width * image.height > settings.AVATAR_MAX_PIXELS:
+                raise ValueError("This image has too many pixels.")
+    except (OSError, Image.DecompressionBombError):
+        raise ValueError("Upload a JPEG, PNG, WebP or GIF image.")
+
+
+def store_upload(uploaded):
+    """
+    Move a file received by AvatarUploadHandler into the store.
+
+    Returns its digest. Nothing is copied if the store already has it.
+    """
+    digest = uploaded.sha256
+    original = os.path.join(avatar_directory(digest), ORIGINAL)
+    if os.path.exists(original):
+        uploaded.close()
+        # Tells process_avatars the directory is in use again.
+        os.utime(avatar_directory(digest))
+    else:
+        os.makedirs(avatar_directory(digest), exist_ok=True)
+        file_move_safe(uploaded.temporary_file_path(), original, allow_overwrite=True)
+    return digest
+
+
+def _write(image, path, format, options):
+    # Readers never see a half-written file.
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            image.save(f, format, **options)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def render(digest):
+    """Write every size and format of an avatar from its original."""
+    largest = SIZES[-1]
+    with Image.open(os.path.join(avatar_directory(digest), ORIGINAL)) as original:
+        # JPEGs are decoded at the smallest scale (down to 1/8) that still
+        # covers the largest size, which saves most of the memory and time.
+        original.draft("RGB", (largest, largest))
+        image = original
+        if image.mode not in ("RGB", "RGBA", "L", "LA"):
+            alpha = "A" in image.mode or "transparency" in image.info
+            image = image.convert("RGBA" if alpha else "RGB")
+        # Other formats are decoded in full: shrink them by an integer factor
+        # before anything copies them.
+        factor = min(image.size) // largest
+        if factor > 1:
+            image = image.reduce(factor)
+        image = ImageOps.exif_transpose(image)
+        if image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info:
+            image = image.convert("RGBA")
+            background = Image.new("RGB", image.size, "white")
+            background.paste(image, mask=image.getchannel("A"))
+            image = background
+        image = ImageOps.fit(
+            image.convert("RGB"), (largest, largest), Image.Resampling.LANCZOS
+        )
+    for size in SIZES:
+        resized = image
+        if size != largest:
+            resized = image.resize((size, size), Image.Resampling.LANCZOS)
+        for extension, (format, _, options) in FORMATS.items():
+            _write(resized, image_path(digest, size, extension), format, options)
+
+
+def render_or_discard(digest):
+    """
+    Render an avatar unless that's done already, and say if it is rendered.
+
+    A file that can't be rendered is deleted.
+    """
+    if is_rendered(digest):
+        return True
+    start = time.perf_counter()
+    try:
+        render(digest)
+    except Exception:
+        logger.exception("Could not render avatar %s", digest)
+        shutil.rmtree(avatar_directory(digest), ignore_errors=True)
+        metrics.inc("avatar_render_failed_total")
+        return False
+    metrics.observe("avatar_render_ms", (time.perf_counter() - start) * 1000)
+    return True
+
+
+def process_avatar(digest, profile_id):
+    """
+    Render a pending avatar, then make it the profile's avatar.
+
+    Does nothing to the profile if it has moved on to another upload in the
+    meantime.
+    """
+    changes = {"avatar_pending": ""}
+    if render_or_discard(digest):
+        changes["avatar"] = digest
+    profile = Profile.objects.filter(pk=profile_id, avatar_pending=digest)
+    user_id = profile.values_list("user_id", flat=True).first()
+    if user_id is not None and profile.update(**changes):
+        bump_user_version(user_id)
+
+
+def _run_job(digest, profile_id):
+    # Pool threads keep a database connection of their own between jobs,
+    # closed like a request's when it is too old or broken.
+    close_old_connections()
+    try:
+        process_avatar(digest, profile_id)
+    except Exception:
+        # The pool would keep the error in a future nobody reads.
+        logger.exception("Avatar job for profile %s failed", profile_id)
+    finally:
+        close_old_connections()
+
+
+def get_pool():
+    """Return this process's rendering pool, creating it once."""
+    global _pool, _pool_pid
+    with _pool_lock:
+        # A forked worker must not reuse its parent's threads.
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = ThreadPoolExecutor(
+                max_workers=settings.AVATAR_WORKERS, thread_name_prefix="avatar"
+            )
+            _pool_pid = os.getpid()
+        return _pool
+
+
+def set_avatar(profile, uploaded):
+    """
+    Store an upload and make it ``profile``'s avatar, now or once rendered.
+
+    Rendering is queued after the transaction commits. With
+    AVATAR_WORKERS=0 it runs right away instead, and ValueError is raised
+    if the image can't be rendered.
+    """
+    digest = store_upload(uploaded)
+    if settings.AVATAR_WORKERS and not is_rendered(digest):
+        profile.avatar_pending = digest
+        profile.save(update_fields=["avatar_pending"])
+        transaction.on_commit(lambda: get_pool().submit(_run_job, digest, profile.pk))
+        return
+    if not render_or_discard(digest):
+        raise ValueError("This image could not be read.")
+    profile.avatar, profile.avatar_pending = digest, ""
+    profile.save(update_fields=["avatar", "avatar_pending"])
+
+
+def stored_digests():
+    """Yield the digests of every avatar directory in the store."""
+    root = settings.AVATAR_ROOT
+    if not os.path.isdir(root):
+        return
+    for prefix in sorted(os.listdir(root)):
+        prefix_path = os.path.join(root, prefix)
+        if len(prefix) == 2 and os.path.isdir(prefix_path):
+            for digest in sorted(os.listdir(prefix_path)):
+                if DIGEST.fullmatch(digest) and digest[:2] == prefix:
+                    yield digest
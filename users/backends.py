@@ -0,0 +1,153 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.exceptions import PermissionDenied
+from django.db.models import F, FilteredRelation, Func, Q, Value
+from django.db.models.functions import Lower
+
+from .cache import get_cached_user
+
+UserModel = get_user_model()
+
+ALLAUTH_BACKEND = "allauth.account.auth_backends.AuthenticationBackend"
+
+
+class EmailKey(Func):
+    """
+    ``LOWER(NULLIF(email, ''))`` -- the expression indexed by users/0002.
+
+    The empty string is inlined rather than passed as a parameter so the
+    compiled SQL matches the index expression exactly and the planner can
+    use it. Blank emails map to NULL and stay out of the uniqueness check.
+    """
+
+    template = "LOWER(NULLIF(%(expressions)s, ''))"
+
+
+def users_by_email(email):
+    """
+    Return a queryset of users whose email matches ``email`` case-insensitively.
+
+    Both sides are lowered by the database so the lookup is answered by the
+    functional index added in ``users/migrations/0002``.
+    """
+    return UserModel._default_manager.alias(email_key=EmailKey("email")).filter(
+        email_key=Lower(Value(email))
+    )
+
+
+def users_with_related(queryset=None):
+    """
+    Users joined with their Profile and primary EmailAddress in one query.
+
+    The primary address is exposed as ``user.primary_email``; use
+    ``primary_email_address()`` to read it. select_related leaves that
+    attribute unset when the join finds no row, so ``primary_email_pk`` is
+    annotated too: None there means the user has no primary address. Pass
+    ``queryset`` to join onto a queryset of users other than all of them.
+    """
+    if queryset is None:
+        queryset = UserModel._default_manager.all()
+    return (
+        queryset.annotate(
+            primary_email=FilteredRelation(
+                "emailaddress", condition=Q(emailaddress__primary=True)
+            )
+        )
+        .annotate(primary_email_pk=F("primary_email__pk"))
+        .select_related("profile", "primary_email")
+    )
+
+
+def load_user(user_id):
+    user = users_with_related().filter(pk=user_id).first()
+    if user is not None and not hasattr(user, "primary_email"):
+        # select_related leaves the attribute unset when the join found no row.
+        user.primary_email = None
+    return user
+
+
+def primary_email_address(user):
+    """
+    Return the user's primary EmailAddress, without a query for users loaded
+    by ``users_with_related()``.
+    """
+    if hasattr(user, "primary_email"):
+        return user.primary_email
+    if hasattr(user, "primary_email_pk"):
+        # Annotated, and the join found no primary address.
+        return None
+    return user.emailaddress_set.filter(primary=True).first()
+
+
+def must_mitigate_timing():
+    """
+    Whether EmailBackend must hash the password of a nonexistent user.
+
+    Running the hasher once reduces the timing difference between an existing
+    and a nonexistent user. allauth's backend, asked next for an unknown email,
+    already does that.
+    """
+    return ALLAUTH_BACKEND not in settings.AUTHENTICATION_BACKENDS
+
+
+class EmailBackend(ModelBackend):
+    """
+    Authenticate with an email address and password.
+
+    Resolves the user in a single indexed query instead of looking the user up
+    by email and then again by username through ModelBackend. Sessions
+    created through this backend load the user together with the Profile and
+    primary EmailAddress (optionally from the cache tier).
+
+    A wrong password for an existing account raises PermissionDenied, which
+    ``authenticate()`` reports as a failed login without asking the other
+    backends, so each attempt costs one hash. Inactive users still fall
+    through to allauth, which shows them the "account inactive" page.
+    """
+
+    def authenticate(self, request, email=None, password=None, **kwargs):
+        if email is None or password is None:
+            return None
+        try:
+            user = users_by_email(email).get()
+        except UserModel.DoesNotExist:
+            if must_mitigate_timing():
+                UserModel().set_password(password)
+            return None
+        except UserModel.MultipleObjectsReturned:
+            return None
+        if not user.check_password(password):
+            # Stop the backend chain: allauth's backend would look the email
+            # up again and hash the password a second time.
+            raise PermissionDenied
+        return user if self.user_can_authenticate(user) else None
+
+    async def aauthenticate(self, request, email=None, password=None, **kwargs):
+        if email is None or password is None:
+            return None
+        try:
+            user = await users_by_email(email).aget()
+        except UserModel.DoesNotExist:
+            if must_mitigate_timing():
+                set_password = UserModel().set_password
+                await sync_to_async(set_password, thread_sensitive=False)(password)
+            return None
+        except UserModel.MultipleObjectsReturned:
+            return None
+        # Hashing is CPU-bound; keep it off the event loop, and off the one
+        # thread shared by every sync ORM call so logins hash in parallel.
+        # A rehashed password is saved over that thread's own connection.
+        check_password = sync_to_async(user.check_password, thread_sensitive=False)
+        if not await check_password(password):
+            raise PermissionDenied
+        return user if self.user_can_authenticate(user) else None
+
+    def get_user(self, user_id):
+        user = get_cached_user(user_id, load_user)
+        return user if user is not None and self.user_can_authenticate(user) else None
+
+    async def aget_user(self, user_id):
+        # ModelBackend.aget_user() would skip the joined load and the cache.
+        return await sync_to_async(self.get_user)(user_id)
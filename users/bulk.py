@@ -0,0 +1,329 @@
+"""
+Streaming bulk import and export of user accounts.
+
+Rows are read and written through generators, so memory use is bounded by
+the batch size rather than the file size. One row holds a user together
+with their Profile and primary EmailAddress; the columns are ``FIELDS``.
+
+Imports take passwords already hashed in Django's ``<algorithm>$...``
+format (e.g. an ``export_users`` dump or hashes converted from another
+system), so loading millions of accounts costs no hashing. Rows without a
+password get an unusable one; those users sign in by resetting it. Hashes
+using a weaker hasher than the current one are upgraded at first login.
+
+``bulk_create`` doesn't send ``post_save``, so profiles and email addresses
+are created here instead of by ``users/signals.py``.
+"""
+
+import csv
+import io
+import json
+from datetime import timezone as dt_timezone
+from itertools import islice
+
+from allauth.account.models import EmailAddress
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .backends import EmailKey, users_with_related
+from .models import Profile
+
+User = get_user_model()
+
+FIELDS = [
+    "email",
+    "password",
+    "first_name",
+    "last_name",
+    "is_active",
+    "date_joined",
+    "email_verified",
+    "bio",
+    "location",
+    "birth_date",
+]
+
+TRUE_VALUES = {"1", "true", "yes", "y", "t"}
+
+# Times a batch is retried after losing a race with a concurrent signup.
+IMPORT_ATTEMPTS = 3
+
+
+class InvalidRow(ValueError):
+    pass
+
+
+def batched(iterable, size):
+    """Yield lists of up to ``size`` items from ``iterable``."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+# ---------------------------
+#   Reading and writing
+# ---------------------------
+
+
+def read_rows(stream, fmt):
+    """Yield one dict per record of a CSV (with header) or JSONL stream."""
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+    else:
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+
+
+class RowWriter:
+    """Write row dicts to ``stream`` as CSV (with header) or JSONL."""
+
+    def __init__(self, stream, fmt, fields=FIELDS):
+        self.stream = stream
+        self.fmt = fmt
+        self.fields = fields
+        if fmt == "csv":
+            self.csv = csv.DictWriter(stream, fieldnames=fields, extrasaction="ignore")
+            self.csv.writeheader()
+
+    def write(self, row):
+        if self.fmt == "csv":
+            self.csv.writerow(row)
+        else:
+            row = {field: row[field] for field in self.fields}
+            self.stream.write(json.dumps(row, default=str) + "\n")
+
+
+# ---------------------------
+#   Import
+# ---------------------------
+
+
+def _flag(value, default):
+    if value in (None, ""):
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in TRUE_VALUES
+
+
+def _text(row, field, max_length=None):
+    value = row.get(field) or ""
+    value = str(value).strip()
+    if max_length and len(value) > max_length:
+        raise InvalidRow(f"{field} is longer than {max_length} characters")
+    return value
+
+
+def build_objects(row):
+    """
+    Validate one input row and return unsaved ``(user, profile, email_address)``.
+
+    Raises InvalidRow with the reason if the row can't be imported.
+    """
+    email = _text(row, "email")
+    try:
+        validate_email(email)
+    except ValidationError:
+        raise InvalidRow(f"invalid email {email!r}")
+    # The email doubles as the username, as in EmailSignupForm.
+    if len(email) > User._meta.get_field("username").max_length:
+        raise InvalidRow("email is too long to be used as username")
+
+    password = _text(row, "password")
+    if password:
+        try:
+            identify_hasher(password)
+        except ValueError:
+            raise InvalidRow("password is not a recognised Django password hash")
+    else:
+        password = make_password(None)
+
+    date_joined = timezone.now()
+    if row.get("date_joined"):
+        date_joined = parse_datetime(str(row["date_joined"]))
+        if date_joined is None:
+            raise InvalidRow(f"invalid date_joined {row['date_joined']!r}")
+        if timezone.is_naive(date_joined):
+            date_joined = timezone.make_aware(date_joined, dt_timezone.utc)
+
+    birth_date = None
+    if row.get("birth_date"):
+        birth_date = parse_date(str(row["birth_date"]))
+        if birth_date is None:
+            raise InvalidRow(f"invalid birth_date {row['birth_date']!r}")
+
+    user = User(
+        username=email,
+        email=email,
+        password=password,
+        first_name=_text(row, "first_name", 150),
+        last_name=_text(row, "last_name", 150),
+        is_active=_flag(row.get("is_active"), True),
+        date_joined=date_joined,
+    )
+    location = _text(row, "location", Profile._meta.get_field("location").max_length)
+    profile = Profile(
+        bio=_text(row, "bio"),
+        location=location,
+        # bulk_create doesn't call save()
+        location_normalized=Profile.location_key(location),
+        birth_date=birth_date,
+    )
+    email_address = EmailAddress(
+        email=email, primary=True, verified=_flag(row.get("email_verified"), False)
+    )
+    return user, profile, email_address
+
+
+def existing_email_keys(emails):
+    """
+    Return the lowercased emails among ``emails`` that already belong to a
+    user, as their email or as one of their EmailAddresses.
+    """
+    keys = [email.lower() for email in emails]
+    existing = set(
+        User._default_manager.annotate(email_key=EmailKey("email"))
+        .filter(email_key__in=keys)
+        .values_list("email_key", flat=True)
+    )
+    existing.update(
+        EmailAddress.objects.annotate(email_key=Lower("email"))
+        .filter(email_key__in=keys)
+        .values_list("email_key", flat=True)
+    )
+    return existing
+
+
+def taken_usernames(usernames):
+    """Return the usernames among ``usernames`` that a user already has."""
+    return set(
+        User._default_manager.filter(username__in=usernames).values_list(
+            "username", flat=True
+        )
+    )
+
+
+def import_batch(rows):
+    """
+    Import one batch of rows in a single transaction.
+
+    Returns ``(created, duplicates, errors)`` where ``errors`` is a list of
+    ``(row_index_in_batch, reason)``. Emails already in the database or
+    earlier in the batch count as duplicates. Rows whose email is another
+    user's username are errors.
+    """
+    candidates = []
+    invalid = []
+    for index, row in enumerate(rows):
+        try:
+            candidates.append((index, build_objects(row)))
+        except InvalidRow as e:
+            invalid.append((index, str(e)))
+
+    for attempt in range(IMPORT_ATTEMPTS):
+        users = [objects[0] for _, objects in candidates]
+        existing = existing_email_keys([user.email for user in users])
+        taken = taken_usernames([user.username for user in users])
+        errors = list(invalid)
+        seen = set()
+        new = []
+        for index, objects in candidates:
+            user = objects[0]
+            key = user.email.lower()
+            if key in existing or key in seen:
+                continue
+            if user.username in taken:
+                errors.append((index, f"username {user.username!r} is taken"))
+                continue
+            seen.add(key)
+            new.append(objects)
+        errors.sort()
+        try:
+            with transaction.atomic():
+                users = User.objects.bulk_create([user for user, _, _ in new])
+                for user, (_, profile, email_address) in zip(users, new):
+                    profile.user = user
+                    email_address.user = user
+                Profile.objects.bulk_create([profile for _, profile, _ in new])
+                EmailAddress.objects.bulk_create([address for _, _, address in new])
+        except IntegrityError:
+            # Someone may have signed up with one of these emails after the
+            # check; look again and retry without them.
+            if attempt == IMPORT_ATTEMPTS - 1:
+                raise
+            # Forget the primary keys assigned by the rolled-back inserts.
+            for objects in new:
+                for obj in objects:
+                    obj.pk = None
+                    obj._state.adding = True
+        else:
+            duplicates = len(candidates) - len(new) - (len(errors) - len(invalid))
+            return len(new), duplicates, errors
+
+
+# ---------------------------
+#   Export
+# ---------------------------
+
+
+def export_rows(batch_size, queryset=None):
+    """
+    Yield one row dict per user, ordered by primary key.
+
+    Pages through the table by keyset (``pk > last_pk``), so each batch is an
+    index range scan no matter how far the export has got. ``queryset``
+    limits the export and must come from ``users_with_related()``.
+    """
+    if queryset is None:
+        queryset = users_with_related()
+    last_pk = 0
+    while True:
+        batch = list(queryset.filter(pk__gt=last_pk).order_by("pk")[:batch_size])
+        for user in batch:
+            profile = getattr(user, "profile", None)
+            email_address = getattr(user, "primary_email", None)
+            yield {
+                "email": user.email,
+                "password": user.password,
+                "first_name": user.first_name,
+                "last_name": user.last_name,
+                "is_active": user.is_active,
+                "date_joined": user.date_joined.isoformat(),
+                "email_verified": bool(email_address and email_address.verified),
+                "bio": profile.bio if profile else "",
+                "location": profile.location if profile else "",
+                "birth_date": (
+                    profile.birth_date.isoformat()
+                    if profile and profile.birth_date
+                    else ""
+                ),
+            }
+        if len(batch) < batch_size:
+            return
+        last_pk = batch[-1].pk
+
+
+def iter_export(queryset=None, fmt="csv", fields=FIELDS, batch_size=1000):
+    """
+    Yield the export as text chunks of ``batch_size`` rows.
+
+    For streaming responses: only one batch is held in memory at a time.
+    """
+    buffer = io.StringIO()
+    writer = RowWriter(buffer, fmt, fields)
+    for batch in batched(export_rows(batch_size, queryset), batch_size):
+        for row in batch:
+            writer.write(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # An export without rows is just the CSV header.
+    if buffer.tell():
+        yield buffer.getvalue()
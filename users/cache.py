@@ -0,0 +1,65 @@
+"""
+Per-user cache versioning.
+
+Every user has a version number in the shared cache that is bumped whenever
+their User, Profile or EmailAddress rows change (see ``users/signals.py``).
+Cache entries derived from that data embed the version in their key, so an
+edit makes them unreachable at once instead of waiting for a TTL.
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+def _version_cache():
+    # Versions must be coherent across workers, so skip the in-process L1.
+    return caches["shared"]
+
+
+def _version_key(user_id):
+    return f"users:version:{user_id}"
+
+
+def get_user_version(user_id):
+    """Return the user's current cache version, initialising it if needed."""
+    cache = _version_cache()
+    version = cache.get(_version_key(user_id))
+    if version is None:
+        # Seed from the clock so a version lost to eviction never reuses a
+        # number that older entries were stored under.
+        cache.add(_version_key(user_id), time.time_ns(), timeout=None)
+        version = cache.get(_version_key(user_id))
+    return version
+
+
+def bump_user_version(user_id):
+    """Invalidate every versioned cache entry for the user."""
+    cache = _version_cache()
+    try:
+        cache.incr(_version_key(user_id))
+    except ValueError:
+        cache.set(_version_key(user_id), time.time_ns(), timeout=None)
+
+
+def get_cached_user(user_id, loader):
+    """
+    Return ``loader(user_id)``, cached for USER_CACHE_TIMEOUT seconds.
+
+    Caching is off when USER_CACHE_TIMEOUT is 0. The cached object includes
+    the password hash (needed to verify the session), so only enable it on a
+    cache backend you trust with that data.
+    """
+    timeout = settings.USER_CACHE_TIMEOUT
+    if not timeout:
+        return loader(user_id)
+
+    cache = caches["default"]
+    key = f"users:user:{user_id}:{get_user_version(user_id)}"
+    user = cache.get(key)
+    if user is None:
+        user = loader(user_id)
+        if user is not None:
+            cache.set(key, user, timeout)
+    return user
@@ -0,0 +1,294 @@
+"""
+Two-phase account deletion.
+
+``user.delete()`` makes Django's collector load every related object
+(profile, email addresses, social accounts, admin log entries, ...) and
+delete them one by one, which can take seconds and hold locks inside the
+request. Instead:
+
+1. ``request_account_deletion()`` deactivates the user and records an
+   ``AccountDeletion``. Inactive users can't log in, and their other
+   sessions stop authenticating on their next request.
+2. ``purge_deleted_accounts`` claims pending records and calls
+   ``purge_account()``. It deletes the related rows table by table in
+   batched raw DELETEs (children first) and then the user row itself.
+   Progress is saved on the record after each batch. A failed purge is
+   retried, and rerunning it just continues with the rows that are left.
+   The user's queued emails and database sessions are deleted as well.
+
+Reactivating the user before the purge cancels it.
+"""
+
+import logging
+from datetime import timedelta
+from email.utils import parseaddr
+from importlib import import_module
+
+from allauth.account.models import EmailAddress
+from django.conf import settings
+from django.contrib.auth import SESSION_KEY, get_user_model
+from django.db import models, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from core.batching import delete_in_batches
+from core.models import OutboundEmail
+
+from . import audit
+from .cache import bump_user_version
+from .models import AccountDeletion, AuditEvent
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+# A claimed deletion is retried by another worker after this long.
+CLAIM_LEASE = timedelta(minutes=10)
+MAX_ATTEMPTS = 5
+
+
+def request_account_deletion(user, request=None):
+    """
+    Deactivate ``user`` now and queue the purge of their data.
+
+    ``request`` is the user's own request, if it comes from them; it is
+    recorded in the audit log.
+    """
+    with transaction.atomic():
+        User._default_manager.filter(pk=user.pk).update(is_active=False)
+        AccountDeletion.objects.update_or_create(
+            user_id=user.pk,
+            defaults={
+                "status": AccountDeletion.Status.PENDING,
+                "next_attempt_at": timezone.now(),
+            },
+        )
+        # Written now, with the deletion, rather than by the flush thread
+        # after a purge may already have removed the user's events.
+        audit.record(AuditEvent.Kind.DELETION_REQUESTED, request, user)
+        audit.flush()
+    # update() sends no signals; drop cached copies of the active user.
+    bump_user_version(user.pk)
+
+
+def _m2m_querysets(model, lookup, user_id):
+    # Auto-created through tables have no relations of their own; custom
+    # ones are reached through their foreign keys like any other model.
+    querysets = []
+    for field in model._meta.many_to_many:
+        through = field.remote_field.through
+        if through._meta.auto_created:
+            name = field.m2m_field_name()
+            querysets.append(
+                through._base_manager.filter(**{f"{name}__{lookup}": user_id})
+            )
+    for rel in model._meta.related_objects:
+        if rel.many_to_many and rel.through._meta.auto_created:
+            name = rel.field.m2m_reverse_field_name()
+            querysets.append(
+                rel.through._base_manager.filter(**{f"{name}__{lookup}": user_id})
+            )
+    return querysets
+
+
+def _cascade(rel, lookup, user_id, path):
+    """
+    Return querysets for the rows that reach the user through ``rel``,
+    children first, or None when they can't be deleted raw: the relation (or
+    one below it) isn't CASCADE, or loops back to a model above it.
+    """
+    model = rel.related_model
+    if rel.on_delete is not models.CASCADE or model in path:
+        return None
+    lookup = f"{rel.field.name}__{lookup}"
+    querysets = []
+    for child in model._meta.related_objects:
+        if child.many_to_many:
+            continue
+        child_querysets = _cascade(child, lookup, user_id, path + (model,))
+        if child_querysets is None:
+            return None
+        querysets += child_querysets
+    querysets += _m2m_querysets(model, lookup, user_id)
+    querysets.append(model._base_manager.filter(**{lookup: user_id}))
+    return querysets
+
+
+def related_querysets(user_id):
+    """
+    Return querysets of the user's rows, in an order safe for raw deletes.
+
+    The list follows every CASCADE relation to User, so models that gain a
+    foreign key to it later are purged too. Relations that can't be deleted
+    raw (SET_NULL, PROTECT, ...) are left to the collector that deletes the
+    user row at the end.
+    """
+    querysets = [
+        # Not foreign keys: audit events outlive their user until purged, and
+        # queued messages name their recipients by address.
+        AuditEvent.objects.filter(user_id=user_id),
+        OutboundEmail.objects.filter(pk__in=outbound_email_pks(user_id)),
+    ]
+    for rel in User._meta.related_objects:
+        if not rel.many_to_many:
+            querysets += _cascade(rel, "pk", user_id, (User,)) or []
+    querysets += _m2m_querysets(User, "pk", user_id)
+    return querysets
+
+
+def outbound_email_pks(user_id):
+    """Return the pks of the outbox rows addressed to any of the user's emails."""
+    addresses = set(
+        EmailAddress.objects.filter(user_id=user_id).values_list("email", flat=True)
+    )
+    addresses.update(
+        User._default_manager.filter(pk=user_id).values_list("email", flat=True)
+    )
+    addresses = {address.lower() for address in addresses if address}
+    if not addresses:
+        return []
+    # The recipient lists are JSON, so the lookup only narrows down the
+    # candidates; the exact match is made here.
+    query = Q()
+    for address in addresses:
+        for field in ("to", "cc", "bcc"):
+            query |= Q(**{f"{field}__icontains": address})
+    pks = []
+    for pk, *recipients in OutboundEmail.objects.filter(query).values_list(
+        "pk", "to", "cc", "bcc"
+    ):
+        emails = {parseaddr(r)[1].lower() for field in recipients for r in field}
+        if emails & addresses:
+            pks.append(pk)
+    return pks
+
+
+def delete_sessions(user_ids, batch_size=1000):
+    """
+    Delete the database sessions of ``user_ids``; returns how many.
+
+    Sessions keep the user id in their encoded data, so this decodes every
+    unexpired session once. Cache-only sessions can't be listed and are left
+    to expire, and signed cookie sessions have nothing stored server-side;
+    neither authenticates once the user is gone.
+    """
+    store_class = import_module(settings.SESSION_ENGINE).SessionStore
+    if not user_ids or not hasattr(store_class, "get_model_class"):
+        return 0
+    user_ids = {str(user_id) for user_id in user_ids}
+    store = store_class()
+    sessions = (
+        store_class.get_model_class()
+        .objects.filter(expire_date__gt=timezone.now())
+        .values_list("session_key", "session_data")
+    )
+    keys = [
+        key
+        for key, data in sessions.iterator(chunk_size=batch_size)
+        if store.decode(data).get(SESSION_KEY) in user_ids
+    ]
+    for key in keys:
+        # Through the store, so cached_db drops its cached copy too.
+        store_class(key).delete()
+    return len(keys)
+
+
+def claim_deletions(limit):
+    """Claim up to ``limit`` due deletions, leasing them for CLAIM_LEASE."""
+    now = timezone.now()
+    with transaction.atomic():
+        ids = list(
+            AccountDeletion.objects.select_for_update(skip_locked=True)
+            .filter(status=AccountDeletion.Status.PENDING, next_attempt_at__lte=now)
+            .order_by("next_attempt_at")
+            .values_list("pk", flat=True)[:limit]
+        )
+        if not ids:
+            return []
+        AccountDeletion.objects.filter(pk__in=ids).update(
+            attempts=F("attempts") + 1, next_attempt_at=now + CLAIM_LEASE
+        )
+    return list(AccountDeletion.objects.filter(pk__in=ids).order_by("pk"))
+
+
+def purge_account(deletion, batch_size=1000, pause=0):
+    """
+    Delete everything belonging to ``deletion.user_id``.
+
+    Returns True once the user is gone, False if the purge was cancelled
+    because the user has been reactivated.
+    """
+    records = AccountDeletion.objects.filter(pk=deletion.pk)
+    if User._default_manager.filter(pk=deletion.user_id, is_active=True).exists():
+        records.delete()
+        return False
+
+    def record_progress(count):
+        records.update(rows_deleted=F("rows_deleted") + count)
+
+    # Events still buffered here would be written after their user is gone.
+    audit.flush()
+
+    for queryset in related_querysets(deletion.user_id):
+        records.update(stage=queryset.model._meta.label)
+        delete_in_batches(
+            queryset,
+            batch_size=batch_size,
+            pause=pause,
+            raw=True,
+            on_batch=record_progress,
+        )
+
+    # Only the user row is left, plus the rows of relations that the
+    # collector has to handle (see related_querysets()).
+    records.update(stage=User._meta.label)
+    deleted, _ = User._default_manager.filter(pk=deletion.user_id).delete()
+    records.update(
+        status=AccountDeletion.Status.DONE,
+        stage="",
+        rows_deleted=F("rows_deleted") + deleted,
+        last_error="",
+        completed_at=timezone.now(),
+    )
+    return True
+
+
+def purge_due_accounts(limit=100, batch_size=1000, pause=0):
+    """
+    Purge up to ``limit`` pending deletions.
+
+    Returns a ``(purged, cancelled, failed)`` tuple. Failures are retried with
+    the next claim until MAX_ATTEMPTS is reached. The sessions of the purged
+    users are deleted at the end, in one pass over the session table.
+    """
+    purged_ids = []
+    cancelled = failed = 0
+    for deletion in claim_deletions(limit):
+        try:
+            if purge_account(deletion, batch_size=batch_size, pause=pause):
+                purged_ids.append(deletion.user_id)
+            else:
+                cancelled += 1
+        except Exception as e:
+            failed += 1
+            status = (
+                AccountDeletion.Status.FAILED
+                if deletion.attempts >= MAX_ATTEMPTS
+                else AccountDeletion.Status.PENDING
+            )
+            AccountDeletion.objects.filter(pk=deletion.pk).update(
+                status=status, last_error=str(e)[:2000]
+            )
+            logger.warning(
+                "Purging user %s failed (attempt %s): %s",
+                deletion.user_id,
+                deletion.attempts,
+                e,
+            )
+    try:
+        delete_sessions(purged_ids, batch_size=batch_size)
+    except Exception:
+        # The users are gone, so their sessions no longer authenticate;
+        # they are deleted when they expire.
+        logger.exception("Deleting the sessions of purged users failed")
+    return len(purged_ids), cancelled, failed
@@ -0,0 +1,241 @@
+"""
+Member directory search over profile names, locations and bios.
+
+The index is ``users_profile_search``, created by ``users/0007``: an FTS5
+table on SQLite and a tsvector table with a GIN index on PostgreSQL. Both
+are kept up to date by triggers. Searches match every word of the query as
+a prefix, rank the matches (names above locations above bios) and page
+through them by keyset on ``(rank, profile id)``. Only active users are
+listed. Profiles can also be filtered to one location, compared by
+``Profile.location_normalized`` (indexed together with the id).
+
+Ranking is the expensive part, so a query matching more than
+DIRECTORY_SEARCH_CANDIDATES profiles ranks only the newest of them; more
+words narrow the search down.
+"""
+
+import re
+import time
+
+from django.conf import settings
+from django.db import NotSupportedError, connection, transaction
+
+from core.pagination import keyset_page
+
+from .models import Profile
+
+# Words of a query, without punctuation (which the query syntaxes reserve)
+WORD = re.compile(r"[^\W_]+")
+# Shorter prefixes match too much of the index to be worth ranking.
+MIN_WORD_LENGTH = 2
+MAX_WORDS = 8
+
+# Ranking costs time per match, so only the newest ``candidates`` matches
+# (read in rowid order, which needs no ranking) are ranked.
+SQLITE_SEARCH = """
+    SELECT c.id, c.rank
+    FROM (
+        SELECT s.rowid AS id, s.rank AS rank
+        FROM users_profile_search s
+        WHERE users_profile_search MATCH %(match)s
+        ORDER BY s.rowid DESC
+        LIMIT %(candidates)s
+    ) c
+    JOIN users_profile p ON p.id = c.id
+    JOIN auth_user u ON u.id = p.user_id
+    WHERE u.is_active {location} {after}
+    ORDER BY c.rank, c.id
+    LIMIT %(size)s
+"""
+
+POSTGRESQL_SEARCH = """
+    SELECT c.id, c.rank
+    FROM (
+        SELECT s.profile_id AS id, -ts_rank_cd(s.document, query)::float8 AS rank
+        FROM (
+            SELECT profile_id, document
+            FROM users_profile_search, to_tsquery('simple', %(match)s) query
+            WHERE document @@ query
+            ORDER BY profile_id DESC
+            LIMIT %(candidates)s
+        ) s, to_tsquery('simple', %(match)s) query
+    ) c
+    JOIN users_profile p ON p.id = c.id
+    JOIN auth_user u ON u.id = p.user_id
+    WHERE u.is_active {location} {after}
+    ORDER BY c.rank, c.id
+    LIMIT %(size)s
+"""
+LOCATION = "AND p.location_normalized = %(location)s"
+AFTER = "AND (c.rank > %(rank)s OR (c.rank = %(rank)s AND c.id > %(after_id)s))"
+
+BACKENDS = {
+    "sqlite": SQLITE_SEARCH,
+    "postgresql": POSTGRESQL_SEARCH,
+}
+
+
+def search_words(query):
+    words = WORD.findall(query.lower())
+    return [word for word in words if len(word) >= MIN_WORD_LENGTH][:MAX_WORDS]
+
+
+def match_expression(words, location_words=()):
+    """
+    The full-text query matching every word as a prefix, and every location
+    word exactly in the location column.
+    """
+    if connection.vendor == "postgresql":
+        terms = [f"{word}:*" for word in words]
+        terms += [f"{word}:B" for word in location_words]
+        return " & ".join(terms)
+    terms = [f'"{word}"*' for word in words]
+    terms += [f'location : "{word}"' for word in location_words]
+    return " ".join(terms)
+
+
+def parse_cursor(cursor):
+    """Return ``(rank, profile_id)`` from a ``"<rank>:<id>"`` cursor, or None."""
+    try:
+        rank, profile_id = cursor.rsplit(":", 1)
+        return float(rank), int(profile_id)
+    except (AttributeError, ValueError):
+        return None
+
+
+def ranked_profile_ids(words, after=None, size=20, candidates=1000, location=""):
+    """
+    Return ``[(profile_id, rank)]``, best match first; lower rank is better.
+
+    ``location`` limits the results to profiles with the same normalized
+    location. Its words also narrow down the full-text match (the index
+    folds them the way it folded the stored location), so the candidates
+    all come from that location.
+    """
+    location_key = Profile.location_key(location)
+    try:
+        sql = BACKENDS[connection.vendor]
+    except KeyError:
+        raise NotSupportedError(
+            f"Directory search isn't available on {connection.vendor}."
+        )
+    params = {
+        "match": match_expression(words, WORD.findall(location.lower())),
+        "location": location_key,
+        "candidates": candidates,
+        "rank": after[0] if after else None,
+        "after_id": after[1] if after else None,
+        "size": size,
+    }
+    with connection.cursor() as cursor:
+        sql = sql.format(
+            location=LOCATION if location_key else "", after=AFTER if after else ""
+        )
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+
+def search_profiles(query, after=None, size=20, location=""):
+    """
+    Return ``(profiles, next_cursor)`` for one page of directory results.
+
+    With search words, profiles are ordered by relevance and ``after`` is
+    the opaque cursor returned for the previous page. Without, all active
+    members are listed newest first. A ``location`` limits the results to
+    profiles with the same normalized location.
+    """
+    words = search_words(query)
+    if not words:
+        try:
+            after = int(after) if after else None
+        except ValueError:
+            after = None
+        queryset = Profile.objects.filter(user__is_active=True).select_related("user")
+        if location_key := Profile.location_key(location):
+            queryset = queryset.filter(location_normalized=location_key)
+        return keyset_page(queryset, size, after=after)
+
+    rows = ranked_profile_ids(
+        words,
+        parse_cursor(after),
+        size + 1,
+        candidates=settings.DIRECTORY_SEARCH_CANDIDATES,
+        location=location,
+    )
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        profile_id, rank = rows[-1]
+        next_cursor = f"{rank!r}:{profile_id}"
+    profiles = Profile.objects.select_related("user").in_bulk(
+        [profile_id for profile_id, _ in rows]
+    )
+    return [profiles[pk] for pk, _ in rows if pk in profiles], next_cursor
+
+
+def reindex(batch_size=1000, pause=0, on_batch=None):
+    """
+    Rebuild the search index from ``users_profile``, one batch at a time.
+
+    Each batch replaces the index entries of a range of profile ids in a
+    short transaction of its own, so searches keep working during a reindex. Entries of
+    deleted profiles are dropped. ``pause`` sleeps between batches and
+    ``on_batch(count)`` is called after each one. Returns the number of
+    profiles indexed.
+    """
+    if connection.vendor not in BACKENDS:
+        raise NotSupportedError(
+            f"Directory search isn't available on {connection.vendor}."
+        )
+    if connection.vendor == "postgresql":
+        key = "profile_id"
+        insert = """
+            INSERT INTO users_profile_search (profile_id, document)
+            SELECT p.id, users_profile_search_document(
+                u.first_name || ' ' || u.last_name, p.location, p.bio
+            )
+            FROM users_profile p JOIN auth_user u ON u.id = p.user_id
+            WHERE p.id > %s AND p.id <= %s
+            ON CONFLICT (profile_id) DO UPDATE SET document = EXCLUDED.document
+        """
+    else:
+        key = "rowid"
+        insert = """
+            INSERT INTO users_profile_search (rowid, name, location, bio)
+            SELECT p.id, u.first_name || ' ' || u.last_name, p.location, p.bio
+            FROM users_profile p JOIN auth_user u ON u.id = p.user_id
+            WHERE p.id > %s AND p.id <= %s
+        """
+    delete = f"DELETE FROM users_profile_search WHERE {key} > %s AND {key} <= %s"
+
+    total = 0
+    last_id = 0
+    ids = Profile.objects.order_by("pk").values_list("pk", flat=True)
+    while batch := list(ids.filter(pk__gt=last_id)[:batch_size]):
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(delete, [last_id, batch[-1]])
+                cursor.execute(insert, [last_id, batch[-1]])
+        total += len(batch)
+        last_id = batch[-1]
+        if on_batch:
+            on_batch(len(batch))
+        if pause:
+            time.sleep(pause)
+    with connection.cursor() as cursor:
+        # Entries left behind by profiles deleted past the last batch. Newer
+        # profiles were indexed by the triggers and are kept.
+        cursor.execute(
+            f"DELETE FROM users_profile_search WHERE {key} > %s AND {key} NOT IN "
+            "(SELECT id FROM users_profile WHERE id > %s)",
+            [last_id, last_id],
+        )
+        if connection.vendor == "postgresql":
+            cursor.execute("ANALYZE users_profile_search")
+        else:
+            # Merge the index segments written by the batches.
+            cursor.execute(
+                "INSERT INTO users_profile_search (users_profile_search) "
+                "VALUES ('optimize')"
+            )
+    return total
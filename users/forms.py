@@ -1,10 +1,28 @@
 from django import forms
+from django.conf import settings
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.template.defaultfilters import filesizeformat
+from django.urls import reverse_lazy
 
+from .avatars import check_image
+from .backends import users_by_email
+from .gazetteer import canonical_location
 from .models import Profile
 
+# Suggestions from LocationSuggestionsView, swapped into a
+# <datalist id="location-suggestions"> next to the input as the user types
+LOCATION_AUTOCOMPLETE = {
+    "list": "location-suggestions",
+    "autocomplete": "off",
+    "hx-get": reverse_lazy("users:locations"),
+    "hx-trigger": "input changed delay:150ms",
+    "hx-target": "#location-suggestions",
+    "hx-swap": "innerHTML",
+    "hx-sync": "this:replace",
+}
+
 # Common styling for all inputs
 
 BASE_INPUT_STYLE = "input input-bordered border border-gray-300 w-full bg-white text-black placeholder-gray-500"
@@ -47,9 +65,9 @@ class EmailSignupForm(UserCreationForm):
         fields = ["email", "password1", "password2"]
 
     def clean_email(self):
-        """Validate that email is unique."""
+        """Validate that email is unique (case-insensitively)."""
         email = self.cleaned_data.get("email")
-        if User.objects.filter(email=email).exists():
+        if users_by_email(email).exists():
             raise ValidationError("A user with this email already exists.")
         return email
 
@@ -124,6 +142,7 @@ class ProfileForm(forms.ModelForm):
                 attrs={
                     "class": "input input-bordered w-full",
                     "placeholder": "City, Country",
+                    **LOCATION_AUTOCOMPLETE,
                 }
             ),
             "birth_date": forms.DateInput(
@@ -140,6 +159,10 @@ class ProfileForm(forms.ModelForm):
             self.fields["first_name"].initial = self.instance.user.first_name
             self.fields["last_name"].initial = self.instance.user.last_name
 
+    def clean_location(self):
+        """Spell known places the gazetteer's way ("zurich" -> "Zürich, CH")."""
+        return canonical_location(self.cleaned_data["location"])
+
     def save(self, commit=True):
         profile = super().save(commit=False)
 
@@ -152,3 +175,37 @@ class ProfileForm(forms.ModelForm):
             profile.save()
 
         return profile
+
+
+class AvatarForm(forms.Form):
+    """
+    A profile picture upload.
+
+    Expects the file to come from ``AvatarUploadHandler``, which streams it
+    to disk and drops it if it's too large.
+    """
+
+    avatar = forms.FileField(
+        widget=forms.ClearableFileInput(
+            attrs={
+                "class": "file-input file-input-bordered file-input-sm w-full",
+                "accept": "image/jpeg,image/png,image/webp,image/gif",
+            }
+        ),
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Also shown when the file was dropped for being too large.
+        size = filesizeformat(settings.AVATAR_MAX_UPLOAD_SIZE)
+        self.fields["avatar"].error_messages["required"] = (
+            f"Choose an image of at most {size}."
+        )
+
+    def clean_avatar(self):
+        avatar = self.cleaned_data["avatar"]
+        try:
+            check_image(avatar.temporary_file_path())
+        except ValueError as e:
+            raise ValidationError(str(e))
+        return avatar
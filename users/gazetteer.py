@@ -0,0 +1,318 @@
+"""
+Offline gazetteer behind the location autocomplete.
+
+``manage.py load_gazetteer`` turns a GeoNames dump (e.g. ``cities15000.zip``)
+into one binary index file at GAZETTEER_PATH:
+
+- a header (``HEADER``);
+- uint32 arrays: key offsets, the place of each key, place populations,
+  label offsets, short prefix offsets and the top places of each short
+  prefix;
+- the UTF-8 search keys, sorted, the UTF-8 place labels and the sorted short
+  prefixes.
+
+Each place ("Zürich, CH") has one key per distinct name, normalized by
+``normalize_location()``. Workers ``mmap`` the file, so it is loaded lazily
+by the OS, shared between processes through the page cache, and costs
+almost nothing to open. A prefix query binary-searches the sorted keys and
+returns the most populous matching places. Prefixes of up to
+``SHORT_PREFIX`` characters match too many keys to rank on every query, so
+their ``TOP_PLACES`` best places are ranked when the index is built.
+Results are memoized per process.
+"""
+
+import heapq
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+import threading
+import unicodedata
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+
+from django.conf import settings
+
+MAGIC = b"HCOTGAZ1"
+# magic, key count, place count, short prefix count, and the sizes of the
+# keys, labels and short prefixes blobs
+HEADER = struct.Struct("<8sIIIIII")
+SHORT_PREFIX = 4
+TOP_PLACES = 16
+# Pads the top places of prefixes with fewer matches.
+NO_PLACE = 2**32 - 1
+# Profile.location holds at most this many characters.
+LABEL_LENGTH = 30
+
+WORDS = re.compile(r"[^\W_]+")
+
+
+def normalize_location(value):
+    """
+    Return the search/filter key of a location: casefolded, accents removed,
+    punctuation collapsed to single spaces ("Zürich, CH" -> "zurich ch").
+    """
+    value = unicodedata.normalize("NFKD", value.casefold())
+    value = "".join(char for char in value if not unicodedata.combining(char))
+    return " ".join(WORDS.findall(value))
+
+
+def _uint32(values):
+    data = array("I", values)
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data
+
+
+class Gazetteer:
+    """A read-only, memory-mapped gazetteer index file."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = HEADER.unpack_from(self._mmap)
+        magic, keys, places, prefixes, keys_size, labels_size, prefixes_size = header
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a gazetteer index.")
+        view = memoryview(self._mmap)
+        offset = HEADER.size
+
+        def take(count):
+            nonlocal offset
+            chunk = view[offset : offset + 4 * count]
+            offset += 4 * count
+            if sys.byteorder == "little":
+                return chunk.cast("I")
+            return _uint32(chunk.cast("I"))
+
+        self.key_offsets = take(keys + 1)
+        self.key_places = take(keys)
+        self.populations = take(places)
+        self.label_offsets = take(places + 1)
+        self.prefix_offsets = take(prefixes + 1)
+        self.top_places = take(prefixes * TOP_PLACES)
+        self.keys = view[offset : offset + keys_size]
+        offset += keys_size
+        self.labels = view[offset : offset + labels_size]
+        offset += labels_size
+        self.prefixes = view[offset : offset + prefixes_size]
+        self.key_count = keys
+        self.place_count = places
+        self.prefix_count = prefixes
+        self.suggest = lru_cache(maxsize=4096)(self._suggest)
+
+    def key(self, index):
+        start, end = self.key_offsets[index], self.key_offsets[index + 1]
+        return bytes(self.keys[start:end])
+
+    def prefix(self, index):
+        start, end = self.prefix_offsets[index], self.prefix_offsets[index + 1]
+        return bytes(self.prefixes[start:end])
+
+    def label(self, place):
+        start, end = self.label_offsets[place], self.label_offsets[place + 1]
+        return str(self.labels[start:end], "utf-8")
+
+    def _places(self, lo, hi):
+        return {self.key_places[index] for index in range(lo, hi)}
+
+    def _suggest(self, prefix, limit=8):
+        """
+        Labels of the ``limit`` most populous places with a key starting with
+        ``prefix``, which is already normalized.
+        """
+        if not prefix:
+            return ()
+        start = prefix.encode()
+        if len(prefix) <= SHORT_PREFIX and limit <= TOP_PLACES:
+            indexes = range(self.prefix_count)
+            index = bisect_left(indexes, start, key=self.prefix)
+            if index == self.prefix_count or self.prefix(index) != start:
+                return ()
+            top = self.top_places[index * TOP_PLACES : index * TOP_PLACES + limit]
+            return tuple(self.label(place) for place in top if place != NO_PLACE)
+        indexes = range(self.key_count)
+        lo = bisect_left(indexes, start, key=self.key)
+        # 0xff never occurs in UTF-8: this sorts after every key with the prefix.
+        hi = bisect_left(indexes, start + b"\xff", lo, key=self.key)
+        places = self._places(lo, hi)
+        best = heapq.nlargest(limit, places, key=self.populations.__getitem__)
+        return tuple(self.label(place) for place in best)
+
+    def canonical(self, value):
+        """The label of the most populous place named exactly ``value``, or None."""
+        key = normalize_location(value).encode()
+        if not key:
+            return None
+        indexes = range(self.key_count)
+        lo = bisect_left(indexes, key, key=self.key)
+        hi = bisect_right(indexes, key, lo, key=self.key)
+        places = self._places(lo, hi)
+        if not places:
+            return None
+        return self.label(max(places, key=self.populations.__getitem__))
+
+
+def write_gazetteer(places, path):
+    """
+    Write an index of ``places`` to ``path``, atomically.
+
+    ``places`` is an iterable of ``(label, population, names)``. Returns the
+    number of ``(places, keys)`` written.
+    """
+    labels = []
+    populations = []
+    entries = set()
+    for label, population, names in places:
+        place = len(labels)
+        labels.append(label.encode())
+        populations.append(min(max(population, 0), 2**32 - 1))
+        for name in names:
+            key = normalize_location(name)
+            if key:
+                entries.add((key.encode(), place))
+        # Also match "zurich ch", as typed after picking a suggestion.
+        entries.add((normalize_location(label).encode(), place))
+    entries = sorted(entries)
+
+    # The first TOP_PLACES distinct places met in order of population are
+    # the best ones of each short prefix.
+    top = {}
+    keys_by_place = [[] for _ in labels]
+    for key, place in entries:
+        keys_by_place[place].append(key.decode())
+    for place in sorted(range(len(labels)), key=lambda place: -populations[place]):
+        short_prefixes = {
+            key[:length]
+            for key in keys_by_place[place]
+            for length in range(1, SHORT_PREFIX + 1)
+        }
+        for prefix in short_prefixes:
+            best = top.setdefault(prefix.encode(), [])
+            if len(best) < TOP_PLACES:
+                best.append(place)
+    prefixes = sorted(top)
+
+    key_offsets = [0]
+    for key, _ in entries:
+        key_offsets.append(key_offsets[-1] + len(key))
+    label_offsets = [0]
+    for label in labels:
+        label_offsets.append(label_offsets[-1] + len(label))
+    prefix_offsets = [0]
+    for prefix in prefixes:
+        prefix_offsets.append(prefix_offsets[-1] + len(prefix))
+    top_places = []
+    for prefix in prefixes:
+        best = top[prefix]
+        top_places += best + [NO_PLACE] * (TOP_PLACES - len(best))
+    keys_blob = b"".join(key for key, _ in entries)
+    labels_blob = b"".join(labels)
+    prefixes_blob = b"".join(prefixes)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    # Replace the file instead of rewriting it: running workers keep their
+    # mapping of the old one.
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(
+            HEADER.pack(
+                MAGIC,
+                len(entries),
+                len(labels),
+                len(prefixes),
+                len(keys_blob),
+                len(labels_blob),
+                len(prefixes_blob),
+            )
+        )
+        for values in (
+            key_offsets,
+            [place for _, place in entries],
+            populations,
+            label_offsets,
+            prefix_offsets,
+            top_places,
+        ):
+            f.write(_uint32(values).tobytes())
+        f.write(keys_blob)
+        f.write(labels_blob)
+        f.write(prefixes_blob)
+    os.replace(tmp_path, path)
+    return len(labels), len(entries)
+
+
+def read_geonames(stream, min_population=0, alternate_names=True):
+    """
+    Yield ``(label, population, names)`` from a GeoNames dump.
+
+    ``stream`` yields the tab-separated lines of a GeoNames ``cities*.txt`` or
+    ``allCountries.txt`` file; only populated places (feature class P) are
+    kept. Labels are "<name>, <country code>", shortened to fit
+    Profile.location.
+    """
+    for line in stream:
+        columns = line.rstrip("\n").split("\t")
+        if len(columns) < 15 or columns[6] != "P":
+            continue
+        name, ascii_name, alternates, country = (
+            columns[1],
+            columns[2],
+            columns[3],
+            columns[8],
+        )
+        population = int(columns[14] or 0)
+        if population < min_population:
+            continue
+        label = f"{name}, {country}" if country else name
+        if len(label) > LABEL_LENGTH:
+            label = name[:LABEL_LENGTH]
+        names = {name, ascii_name}
+        if alternate_names and alternates:
+            names.update(
+                alternate
+                for alternate in alternates.split(",")
+                if len(alternate) <= LABEL_LENGTH
+            )
+        yield label, population, names
+
+
+_lock = threading.Lock()
+_loaded = None  # (path, mtime_ns, Gazetteer)
+
+
+def get_gazetteer():
+    """
+    Return the Gazetteer at GAZETTEER_PATH, or None if there is none.
+
+    Opened once per process and reopened when ``load_gazetteer`` replaces
+    the file.
+    """
+    global _loaded
+    path = settings.GAZETTEER_PATH
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except (OSError, TypeError, ValueError):
+        return None
+    loaded = _loaded
+    if loaded and loaded[:2] == (path, mtime):
+        return loaded[2]
+    with _lock:
+        if _loaded is None or _loaded[:2] != (path, mtime):
+            _loaded = (path, mtime, Gazetteer(path))
+        return _loaded[2]
+
+
+def canonical_location(value):
+    """
+    Spell a known place the gazetteer's way ("zurich" -> "Zürich, CH");
+    return anything else unchanged.
+    """
+    gazetteer = get_gazetteer()
+    if value and gazetteer:
+        return gazetteer.canonical(value) or value
+    return value
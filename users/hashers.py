@@ -0,0 +1,151 @@
+"""
+Password hashers that run in a bounded process pool.
+
+PBKDF2 and Argon2 are deliberately slow and CPU-bound. Run on the request
+thread they hold the GIL for the whole computation, so one login storm
+starves every other request in the worker. The hashers here send
+``encode()``/``verify()`` to a per-process ``ProcessPoolExecutor`` instead.
+
+At most ``PASSWORD_HASHER_MAX_PENDING`` hashes may be queued or running per
+worker process. Beyond that ``PasswordHasherBusy`` is raised after
+``PASSWORD_HASHER_QUEUE_TIMEOUT`` seconds, and ``users.middleware`` turns it
+into a fast 503 with ``Retry-After`` instead of letting requests pile up.
+
+Work factors come from settings (PASSWORD_HASH_ITERATIONS, ARGON2_*). When
+they change, Django's ``must_update()`` check rehashes each password the
+next time its owner logs in. With PASSWORD_HASHER_POOL_SIZE=0 hashing runs
+inline.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import (Argon2PasswordHasher,
+                                         PBKDF2PasswordHasher)
+from django.utils.module_loading import import_string
+
+from core import metrics
+
+_pool = None
+_pool_pid = None
+_slots = None
+_pool_lock = threading.Lock()
+
+
+class PasswordHasherBusy(Exception):
+    """Every hashing slot in this worker is taken; retry shortly."""
+
+
+def _call_hasher(hasher_path, attributes, method, args):
+    # Runs in a pool process: build the plain (unpooled) hasher and call it.
+    hasher = import_string(hasher_path)()
+    for name, value in attributes.items():
+        setattr(hasher, name, value)
+    return getattr(hasher, method)(*args)
+
+
+def get_pool():
+    """Return this process's hashing pool and slot semaphore, creating them once."""
+    global _pool, _pool_pid, _slots
+    with _pool_lock:
+        # A forked worker (e.g. gunicorn --preload) must not reuse its
+        # parent's pool.
+        if _pool is None or _pool_pid != os.getpid():
+            size = settings.PASSWORD_HASHER_POOL_SIZE
+            _pool = ProcessPoolExecutor(
+                max_workers=size, mp_context=multiprocessing.get_context("spawn")
+            )
+            _pool_pid = os.getpid()
+            _slots = threading.BoundedSemaphore(
+                settings.PASSWORD_HASHER_MAX_PENDING or size * 2
+            )
+        return _pool, _slots
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.shutdown()
+        _pool = None
+
+
+class PooledHasherMixin:
+    """
+    Run ``encode()`` and ``verify()`` of the next hasher in the MRO in the pool.
+
+    ``pooled_attributes`` lists the work-factor attributes copied to the pool
+    process, where the plain hasher class is rebuilt from its import path.
+    """
+
+    pooled_attributes = ()
+
+    def _base_path(self):
+        mro = type(self).__mro__
+        base = mro[mro.index(PooledHasherMixin) + 1]
+        return f"{base.__module__}.{base.__qualname__}"
+
+    def _run(self, method, *args):
+        start = time.perf_counter()
+        try:
+            if not settings.PASSWORD_HASHER_POOL_SIZE:
+                return getattr(super(), method)(*args)
+
+            pool, slots = get_pool()
+            if not slots.acquire(timeout=settings.PASSWORD_HASHER_QUEUE_TIMEOUT):
+                metrics.inc("password_hasher_rejected_total", algorithm=self.algorithm)
+                raise PasswordHasherBusy("All password hashing slots are busy.")
+            try:
+                attributes = {
+                    name: getattr(self, name) for name in self.pooled_attributes
+                }
+                return pool.submit(
+                    _call_hasher, self._base_path(), attributes, method, args
+                ).result()
+            finally:
+                slots.release()
+        finally:
+            metrics.observe(
+                "password_hash_ms",
+                (time.perf_counter() - start) * 1000,
+                algorithm=self.algorithm,
+                operation=method,
+            )
+
+    def encode(self, password, salt, *args):
+        return self._run("encode", password, salt, *args)
+
+    def verify(self, password, encoded):
+        return self._run("verify", password, encoded)
+
+
+class PooledPBKDF2PasswordHasher(PooledHasherMixin, PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 with the iteration count taken from PASSWORD_HASH_ITERATIONS."""
+
+    pooled_attributes = ("iterations",)
+
+    @property
+    def iterations(self):
+        return settings.PASSWORD_HASH_ITERATIONS or PBKDF2PasswordHasher.iterations
+
+
+class PooledArgon2PasswordHasher(PooledHasherMixin, Argon2PasswordHasher):
+    """Argon2id (requires argon2-cffi) with costs taken from ARGON2_* settings."""
+
+    pooled_attributes = ("time_cost", "memory_cost", "parallelism")
+
+    @property
+    def time_cost(self):
+        return settings.ARGON2_TIME_COST or Argon2PasswordHasher.time_cost
+
+    @property
+    def memory_cost(self):
+        return settings.ARGON2_MEMORY_COST or Argon2PasswordHasher.memory_cost
+
+    @property
+    def parallelism(self):
+        return settings.ARGON2_PARALLELISM or Argon2PasswordHasher.parallelism
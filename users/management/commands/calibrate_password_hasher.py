@@ -0,0 +1,73 @@
+import time
+
+from django.contrib.auth.hashers import (Argon2PasswordHasher,
+                                         PBKDF2PasswordHasher, get_hasher)
+from django.core.management.base import BaseCommand, CommandError
+
+from users.hashers import PooledArgon2PasswordHasher, PooledPBKDF2PasswordHasher
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the configured password hasher on this machine and suggest the "
+        "work factor that makes one hash take --target-ms milliseconds."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target-ms",
+            type=float,
+            default=250,
+            help="Desired time for one hash (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=5,
+            help="Hashes timed per measurement (default: %(default)s).",
+        )
+
+    def measure(self, hasher, samples):
+        salt = hasher.salt()
+        start = time.perf_counter()
+        for _ in range(samples):
+            hasher.encode("calibration-password", salt)
+        return (time.perf_counter() - start) * 1000 / samples
+
+    def handle(self, *args, **options):
+        hasher = get_hasher()
+        elapsed = self.measure(hasher, options["samples"])
+        ratio = options["target_ms"] / elapsed
+
+        if isinstance(hasher, PooledPBKDF2PasswordHasher):
+            setting = "PASSWORD_HASH_ITERATIONS"
+            current = hasher.iterations
+            # PBKDF2 cost is linear in the iteration count.
+            suggested = max(1000, int(round(current * ratio, -3)))
+            default = PBKDF2PasswordHasher.iterations
+        elif isinstance(hasher, PooledArgon2PasswordHasher):
+            setting = "ARGON2_TIME_COST"
+            current = hasher.time_cost
+            suggested = max(1, round(current * ratio))
+            default = Argon2PasswordHasher.time_cost
+        else:
+            raise CommandError(
+                f"Calibration is not supported for {type(hasher).__name__}."
+            )
+
+        self.stdout.write(
+            f"{hasher.algorithm}: {elapsed:.1f} ms per hash at {setting}={current}"
+        )
+        self.stdout.write(
+            f"Suggested for ~{options['target_ms']:.0f} ms: {setting}={suggested}"
+        )
+        if suggested < default:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"That is below Django's default of {default}; prefer more "
+                    "hashing capacity (PASSWORD_HASHER_POOL_SIZE) over a weaker hash."
+                )
+            )
+        self.stdout.write(
+            "Existing passwords are rehashed at their next login after the change."
+        )
@@ -0,0 +1,103 @@
+import os
+import sys
+import time
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+
+from users.bulk import batched, import_batch, read_rows
+
+
+def guess_format(path):
+    return "jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv"
+
+
+class Command(BaseCommand):
+    help = (
+        "Import users from a CSV or JSONL file (see users/bulk.py for the "
+        "columns) in batches, with pre-hashed passwords. Emails that already "
+        "exist are skipped, so an interrupted import can simply be rerun."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Input file, or - for stdin.")
+        parser.add_argument(
+            "--format",
+            choices=["csv", "jsonl"],
+            help="Input format (default: from the file extension, else csv).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows inserted per transaction (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help=(
+                "File recording how many rows have been committed. If it "
+                "exists, the import resumes after that row; it is removed "
+                "when the import completes."
+            ),
+        )
+
+    def read_checkpoint(self, path):
+        try:
+            with open(path) as f:
+                return int(f.read().strip() or 0)
+        except FileNotFoundError:
+            return 0
+        except ValueError:
+            raise CommandError(f"Checkpoint file {path} is corrupt.")
+
+    def write_checkpoint(self, path, rows):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(str(rows))
+        os.replace(tmp_path, path)
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        fmt = options["format"] or guess_format(path)
+        checkpoint = options["checkpoint"]
+        skip = self.read_checkpoint(checkpoint) if checkpoint else 0
+        if skip:
+            self.stdout.write(f"Resuming after row {skip}.")
+
+        stream = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8")
+        processed = skip
+        totals = {"created": 0, "duplicates": 0, "invalid": 0}
+        start = last_report = time.perf_counter()
+        try:
+            rows = islice(read_rows(stream, fmt), skip, None)
+            for batch in batched(rows, options["batch_size"]):
+                created, duplicates, errors = import_batch(batch)
+                for index, reason in errors:
+                    self.stderr.write(f"Row {processed + index + 1}: {reason}")
+                processed += len(batch)
+                totals["created"] += created
+                totals["duplicates"] += duplicates
+                totals["invalid"] += len(errors)
+                if checkpoint:
+                    self.write_checkpoint(checkpoint, processed)
+
+                now = time.perf_counter()
+                if now - last_report >= 5:
+                    last_report = now
+                    rate = (processed - skip) / (now - start)
+                    self.stdout.write(f"{processed} rows, {rate:.0f} rows/s")
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        if checkpoint and os.path.exists(checkpoint):
+            os.remove(checkpoint)
+        elapsed = time.perf_counter() - start
+        rate = (processed - skip) / elapsed if elapsed else 0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {totals['created']} users from {processed - skip} rows "
+                f"({totals['duplicates']} duplicates, {totals['invalid']} invalid) "
+                f"in {elapsed:.1f}s, {rate:.0f} rows/s."
+            )
+        )
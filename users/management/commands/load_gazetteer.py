@@ -0,0 +1,69 @@
+import io
+import os
+import time
+import zipfile
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from users.gazetteer import read_geonames, write_gazetteer
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the location autocomplete index from a GeoNames dump, such as "
+        "cities15000.zip from https://download.geonames.org/export/dump/. "
+        "Running servers pick up the new index on their next request."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "source", help="GeoNames .txt file, or a .zip holding exactly one."
+        )
+        parser.add_argument(
+            "--min-population",
+            type=int,
+            default=0,
+            help="Skip smaller places (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--no-alternate-names",
+            action="store_true",
+            help="Index only the name and ASCII name of each place.",
+        )
+        parser.add_argument(
+            "--output",
+            default=settings.GAZETTEER_PATH,
+            help="Index file to write (default: GAZETTEER_PATH).",
+        )
+
+    def open_source(self, source):
+        if not zipfile.is_zipfile(source):
+            return open(source, encoding="utf-8")
+        archive = zipfile.ZipFile(source)
+        names = [name for name in archive.namelist() if name.endswith(".txt")]
+        if len(names) != 1:
+            raise CommandError(f"Expected one .txt file in {source}, got {names}.")
+        return io.TextIOWrapper(archive.open(names[0]), encoding="utf-8")
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        try:
+            stream = self.open_source(options["source"])
+        except OSError as e:
+            raise CommandError(e)
+        with stream:
+            places = read_geonames(
+                stream,
+                min_population=options["min_population"],
+                alternate_names=not options["no_alternate_names"],
+            )
+            place_count, key_count = write_gazetteer(places, options["output"])
+        size = os.path.getsize(options["output"]) / 2**20
+        seconds = time.perf_counter() - start
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Indexed {place_count} places under {key_count} names in "
+                f"{options['output']} ({size:.1f} MiB, {seconds:.1f}s)."
+            )
+        )
@@ -0,0 +1,58 @@
+import os
+import shutil
+import time
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from users.avatars import avatar_directory, process_avatar, stored_digests
+from users.models import Profile
+
+
+class Command(BaseCommand):
+    help = (
+        "Finish avatar uploads whose rendering was interrupted (e.g. by a "
+        "worker restart) and delete stored avatars no profile uses anymore. "
+        "Run it from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace",
+            type=float,
+            default=24,
+            help=(
+                "Keep unused avatars stored less than this many hours ago; they "
+                "may belong to an upload in progress (default: %(default)s)."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        pending = Profile.objects.exclude(avatar_pending="").values_list(
+            "pk", "avatar_pending"
+        )
+        finished = 0
+        for profile_id, digest in pending.iterator():
+            # Failed renders delete the original and just clear the pending
+            # digest, as does a missing original.
+            process_avatar(digest, profile_id)
+            finished += 1
+        self.stdout.write(f"Processed {finished} pending avatars.")
+
+        used = set()
+        for avatar, pending_digest in (
+            Profile.objects.filter(~Q(avatar="") | ~Q(avatar_pending=""))
+            .values_list("avatar", "avatar_pending")
+            .iterator()
+        ):
+            used.update((avatar, pending_digest))
+        cutoff = time.time() - options["grace"] * 3600
+        deleted = 0
+        for digest in stored_digests():
+            directory = avatar_directory(digest)
+            # Uploading an avatar again touches its directory.
+            if digest in used or os.path.getmtime(directory) > cutoff:
+                continue
+            shutil.rmtree(directory, ignore_errors=True)
+            deleted += 1
+        self.stdout.write(f"Deleted {deleted} unused avatars.")
@@ -0,0 +1,46 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.batching import delete_in_batches
+from users.models import AuditEvent
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete audit events older than the retention period in chunks. "
+        "Run it from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.AUDIT_RETENTION_DAYS,
+            help="Keep events younger than this (default: AUDIT_RETENTION_DAYS).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Events deleted per statement (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0,
+            help="Seconds to sleep between batches (default: %(default)s).",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        # Nothing refers to audit events, so the chunks skip the collector.
+        deleted = delete_in_batches(
+            AuditEvent.objects.filter(created_at__lt=cutoff),
+            batch_size=options["batch_size"],
+            pause=options["pause"],
+            raw=True,
+        )
+        self.stdout.write(f"Deleted {deleted} audit events.")
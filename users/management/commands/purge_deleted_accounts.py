@@ -0,0 +1,63 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from users.deletion import purge_due_accounts
+
+
+class Command(BaseCommand):
+    help = (
+        "Purge the data of accounts deleted by their owners, in batched "
+        "deletes. Run it from cron, or pass --interval to keep it running as "
+        "a background worker."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=100,
+            help="Accounts claimed per round (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows deleted per statement (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0,
+            help="Seconds to sleep between batches (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Poll for new deletions every N seconds instead of exiting.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            while True:
+                close_old_connections()
+                purged, cancelled, failed = purge_due_accounts(
+                    limit=options["limit"],
+                    batch_size=options["batch_size"],
+                    pause=options["pause"],
+                )
+                if purged or cancelled or failed or not options["interval"]:
+                    self.stdout.write(
+                        f"Purged {purged} accounts ({cancelled} cancelled, "
+                        f"{failed} failed)."
+                    )
+                if purged + cancelled + failed >= options["limit"]:
+                    # More may be waiting; don't sleep.
+                    continue
+                if not options["interval"]:
+                    break
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
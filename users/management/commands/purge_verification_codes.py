@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils import timezone
+
+from core.batching import delete_in_batches
+from users.models import VerificationCode
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired email verification codes in chunks. Run it from cron, "
+        "or pass --interval to keep sweeping periodically."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Codes deleted per statement (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Repeat the sweep every N seconds instead of exiting.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            while True:
+                close_old_connections()
+                # Consumed codes expire too, so one pass over the expires_at
+                # index catches every stale row.
+                expired = VerificationCode.objects.filter(
+                    expires_at__lt=timezone.now()
+                )
+                deleted = delete_in_batches(expired, batch_size=options["batch_size"])
+                self.stdout.write(f"Deleted {deleted} expired verification codes.")
+                if not options["interval"]:
+                    break
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
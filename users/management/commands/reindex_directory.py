@@ -0,0 +1,47 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from users.directory import reindex
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the member directory search index from the profiles table, "
+        "in batches. Run it once after migrating an existing database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Profiles indexed per transaction (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0,
+            help="Seconds to sleep between batches (default: %(default)s).",
+        )
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        done = 0
+
+        def progress(count):
+            nonlocal done
+            done += count
+            if options["verbosity"] > 1:
+                self.stdout.write(f"Indexed {done} profiles...")
+
+        total = reindex(
+            batch_size=options["batch_size"], pause=options["pause"], on_batch=progress
+        )
+        seconds = time.perf_counter() - start
+        rate = total / seconds if seconds else 0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Indexed {total} profiles in {seconds:.1f}s ({rate:.0f} rows/sec)."
+            )
+        )
@@ -0,0 +1,21 @@
+from django.http import HttpResponse
+from django.utils.deprecation import MiddlewareMixin
+
+from .hashers import PasswordHasherBusy
+
+
+class PasswordHasherBusyMiddleware(MiddlewareMixin):
+    """Answer with a fast 503 when the password hashing pool is saturated."""
+
+    retry_after = 1
+
+    def process_exception(self, request, exception):
+        if not isinstance(exception, PasswordHasherBusy):
+            return None
+        response = HttpResponse(
+            "We're handling a lot of sign-ins right now. Please try again in a moment.",
+            status=503,
+            content_type="text/plain",
+        )
+        response["Retry-After"] = str(self.retry_after)
+        return response
@@ -0,0 +1,31 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Add a unique functional index on LOWER(email) for auth_user.
+
+    auth.User ships without an index on email, so every email login and signup
+    check was a sequential scan. Blank emails (allowed for users created
+    through createsuperuser) are mapped to NULL so they don't collide. The
+    expression must stay in sync with ``users.backends.EmailKey``; it works on
+    both SQLite and PostgreSQL.
+
+    Note: the migration fails if the table already contains emails that only
+    differ by case; deduplicate those accounts first.
+    """
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("users", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "CREATE UNIQUE INDEX users_auth_user_email_lower_uniq "
+                "ON auth_user (LOWER(NULLIF(email, '')));"
+            ),
+            reverse_sql="DROP INDEX users_auth_user_email_lower_uniq;",
+        ),
+    ]
@@ -0,0 +1,26 @@
+from django.db import migrations
+
+BATCH_SIZE = 1000
+
+
+def create_missing_profiles(apps, schema_editor):
+    """Backfill profiles for users created before profiles were made on signup."""
+    User = apps.get_model("auth", "User")
+    Profile = apps.get_model("users", "Profile")
+    missing = User.objects.filter(profile__isnull=True).values_list("pk", flat=True)
+    while True:
+        user_ids = list(missing[:BATCH_SIZE])
+        if not user_ids:
+            break
+        Profile.objects.bulk_create([Profile(user_id=user_id) for user_id in user_ids])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0003_verificationcode"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_missing_profiles, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Index LOWER(first_name) and LOWER(last_name) on auth_user.
+
+    The admin's user search matches name prefixes with range conditions on
+    these expressions (see ``users.admin.prefix_search``), so it reads an
+    index range instead of scanning the table. Like 0002, the expressions
+    work on both SQLite and PostgreSQL.
+    """
+
+    dependencies = [
+        ("users", "0005_accountdeletion"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX users_auth_user_first_name_lower_idx "
+                "ON auth_user (LOWER(first_name));"
+            ),
+            reverse_sql="DROP INDEX users_auth_user_first_name_lower_idx;",
+        ),
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX users_auth_user_last_name_lower_idx "
+                "ON auth_user (LOWER(last_name));"
+            ),
+            reverse_sql="DROP INDEX users_auth_user_last_name_lower_idx;",
+        ),
+    ]
@@ -0,0 +1,177 @@
+from django.db import migrations
+
+# Name, location and bio of each profile, indexed for the member directory
+# (users/directory.py). Triggers keep the index in sync with every write to
+# users_profile and to auth_user names, including bulk_create and raw
+# deletes, which send no signals. Existing profiles are indexed with
+# ``manage.py reindex_directory``.
+
+SQLITE_FORWARD = [
+    # prefix='2 3' adds prefix indexes so short search-as-you-type
+    # prefixes don't scan the whole term list.
+    """
+    CREATE VIRTUAL TABLE users_profile_search USING fts5(
+        name, location, bio,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3'
+    )
+    """,
+    # Rank name matches above location matches above bio matches.
+    """
+    INSERT INTO users_profile_search (users_profile_search, rank)
+    VALUES ('rank', 'bm25(10.0, 5.0, 1.0)')
+    """,
+    """
+    CREATE TRIGGER users_profile_search_insert AFTER INSERT ON users_profile
+    BEGIN
+        INSERT INTO users_profile_search (rowid, name, location, bio)
+        SELECT new.id, u.first_name || ' ' || u.last_name, new.location, new.bio
+        FROM auth_user u WHERE u.id = new.user_id;
+    END
+    """,
+    """
+    CREATE TRIGGER users_profile_search_update
+    AFTER UPDATE OF user_id, location, bio ON users_profile
+    WHEN old.user_id IS NOT new.user_id
+        OR old.location IS NOT new.location
+        OR old.bio IS NOT new.bio
+    BEGIN
+        DELETE FROM users_profile_search WHERE rowid = old.id;
+        INSERT INTO users_profile_search (rowid, name, location, bio)
+        SELECT new.id, u.first_name || ' ' || u.last_name, new.location, new.bio
+        FROM auth_user u WHERE u.id = new.user_id;
+    END
+    """,
+    """
+    CREATE TRIGGER users_profile_search_delete AFTER DELETE ON users_profile
+    BEGIN
+        DELETE FROM users_profile_search WHERE rowid = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER users_profile_search_rename
+    AFTER UPDATE OF first_name, last_name ON auth_user
+    WHEN old.first_name IS NOT new.first_name OR old.last_name IS NOT new.last_name
+    BEGIN
+        DELETE FROM users_profile_search
+        WHERE rowid IN (SELECT id FROM users_profile WHERE user_id = new.id);
+        INSERT INTO users_profile_search (rowid, name, location, bio)
+        SELECT p.id, new.first_name || ' ' || new.last_name, p.location, p.bio
+        FROM users_profile p WHERE p.user_id = new.id;
+    END
+    """,
+]
+
+SQLITE_REVERSE = [
+    "DROP TRIGGER users_profile_search_rename",
+    "DROP TRIGGER users_profile_search_delete",
+    "DROP TRIGGER users_profile_search_update",
+    "DROP TRIGGER users_profile_search_insert",
+    "DROP TABLE users_profile_search",
+]
+
+POSTGRESQL_FORWARD = [
+    # No foreign key: Django doesn't know this table, and a reference to
+    # users_profile would make its TRUNCATE (flush) fail.
+    """
+    CREATE TABLE users_profile_search (
+        profile_id integer PRIMARY KEY,
+        document tsvector NOT NULL
+    )
+    """,
+    """
+    CREATE INDEX users_profile_search_document_idx
+    ON users_profile_search USING GIN (document)
+    """,
+    # The 'simple' configuration doesn't stem or drop stop words, which suits
+    # names and places; prefix queries cover word endings.
+    """
+    CREATE FUNCTION users_profile_search_document(name text, location text, bio text)
+    RETURNS tsvector LANGUAGE sql IMMUTABLE AS $$
+        SELECT setweight(to_tsvector('simple', coalesce(name, '')), 'A')
+            || setweight(to_tsvector('simple', coalesce(location, '')), 'B')
+            || setweight(to_tsvector('simple', coalesce(bio, '')), 'C')
+    $$
+    """,
+    """
+    CREATE FUNCTION users_profile_search_sync() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            DELETE FROM users_profile_search WHERE profile_id = OLD.id;
+            RETURN NULL;
+        END IF;
+        INSERT INTO users_profile_search (profile_id, document)
+        SELECT NEW.id, users_profile_search_document(
+            u.first_name || ' ' || u.last_name, NEW.location, NEW.bio
+        )
+        FROM auth_user u WHERE u.id = NEW.user_id
+        ON CONFLICT (profile_id) DO UPDATE SET document = EXCLUDED.document;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER users_profile_search_sync
+    AFTER INSERT OR DELETE OR UPDATE OF user_id, location, bio ON users_profile
+    FOR EACH ROW EXECUTE FUNCTION users_profile_search_sync()
+    """,
+    """
+    CREATE FUNCTION users_profile_search_rename() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        UPDATE users_profile_search s
+        SET document = users_profile_search_document(
+            NEW.first_name || ' ' || NEW.last_name, p.location, p.bio
+        )
+        FROM users_profile p
+        WHERE p.user_id = NEW.id AND s.profile_id = p.id;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER users_profile_search_rename
+    AFTER UPDATE OF first_name, last_name ON auth_user
+    FOR EACH ROW
+    WHEN (
+        OLD.first_name IS DISTINCT FROM NEW.first_name
+        OR OLD.last_name IS DISTINCT FROM NEW.last_name
+    )
+    EXECUTE FUNCTION users_profile_search_rename()
+    """,
+]
+
+POSTGRESQL_REVERSE = [
+    "DROP TRIGGER users_profile_search_rename ON auth_user",
+    "DROP FUNCTION users_profile_search_rename()",
+    "DROP TRIGGER users_profile_search_sync ON users_profile",
+    "DROP FUNCTION users_profile_search_sync()",
+    "DROP TABLE users_profile_search",
+    "DROP FUNCTION users_profile_search_document(text, text, text)",
+]
+
+STATEMENTS = {
+    "sqlite": (SQLITE_FORWARD, SQLITE_REVERSE),
+    "postgresql": (POSTGRESQL_FORWARD, POSTGRESQL_REVERSE),
+}
+
+
+def run(direction):
+    def operation(apps, schema_editor):
+        statements = STATEMENTS.get(schema_editor.connection.vendor)
+        # Other databases have no directory search.
+        for sql in statements[direction] if statements else []:
+            schema_editor.execute(sql)
+
+    return operation
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0006_user_name_lower_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(run(0), run(1)),
+    ]
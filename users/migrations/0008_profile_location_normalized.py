@@ -0,0 +1,68 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:37
+
+from importlib import import_module
+
+from django.conf import settings
+from django.db import migrations, models
+
+from users.gazetteer import normalize_location
+
+BATCH_SIZE = 1000
+
+# Adding a NOT NULL column makes SQLite rebuild users_profile, which drops
+# the directory search triggers on it and fails on the one on auth_user
+# that reads it. They are dropped first and created again afterwards.
+search = import_module("users.migrations.0007_profile_search")
+SQLITE_TRIGGERS = [sql for sql in search.SQLITE_FORWARD if "CREATE TRIGGER" in sql]
+SQLITE_DROP_TRIGGERS = [sql for sql in search.SQLITE_REVERSE if "DROP TRIGGER" in sql]
+
+
+def sqlite_statements(statements):
+    def operation(apps, schema_editor):
+        if schema_editor.connection.vendor == "sqlite":
+            for sql in statements:
+                schema_editor.execute(sql)
+
+    return operation
+
+
+drop_triggers = sqlite_statements(SQLITE_DROP_TRIGGERS)
+create_triggers = sqlite_statements(SQLITE_TRIGGERS)
+
+
+def normalize_locations(apps, schema_editor):
+    """Fill location_normalized of existing profiles (see Profile.location_key)."""
+    Profile = apps.get_model("users", "Profile")
+    max_length = Profile._meta.get_field("location_normalized").max_length
+    profiles = Profile.objects.exclude(location="").order_by("pk").only("location")
+    last_pk = 0
+    while batch := list(profiles.filter(pk__gt=last_pk)[:BATCH_SIZE]):
+        for profile in batch:
+            profile.location_normalized = normalize_location(profile.location)[
+                :max_length
+            ]
+        Profile.objects.bulk_update(batch, ["location_normalized"])
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0007_profile_search'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_triggers, create_triggers),
+        migrations.AddField(
+            model_name='profile',
+            name='location_normalized',
+            field=models.CharField(blank=True, editable=False, max_length=60),
+        ),
+        migrations.RunPython(normalize_locations, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(fields=['location_normalized', 'id'], name='users_profile_location_idx'),
+        ),
+        migrations.RunPython(create_triggers, drop_triggers),
+    ]
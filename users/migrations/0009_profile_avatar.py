@@ -0,0 +1,30 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:43
+
+from importlib import import_module
+
+from django.db import migrations, models
+
+# SQLite rebuilds users_profile to add the columns; see 0008.
+location = import_module("users.migrations.0008_profile_location_normalized")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0008_profile_location_normalized'),
+    ]
+
+    operations = [
+        migrations.RunPython(location.drop_triggers, location.create_triggers),
+        migrations.AddField(
+            model_name='profile',
+            name='avatar',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='avatar_pending',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.RunPython(location.create_triggers, location.drop_triggers),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:49
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0009_profile_avatar'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('user_id', models.IntegerField(blank=True, null=True)),
+                ('kind', models.PositiveSmallIntegerField(choices=[(1, 'Logged in'), (2, 'Failed login'), (3, 'Logged out'), (4, 'Password changed'), (5, 'Password reset'), (6, 'Email verified'), (7, 'Failed email verification'), (8, 'Account deletion requested')])),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('ip', models.GenericIPAddressField(blank=True, null=True)),
+                ('user_agent', models.CharField(blank=True, max_length=200)),
+                ('email', models.CharField(blank=True, max_length=254)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user_id', 'created_at'], name='users_audit_user_time_idx'), models.Index(fields=['created_at'], name='users_audit_created_idx')],
+            },
+        ),
+    ]
@@ -1,12 +1,233 @@
+from asgiref.sync import sync_to_async
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.crypto import salted_hmac
+
+from .gazetteer import normalize_location
 
 
 class Profile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
     bio = models.TextField(blank=True)
     location = models.CharField(max_length=30, blank=True)
+    # normalize_location(location), which the directory filters on; derived
+    # in save() and by bulk imports.
+    location_normalized = models.CharField(max_length=60, blank=True, editable=False)
     birth_date = models.DateField(null=True, blank=True)
+    # SHA-256 digests of the avatar shown and of an upload still being
+    # rendered (see users/avatars.py)
+    avatar = models.CharField(max_length=64, blank=True, editable=False)
+    avatar_pending = models.CharField(max_length=64, blank=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["location_normalized", "id"], name="users_profile_location_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.username}'s profile"
+
+    def save(self, *args, **kwargs):
+        self.location_normalized = self.location_key(self.location)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "location" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "location_normalized"}
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def location_key(cls, location):
+        """The ``location_normalized`` value of ``location``."""
+        max_length = cls._meta.get_field("location_normalized").max_length
+        return normalize_location(location)[:max_length]
+
+
+def hash_verification_code(code):
+    """HMAC a verification code with SECRET_KEY so a DB dump can't reveal codes."""
+    return salted_hmac(
+        "users.VerificationCode", code, algorithm="sha256"
+    ).hexdigest()
+
+
+class VerificationCodeManager(models.Manager):
+    def active_for(self, user):
+        return self.filter(user=user, consumed_at__isnull=True)
+
+    def latest_active(self, user):
+        """Return the user's most recent unused code (expired or not), or None."""
+        return self.active_for(user).order_by("-created_at").first()
+
+    async def alatest_active(self, user):
+        return await self.active_for(user).order_by("-created_at").afirst()
+
+    def issue(self, user, code, lifetime):
+        """Retire the user's outstanding codes and store a new one."""
+        now = timezone.now()
+        with transaction.atomic():
+            self.active_for(user).update(consumed_at=now)
+            return self.create(
+                user=user,
+                code_hash=hash_verification_code(code),
+                created_at=now,
+                expires_at=now + lifetime,
+            )
+
+    async def aissue(self, user, code, lifetime):
+        # Transactions have no async API yet.
+        return await sync_to_async(self.issue)(user, code, lifetime)
+
+    def usable(self, user, code, max_attempts, now):
+        """The user's codes matching ``code`` that may still be consumed."""
+        return self.active_for(user).filter(
+            code_hash=hash_verification_code(code),
+            expires_at__gt=now,
+            attempts__lt=max_attempts,
+        )
+
+    def consume(self, user, code, max_attempts):
+        """
+        Atomically use up a matching code.
+
+        A single ``UPDATE ... WHERE consumed_at IS NULL`` both checks and
+        consumes the code, so two concurrent requests can't both succeed.
+        Returns True if a valid, unexpired, unused code matched.
+        """
+        now = timezone.now()
+        return bool(
+            self.usable(user, code, max_attempts, now).update(consumed_at=now)
+        )
+
+    async def aconsume(self, user, code, max_attempts):
+        now = timezone.now()
+        return bool(
+            await self.usable(user, code, max_attempts, now).aupdate(consumed_at=now)
+        )
+
+    def record_failed_attempt(self, code):
+        self.filter(pk=code.pk).update(attempts=F("attempts") + 1)
+
+    async def arecord_failed_attempt(self, code):
+        await self.filter(pk=code.pk).aupdate(attempts=F("attempts") + 1)
+
+
+class VerificationCode(models.Model):
+    """A 6-digit email verification code. Only its HMAC is stored."""
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="verification_codes"
+    )
+    code_hash = models.CharField(max_length=64)
+    created_at = models.DateTimeField(default=timezone.now)
+    expires_at = models.DateTimeField()
+    attempts = models.PositiveSmallIntegerField(default=0)
+    consumed_at = models.DateTimeField(null=True, blank=True)
+
+    objects = VerificationCodeManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["expires_at"], name="users_vcode_expires_idx"),
+            models.Index(
+                fields=["user", "created_at"],
+                name="users_vcode_active_idx",
+                condition=Q(consumed_at__isnull=True),
+            ),
+        ]
+
+    def __str__(self):
+        return f"Verification code for {self.user.email}"
+
+    @property
+    def is_expired(self):
+        return self.expires_at <= timezone.now()
+
+
+class AccountDeletion(models.Model):
+    """
+    An account deactivated by its owner, waiting to be purged.
+
+    ``DeleteAccountView`` only deactivates the user and records the request;
+    ``purge_deleted_accounts`` then deletes the related rows in batches (see
+    ``users/deletion.py``). The user is referenced by id rather than a
+    foreign key so the record, and the purge progress it tracks, outlive
+    the user.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    user_id = models.IntegerField(unique=True)
+    requested_at = models.DateTimeField(default=timezone.now)
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    # Table being purged and rows deleted so far
+    stage = models.CharField(max_length=100, blank=True)
+    rows_deleted = models.PositiveBigIntegerField(default=0)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"], name="users_deletion_due_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"Deletion of user {self.user_id} ({self.status})"
+
+
+class AuditEvent(models.Model):
+    """
+    A security-relevant event on an account, shown in its activity timeline.
+
+    Rows are only ever inserted, in batches by ``users/audit.py``, and
+    deleted by ``purge_audit_events`` or with the account. Like
+    ``AccountDeletion`` the user is referenced by id, so a batch written
+    after its user is purged can't fail on a foreign key.
+    """
+
+    class Kind(models.IntegerChoices):
+        LOGIN = 1, "Logged in"
+        LOGIN_FAILED = 2, "Failed login"
+        LOGOUT = 3, "Logged out"
+        PASSWORD_CHANGED = 4, "Password changed"
+        PASSWORD_RESET = 5, "Password reset"
+        EMAIL_VERIFIED = 6, "Email verified"
+        EMAIL_VERIFICATION_FAILED = 7, "Failed email verification"
+        DELETION_REQUESTED = 8, "Account deletion requested"
+
+    # Null for failed logins with an unknown email
+    user_id = models.IntegerField(null=True, blank=True)
+    kind = models.PositiveSmallIntegerField(choices=Kind.choices)
+    created_at = models.DateTimeField(default=timezone.now)
+    ip = models.GenericIPAddressField(null=True, blank=True)
+    user_agent = models.CharField(max_length=200, blank=True)
+    # Email tried by a failed login
+    email = models.CharField(max_length=254, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user_id", "created_at"], name="users_audit_user_time_idx"
+            ),
+            models.Index(fields=["created_at"], name="users_audit_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()} (user {self.user_id})"
+
+    @property
+    def is_failure(self):
+        return self.kind in (
+            self.Kind.LOGIN_FAILED,
+            self.Kind.EMAIL_VERIFICATION_FAILED,
+        )
@@ -0,0 +1,73 @@
+from allauth.account.models import EmailAddress
+from allauth.account.signals import (
+    email_confirmed,
+    password_changed,
+    password_reset,
+    password_set,
+)
+from django.contrib.auth.models import User
+from django.contrib.auth.signals import (
+    user_logged_in,
+    user_logged_out,
+    user_login_failed,
+)
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import audit
+from .cache import bump_user_version
+from .models import AuditEvent, Profile
+
+
+@receiver(post_save, sender=User)
+def create_profile(sender, instance, created, raw=False, **kwargs):
+    """Create the Profile together with the User so views never have to."""
+    if created and not raw:
+        Profile.objects.create(user=instance)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(sender, instance, **kwargs):
+    bump_user_version(instance.pk)
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+@receiver(post_save, sender=EmailAddress)
+@receiver(post_delete, sender=EmailAddress)
+def user_related_changed(sender, instance, **kwargs):
+    bump_user_version(instance.user_id)
+
+
+@receiver(user_logged_in)
+def audit_login(sender, request, user, **kwargs):
+    audit.record(AuditEvent.Kind.LOGIN, request, user)
+
+
+@receiver(user_logged_out)
+def audit_logout(sender, request, user, **kwargs):
+    if user is not None:
+        audit.record(AuditEvent.Kind.LOGOUT, request, user)
+
+
+@receiver(user_login_failed)
+def audit_login_failed(sender, credentials, request=None, **kwargs):
+    email = credentials.get("email") or credentials.get("username") or ""
+    audit.record(AuditEvent.Kind.LOGIN_FAILED, request, email=email)
+
+
+@receiver(password_changed)
+@receiver(password_set)
+def audit_password_changed(sender, request, user, **kwargs):
+    audit.record(AuditEvent.Kind.PASSWORD_CHANGED, request, user)
+
+
+@receiver(password_reset)
+def audit_password_reset(sender, request, user, **kwargs):
+    audit.record(AuditEvent.Kind.PASSWORD_RESET, request, user)
+
+
+@receiver(email_confirmed)
+def audit_email_confirmed(sender, request, email_address, **kwargs):
+    audit.record(AuditEvent.Kind.EMAIL_VERIFIED, request, email_address.user)
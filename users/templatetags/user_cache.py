@@ -0,0 +1,63 @@
+"""
+``{% usercache %}``: template fragments cached per user.
+
+    {% load user_cache %}
+    {% usercache "dashboard" %} ... {% endusercache %}
+
+The key embeds the current user's cache version (``users.cache``), which
+``users/signals.py`` bumps whenever their User, Profile or EmailAddress is
+saved, so an edit is visible on the next render. USER_FRAGMENT_CACHE_TIMEOUT
+only bounds how stale time-dependent output (``timesince``) can get.
+
+Hits and misses are counted as ``fragment_cache_requests_total``.
+"""
+
+from django import template
+from django.conf import settings
+from django.core.cache import caches
+
+from core import metrics
+from users.cache import get_user_version
+
+register = template.Library()
+
+
+class UserCacheNode(template.Node):
+    def __init__(self, nodelist, fragment_name):
+        self.nodelist = nodelist
+        self.fragment_name = fragment_name
+
+    def render(self, context):
+        fragment_name = self.fragment_name.resolve(context)
+        user = context.get("user")
+        timeout = settings.USER_FRAGMENT_CACHE_TIMEOUT
+        if not timeout or user is None or not user.is_authenticated:
+            return self.nodelist.render(context)
+
+        cache = caches["default"]
+        key = (
+            f"users:fragment:{fragment_name}:{user.pk}:{get_user_version(user.pk)}"
+        )
+        value = cache.get(key)
+        metrics.inc(
+            "fragment_cache_requests_total",
+            fragment=fragment_name,
+            result="miss" if value is None else "hit",
+        )
+        if value is None:
+            value = self.nodelist.render(context)
+            cache.set(key, value, timeout)
+        return value
+
+
+@register.tag
+def usercache(parser, token):
+    """Cache the enclosed fragment for the current user, under the given name."""
+    bits = token.split_contents()
+    if len(bits) != 2:
+        raise template.TemplateSyntaxError(
+            f"'{bits[0]}' tag takes exactly one argument, the fragment name."
+        )
+    nodelist = parser.parse(("endusercache",))
+    parser.delete_first_token()
+    return UserCacheNode(nodelist, parser.compile_filter(bits[1]))
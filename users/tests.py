@@ -1,3 +1,819 @@
-from django.test import TestCase
+import importlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from io import BytesIO, StringIO
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from allauth.account.models import EmailAddress, EmailConfirmation
+from asgiref.sync import sync_to_async
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import aauthenticate, authenticate, get_user_model
+from django.contrib.auth.hashers import check_password, make_password
+from django.contrib.auth.models import Group, Permission
+from django.contrib.auth.signals import user_login_failed
+from django.contrib.sessions.models import Session
+from django.core import mail
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import clear_url_caches, reverse
+from django.utils import timezone
+from PIL import Image
+
+from core.models import OutboundEmail
+
+from . import audit
+from .avatars import (
+    FORMATS,
+    SIZES,
+    avatar_directory,
+    image_path,
+    stored_digests,
+)
+from .bulk import import_batch
+from .directory import reindex, search_profiles
+from .deletion import purge_due_accounts, related_querysets, request_account_deletion
+from .gazetteer import write_gazetteer
+from .hashers import shutdown_pool
+from .models import (
+    AccountDeletion,
+    AuditEvent,
+    Profile,
+    VerificationCode,
+    hash_verification_code,
+)
+
+User = get_user_model()
+
+
+def clear_caches():
+    # Rate limit counters live in the cache and would leak between tests.
+    for alias in settings.CACHES:
+        caches[alias].clear()
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class EmailBackendTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            "jane", email="Jane@Example.com", password="secret12345"
+        )
+
+    def count_hashes(self):
+        """Patch User.check_password and User.set_password to count calls."""
+        patches = [
+            mock.patch.object(
+                User, name, autospec=True, side_effect=getattr(User, name)
+            )
+            for name in ("check_password", "set_password")
+        ]
+        mocks = [patch.start() for patch in patches]
+        for patch in patches:
+            self.addCleanup(patch.stop)
+        return lambda: sum(m.call_count for m in mocks)
+
+    def test_email_is_case_insensitive(self):
+        user = authenticate(None, email="jANE@example.COM", password="secret12345")
+        self.assertEqual(user, self.user)
+
+    def test_wrong_password_hashes_once(self):
+        hashes = self.count_hashes()
+        failures = []
+        user_login_failed.connect(lambda **kwargs: failures.append(kwargs), weak=False)
+        self.addCleanup(user_login_failed.receivers.clear)
+        self.assertIsNone(authenticate(None, email="jane@example.com", password="x"))
+        self.assertEqual(hashes(), 1)
+        self.assertEqual(len(failures), 1)
+
+    def test_unknown_email_hashes_once(self):
+        hashes = self.count_hashes()
+        self.assertIsNone(authenticate(None, email="nobody@example.com", password="x"))
+        self.assertEqual(hashes(), 1)
+
+    async def test_async_wrong_password_hashes_once(self):
+        hashes = self.count_hashes()
+        user = await aauthenticate(None, email="jane@example.com", password="x")
+        self.assertIsNone(user)
+        self.assertEqual(hashes(), 1)
+
+    def test_inactive_user_is_refused(self):
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        user = authenticate(None, email="jane@example.com", password="secret12345")
+        self.assertIsNone(user)
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
+    EMAIL_VERIFICATION_MAX_ATTEMPTS=3,
+)
+class VerificationCodeTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            "jane", email="jane@example.com", password="secret12345"
+        )
+
+    def setUp(self):
+        clear_caches()
+
+    def issue(self, code="123456", lifetime=timedelta(minutes=10)):
+        return VerificationCode.objects.issue(self.user, code, lifetime)
+
+    def consume(self, code):
+        return VerificationCode.objects.consume(self.user, code, max_attempts=3)
+
+    def test_only_the_hmac_is_stored(self):
+        code = self.issue()
+        self.assertNotIn("123456", code.code_hash)
+        self.assertEqual(code.code_hash, hash_verification_code("123456"))
+
+    def test_issue_retires_earlier_codes(self):
+        self.issue("111111")
+        self.issue("222222")
+        self.assertFalse(self.consume("111111"))
+        self.assertTrue(self.consume("222222"))
+
+    def test_a_code_is_consumed_once(self):
+        self.issue()
+        self.assertFalse(self.consume("654321"))
+        self.assertTrue(self.consume("123456"))
+        self.assertFalse(self.consume("123456"))
+
+    def test_expired_codes_are_refused(self):
+        self.issue(lifetime=timedelta(seconds=-1))
+        self.assertFalse(self.consume("123456"))
+
+    async def test_async_consume_matches_consume(self):
+        await sync_to_async(self.issue)()
+        manager = VerificationCode.objects
+        self.assertFalse(await manager.aconsume(self.user, "654321", max_attempts=3))
+        self.assertTrue(await manager.aconsume(self.user, "123456", max_attempts=3))
+        self.assertFalse(await manager.aconsume(self.user, "123456", max_attempts=3))
+
+    def test_attempts_are_capped(self):
+        code = self.issue()
+        for _ in range(3):
+            VerificationCode.objects.record_failed_attempt(code)
+        self.assertFalse(self.consume("123456"))
+
+    def test_verify_view(self):
+        self.client.force_login(self.user)
+        with mock.patch("users.views.new_verification_code", return_value="123456"):
+            response = self.client.post(reverse("users:resend_verification"))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("123456", mail.outbox[0].body)
+
+        url = reverse("users:verify_email_code")
+        for message in ["Invalid"] * 3 + ["Too many"]:
+            response = self.client.post(url, {"code": "000000"})
+            self.assertEqual(response.status_code, 400)
+            self.assertIn(message, response.json()["message"])
+        response = self.client.post(url, {"code": "123456"})
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(EmailAddress.objects.get(user=self.user).verified)
+
+        VerificationCode.objects.update(attempts=0)
+        response = self.client.post(url, {"code": "123456"})
+        self.assertEqual(response.json()["success"], True)
+        self.assertTrue(EmailAddress.objects.get(user=self.user).verified)
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
+    RATELIMIT_LOGIN_EMAIL="3/15m",
+)
+class LoginRateLimitTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User.objects.create_user(
+            "jane", email="jane@example.com", password="secret12345"
+        )
+
+    def setUp(self):
+        clear_caches()
+
+    def login(self, password, ip="10.0.0.1"):
+        response = self.client.post(
+            reverse("users:login"),
+            {"email": "jane@example.com", "password": password},
+            REMOTE_ADDR=ip,
+        )
+        self.client.logout()
+        return response
+
+    def test_failed_logins_lock_out_the_address_from_that_ip(self):
+        for _ in range(3):
+            self.assertEqual(self.login("wrong").status_code, 200)
+        response = self.login("secret12345")
+        self.assertEqual(response.status_code, 429)
+        self.assertTrue(1 <= int(response["Retry-After"]) <= 15 * 60)
+        # The owner, elsewhere, can still log in.
+        self.assertEqual(self.login("secret12345", ip="10.0.0.2").status_code, 302)
+
+    def test_successful_logins_are_not_counted(self):
+        for _ in range(5):
+            self.assertEqual(self.login("secret12345").status_code, 302)
+
+    def use_url_modules(self):
+        # The URLconfs pick the sync or async views when they are imported.
+        for module in ("core.urls", "users.urls", settings.ROOT_URLCONF):
+            importlib.reload(importlib.import_module(module))
+        clear_url_caches()
+
+    @override_settings(ASYNC_VIEWS=True)
+    def test_async_failed_logins_lock_out(self):
+        self.use_url_modules()
+        # Runs after override_settings has restored ASYNC_VIEWS.
+        self.addCleanup(self.use_url_modules)
+        for _ in range(3):
+            response = self.login("wrong")
+            self.assertContains(response, "Invalid email or password.")
+        self.assertEqual(self.login("secret12345").status_code, 429)
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class QueryBudgetTests(TestCase):
+    """
+    Render the pages under their ``query_budget``s, which raise in tests.
+
+    Lists are filled with more rows than a page holds, so a query per row
+    would show up.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            "jane", email="jane@example.com", password="secret12345"
+        )
+        EmailAddress.objects.create(
+            user=cls.user, email=cls.user.email, primary=True, verified=True
+        )
+        for i in range(30):
+            member = User.objects.create_user(
+                f"member{i}", email=f"member{i}@example.com", first_name="Anna"
+            )
+            Profile.objects.filter(user=member).update(
+                location="Zürich, CH", location_normalized="zurich ch"
+            )
+        now = timezone.now()
+        AuditEvent.objects.bulk_create(
+            AuditEvent(
+                user_id=cls.user.pk,
+                kind=AuditEvent.Kind.LOGIN,
+                created_at=now - timedelta(minutes=i),
+                ip="10.0.0.1",
+            )
+            for i in range(25)
+        )
+
+    def setUp(self):
+        clear_caches()
+
+    def htmx(self, url, target, **params):
+        return self.client.get(
+            url, params, HTTP_HX_REQUEST="true", HTTP_HX_TARGET=target
+        )
+
+    def test_login_and_signup(self):
+        self.assertEqual(self.client.get(reverse("users:login")).status_code, 200)
+        response = self.client.post(
+            reverse("users:login"),
+            {"email": "jane@example.com", "password": "secret12345"},
+        )
+        self.assertEqual(response.status_code, 302)
+        self.client.logout()
+        response = self.client.post(
+            reverse("users:signup"),
+            {
+                "email": "new@example.com",
+                "password1": "secret12345",
+                "password2": "secret12345",
+            },
+        )
+        self.assertEqual(response.status_code, 302)
+
+    def test_settings(self):
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get(reverse("users:settings")).status_code, 200)
+        response = self.client.post(
+            reverse("users:settings"),
+            {"first_name": "Jane", "last_name": "Doe", "bio": "Hi", "location": ""},
+            HTTP_HX_REQUEST="true",
+            HTTP_HX_TARGET="profile-form",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, "Jane")
+
+    def test_directory(self):
+        self.client.force_login(self.user)
+        url = reverse("users:directory")
+        self.assertContains(self.client.get(url), "directory-more")
+        response = self.htmx(url, "directory-results", q="anna")
+        self.assertContains(response, "Anna", count=settings.DIRECTORY_PAGE_SIZE)
+        response = self.htmx(url, "directory-results", location="Zürich, CH")
+        self.assertContains(response, "Zürich, CH", count=settings.DIRECTORY_PAGE_SIZE)
+
+    def test_directory_location_uses_the_gazetteer_spelling(self):
+        self.client.force_login(self.user)
+        url = reverse("users:directory")
+        with tempfile.TemporaryDirectory() as directory:
+            path = f"{directory}/gazetteer.idx"
+            write_gazetteer([("Zürich, CH", 400000, ["Zürich", "Zurich"])], path)
+            with override_settings(GAZETTEER_PATH=path):
+                response = self.htmx(url, "directory-results", location="zurich")
+        self.assertContains(response, "Zürich, CH", count=settings.DIRECTORY_PAGE_SIZE)
+
+    def test_activity(self):
+        self.client.force_login(self.user)
+        url = reverse("users:activity")
+        response = self.htmx(url, "activity")
+        self.assertContains(response, "Logged in", count=settings.ACTIVITY_PAGE_SIZE)
+        seen = settings.ACTIVITY_PAGE_SIZE
+        while cursor := re.search(r"after=(\w+)", response.content.decode()):
+            response = self.htmx(url, "activity-more", after=cursor[1])
+            seen += response.content.count(b"Logged in")
+        self.assertEqual(seen, 25)
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class AccountDeletionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [
+            User.objects.create_user(name, email=f"{name}@example.com")
+            for name in ("jane", "john")
+        ]
+        group = Group.objects.create(name="members")
+        permission = Permission.objects.get(codename="view_user")
+        for user in cls.users:
+            address = EmailAddress.objects.create(
+                user=user, email=user.email, primary=True
+            )
+            EmailConfirmation.create(address)
+            VerificationCode.objects.issue(user, "123456", timedelta(minutes=10))
+            AuditEvent.objects.create(user_id=user.pk, kind=AuditEvent.Kind.LOGIN)
+            OutboundEmail.objects.create(
+                subject="Your code", from_email="noreply@example.com", to=[user.email]
+            )
+            user.groups.add(group)
+            user.user_permissions.add(permission)
+            if apps.is_installed("django.contrib.admin"):
+                from django.contrib.admin.models import CHANGE, LogEntry
+
+                LogEntry.objects.log_actions(user.pk, [user], CHANGE)
+            if apps.is_installed("allauth.socialaccount"):
+                from allauth.socialaccount.models import SocialAccount, SocialToken
+
+                account = SocialAccount.objects.create(
+                    user=user, provider="github", uid=user.username
+                )
+                SocialToken.objects.create(account=account, token="secret")
+
+    def test_related_querysets_cover_every_relation(self):
+        models = {queryset.model for queryset in related_querysets(0)}
+        for rel in User._meta.related_objects:
+            model = rel.through if rel.many_to_many else rel.related_model
+            self.assertIn(model, models)
+        for field in User._meta.many_to_many:
+            self.assertIn(field.remote_field.through, models)
+
+    def test_purge_deletes_every_related_row(self):
+        jane, john = self.users
+        self.client.force_login(jane)
+        self.client_class().force_login(john)
+        querysets, kept = (related_querysets(user.pk) for user in self.users)
+        for queryset in querysets + kept:
+            self.assertTrue(queryset.exists(), queryset.model)
+
+        request_account_deletion(jane)
+        self.assertEqual(purge_due_accounts(), (1, 0, 0))
+        for queryset in querysets:
+            self.assertFalse(queryset.exists(), queryset.model)
+        self.assertFalse(User.objects.filter(pk=jane.pk).exists())
+        # Nothing was left in the audit buffer to be written afterwards.
+        audit.flush()
+        self.assertFalse(AuditEvent.objects.filter(user_id=jane.pk).exists())
+        self.assertEqual(
+            AccountDeletion.objects.get().status, AccountDeletion.Status.DONE
+        )
+        # The other account is untouched, sessions included.
+        for queryset in kept:
+            self.assertTrue(queryset.exists(), queryset.model)
+        self.assertEqual(Session.objects.count(), 1)
+        self.assertEqual(
+            Session.objects.get().get_decoded()["_auth_user_id"], str(john.pk)
+        )
+
+    def test_reactivation_cancels_the_purge(self):
+        jane = self.users[0]
+        request_account_deletion(jane)
+        User.objects.filter(pk=jane.pk).update(is_active=True)
+        self.assertEqual(purge_due_accounts(), (0, 1, 0))
+        self.assertTrue(User.objects.filter(pk=jane.pk).exists())
+        self.assertFalse(AccountDeletion.objects.exists())
+
+
+@skipUnless(apps.is_installed("django.contrib.admin"), "admin is disabled")
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class UserAdminTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser("admin", "admin@example.com")
+        EmailAddress.objects.create(
+            user=cls.admin, email=cls.admin.email, primary=True, verified=True
+        )
+
+    def changelist_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("admin:auth_user_changelist"))
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_changelist_queries_do_not_grow_with_users(self):
+        self.client.force_login(self.admin)
+        User.objects.create_user("member0", email="member0@example.com")
+        expected = self.changelist_queries()
+        # Users without any EmailAddress row cost no query of their own.
+        for i in range(1, 100):
+            User.objects.create_user(f"member{i}", email=f"member{i}@example.com")
+        self.assertEqual(self.changelist_queries(), expected)
+
+
+class AuditLogTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("jane", email="jane@example.com")
+
+    def setUp(self):
+        # Events buffered by earlier tests are written, and rolled back, here.
+        audit.flush()
+
+    def events(self):
+        return AuditEvent.objects.filter(user_id=self.user.pk)
+
+    def test_events_wait_for_flush(self):
+        audit.record(AuditEvent.Kind.LOGIN, user=self.user)
+        self.assertFalse(self.events().exists())
+        self.assertEqual(audit.flush(), 1)
+        self.assertEqual(self.events().count(), 1)
+        self.assertEqual(audit.flush(), 0)
+
+    @override_settings(AUDIT_BUFFER_SIZE=3)
+    def test_a_full_buffer_is_written_without_the_thread(self):
+        for _ in range(3):
+            audit.record(AuditEvent.Kind.LOGIN, user=self.user)
+        self.assertEqual(self.events().count(), 3)
+
+    def test_failed_logins_are_resolved_to_users_at_flush(self):
+        request = RequestFactory().post("/", REMOTE_ADDR="not an ip")
+        audit.record(AuditEvent.Kind.LOGIN_FAILED, request, email="JANE@example.com")
+        audit.record(AuditEvent.Kind.LOGIN_FAILED, email="nobody@example.com")
+        with self.assertNumQueries(2):
+            audit.flush()
+        event = self.events().get()
+        self.assertEqual(event.kind, AuditEvent.Kind.LOGIN_FAILED)
+        self.assertIsNone(event.ip)
+        self.assertTrue(
+            AuditEvent.objects.filter(
+                user_id=None, email="nobody@example.com"
+            ).exists()
+        )
+
+    def test_timeline_pages_through_events_sharing_a_timestamp(self):
+        now = timezone.now()
+        AuditEvent.objects.bulk_create(
+            AuditEvent(
+                user_id=self.user.pk,
+                kind=AuditEvent.Kind.LOGIN,
+                created_at=now - timedelta(minutes=i // 2),
+            )
+            for i in range(7)
+        )
+        expected = list(self.events().order_by("-created_at", "-pk"))
+        seen = []
+        after = None
+        while True:
+            items, after = audit.timeline(self.user.pk, 2, after)
+            seen += items
+            if after is None:
+                break
+        self.assertEqual(seen, expected)
+        # A malformed cursor starts from the top.
+        items, _ = audit.timeline(self.user.pk, 2, "garbage_x")
+        self.assertEqual(items, expected[:2])
+
+
+class BulkImportTests(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def create_users(self, count):
+        for i in range(count):
+            user = User.objects.create_user(
+                f"user{i}@example.com",
+                email=f"user{i}@example.com",
+                password="secret12345",
+                first_name=f"User {i}",
+            )
+            Profile.objects.filter(user=user).update(
+                bio="Hi",
+                location="Zürich, CH",
+                location_normalized="zurich ch",
+                birth_date=date(1990, 1, i + 1),
+            )
+            EmailAddress.objects.create(
+                user=user, email=user.email, primary=True, verified=i % 2 == 0
+            )
+
+    def snapshot(self):
+        return list(
+            User.objects.order_by("email").values_list(
+                "email",
+                "password",
+                "first_name",
+                "profile__location",
+                "profile__location_normalized",
+                "profile__birth_date",
+                "emailaddress__verified",
+            )
+        )
+
+    @override_settings(
+        PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+    )
+    def test_export_then_import_round_trips(self):
+        self.create_users(3)
+        before = self.snapshot()
+        for fmt in ("csv", "jsonl"):
+            path = f"{self.directory}/users.{fmt}"
+            call_command("export_users", path, stdout=StringIO())
+            User.objects.all().delete()
+            call_command("import_users", path, stdout=StringIO())
+            self.assertEqual(self.snapshot(), before)
+
+    def test_checkpoint_resumes_after_committed_rows(self):
+        path = f"{self.directory}/users.jsonl"
+        with open(path, "w") as f:
+            for i in range(5):
+                f.write(json.dumps({"email": f"user{i}@example.com"}) + "\n")
+        checkpoint = f"{self.directory}/import.ckpt"
+        with open(checkpoint, "w") as f:
+            f.write("3")
+        stdout = StringIO()
+        options = ["--batch-size", "1", "--checkpoint", checkpoint]
+        call_command("import_users", path, *options, stdout=stdout)
+        self.assertIn("Resuming after row 3", stdout.getvalue())
+        self.assertQuerySetEqual(
+            User.objects.order_by("email").values_list("email", flat=True),
+            ["user3@example.com", "user4@example.com"],
+        )
+        self.assertFalse(os.path.exists(checkpoint))
+
+    def test_taken_usernames_are_reported_not_retried(self):
+        User.objects.create_user("taken@example.com", email="other@example.com")
+        rows = [
+            {"email": "taken@example.com"},
+            {"email": "new@example.com"},
+            {"email": "OTHER@example.com"},
+        ]
+        created, duplicates, errors = import_batch(rows)
+        self.assertEqual((created, duplicates), (1, 1))
+        self.assertEqual(errors, [(0, "username 'taken@example.com' is taken")])
+        self.assertTrue(User.objects.filter(email="new@example.com").exists())
+
+
+@override_settings(
+    PASSWORD_HASHERS=["users.hashers.PooledPBKDF2PasswordHasher"],
+    PASSWORD_HASH_ITERATIONS=1000,
+    PASSWORD_HASHER_POOL_SIZE=1,
+)
+class PasswordHasherPoolTests(TestCase):
+    def setUp(self):
+        clear_caches()
+
+    def test_pooled_hashes_match_inline_hashes(self):
+        self.addCleanup(shutdown_pool)
+        encoded = make_password("secret12345", salt="salt")
+        self.assertTrue(encoded.startswith("pbkdf2_sha256$1000$salt$"))
+        with override_settings(PASSWORD_HASHER_POOL_SIZE=0):
+            self.assertEqual(make_password("secret12345", salt="salt"), encoded)
+        self.assertTrue(check_password("secret12345", encoded))
+
+    def test_a_full_queue_answers_503(self):
+        with override_settings(PASSWORD_HASHER_POOL_SIZE=0):
+            User.objects.create_user(
+                "jane", email="jane@example.com", password="secret12345"
+            )
+        slots = threading.BoundedSemaphore(1)
+        slots.acquire()
+        with mock.patch("users.hashers.get_pool", return_value=(None, slots)):
+            response = self.client.post(
+                reverse("users:login"),
+                {"email": "jane@example.com", "password": "secret12345"},
+            )
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "1")
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class HtmxFragmentTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("jane", email="jane@example.com")
+
+    def setUp(self):
+        clear_caches()
+        self.client.force_login(self.user)
+        self.url = reverse("users:settings")
+
+    def post(self, **headers):
+        data = {"first_name": "Jane", "last_name": "Doe", "bio": "", "location": ""}
+        return self.client.post(self.url, data, **headers)
+
+    def test_full_page_without_htmx(self):
+        response = self.client.get(self.url)
+        self.assertContains(response, "<html")
+        self.assertIn("HX-Target", response["Vary"])
+        self.assertRedirects(self.post(), self.url)
+
+    def test_only_the_targeted_block_is_rendered(self):
+        response = self.post(HTTP_HX_REQUEST="true", HTTP_HX_TARGET="profile-form")
+        self.assertEqual(response.status_code, 200)
+        content = response.content.decode().strip()
+        self.assertTrue(content.startswith('<form id="profile-form"'))
+        self.assertNotContains(response, "<html")
+        trigger = json.loads(response["HX-Trigger"])
+        self.assertEqual(trigger["messages"][0]["tags"], "success")
+        self.assertIn("updated", trigger["messages"][0]["message"])
+
+    def test_unknown_targets_and_history_restores_get_the_page(self):
+        for headers in [
+            {"HTTP_HX_REQUEST": "true", "HTTP_HX_TARGET": "elsewhere"},
+            {
+                "HTTP_HX_REQUEST": "true",
+                "HTTP_HX_TARGET": "profile-form",
+                "HTTP_HX_HISTORY_RESTORE_REQUEST": "true",
+            },
+        ]:
+            response = self.client.get(self.url, **headers)
+            self.assertContains(response, "<html")
+
+
+class DirectorySearchTests(TestCase):
+    def member(self, name, location="", bio="", is_active=True):
+        user = User.objects.create_user(
+            f"member{User.objects.count()}", first_name=name, is_active=is_active
+        )
+        profile = user.profile
+        profile.location = location
+        profile.bio = bio
+        profile.save()
+        return user
+
+    def names(self, query, **kwargs):
+        profiles, _ = search_profiles(query, **kwargs)
+        return [profile.user.first_name for profile in profiles]
+
+    def test_names_rank_above_locations_above_bios(self):
+        self.member("Carl", bio="Moved from Annaberg")
+        self.member("Bert", location="Annaberg, DE")
+        self.member("Annabel")
+        self.member("Anna", is_active=False)
+        self.assertEqual(self.names("annab"), ["Annabel", "Bert", "Carl"])
+
+    def test_every_word_must_match_as_a_prefix(self):
+        self.member("Anna", location="Zürich, CH")
+        self.member("Anna", location="Bern, CH")
+        self.assertEqual(self.names("ann zur"), ["Anna"])
+        self.assertEqual(self.names("ann zur", location="Bern, CH"), [])
+
+    def test_pages_follow_the_cursor(self):
+        for i in range(5):
+            self.member(f"Anna{i}", bio="anna " * i)
+        seen = []
+        after = None
+        while True:
+            profiles, after = search_profiles("anna", after=after, size=2)
+            seen += [profile.user.first_name for profile in profiles]
+            if after is None:
+                break
+        self.assertEqual(sorted(seen), [f"Anna{i}" for i in range(5)])
+        self.assertEqual(len(seen), 5)
+        # A malformed cursor starts from the top.
+        self.assertEqual(len(search_profiles("anna", after="x", size=2)[0]), 2)
+
+    def test_edits_and_reindex_keep_the_index_current(self):
+        user = self.member("Anna")
+        User.objects.filter(pk=user.pk).update(first_name="Berta")
+        self.assertEqual(self.names("berta"), ["Berta"])
+        self.assertEqual(self.names("anna"), [])
+        self.assertEqual(reindex(batch_size=1), 1)
+        self.assertEqual(self.names("berta"), ["Berta"])
+
+
+def png(color="red", size=(400, 300)):
+    buffer = BytesIO()
+    Image.new("RGB", size, color).save(buffer, "PNG")
+    buffer.seek(0)
+    buffer.name = "avatar.png"
+    return buffer
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
+    AVATAR_WORKERS=0,
+)
+class AvatarTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [
+            User.objects.create_user(name, email=f"{name}@example.com")
+            for name in ("jane", "john")
+        ]
+
+    def setUp(self):
+        clear_caches()
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        override = override_settings(AVATAR_ROOT=root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def upload(self, user, file):
+        self.client.force_login(user)
+        return self.client.post(
+            reverse("users:avatar"),
+            {"avatar": file},
+            HTTP_HX_REQUEST="true",
+            HTTP_HX_TARGET="avatar",
+        )
+
+    def test_upload_renders_every_size(self):
+        response = self.upload(self.users[0], png())
+        self.assertEqual(response.status_code, 200)
+        trigger = json.loads(response["HX-Trigger"])
+        self.assertIn("updated", trigger["messages"][0]["message"])
+        digest = Profile.objects.get(user=self.users[0]).avatar
+        self.assertEqual(len(digest), 64)
+        for size in SIZES:
+            for extension in FORMATS:
+                with Image.open(image_path(digest, size, extension)) as image:
+                    self.assertEqual(image.size, (size, size))
+        url = reverse("users:avatar_image", args=[digest, 64, "webp"])
+        response = self.client.get(url)
+        self.assertEqual(response["Content-Type"], "image/webp")
+        self.assertIn("immutable", response["Cache-Control"])
+
+    def test_identical_uploads_share_one_directory(self):
+        for user in self.users:
+            self.upload(user, png())
+        digests = set(Profile.objects.values_list("avatar", flat=True))
+        self.assertEqual(len(digests), 1)
+        self.assertEqual(list(stored_digests()), list(digests))
+
+    def test_images_that_cant_be_read_are_refused(self):
+        file = BytesIO(b"not an image")
+        file.name = "avatar.png"
+        response = self.upload(self.users[0], file)
+        self.assertIn("JPEG, PNG", response["HX-Trigger"])
+        self.assertEqual(Profile.objects.get(user=self.users[0]).avatar, "")
+
+    def test_process_avatars_finishes_pending_and_keeps_recent_files(self):
+        self.upload(self.users[0], png("red"))
+        self.upload(self.users[1], png("blue"))
+        used, replaced = Profile.objects.order_by("user").values_list(
+            "avatar", flat=True
+        )
+        self.upload(self.users[1], png("green"))
+        pending = Profile.objects.get(user=self.users[1]).avatar
+        # As if the worker had stopped before rendering the new upload.
+        for name in os.listdir(avatar_directory(pending)):
+            if name != "original":
+                os.remove(os.path.join(avatar_directory(pending), name))
+        Profile.objects.filter(user=self.users[1]).update(
+            avatar=replaced, avatar_pending=pending
+        )
+
+        call_command("process_avatars", stdout=StringIO())
+        # Within the grace period the replaced avatar is kept.
+        self.assertEqual(len(list(stored_digests())), 3)
+        profile = Profile.objects.get(user=self.users[1])
+        self.assertEqual((profile.avatar, profile.avatar_pending), (pending, ""))
+        self.assertTrue(os.path.exists(image_path(pending, SIZES[-1], "jpg")))
+
+        old = time.time() - 2 * 3600
+        os.utime(avatar_directory(replaced), (old, old))
+        call_command("process_avatars", "--grace", "1", stdout=StringIO())
+        self.assertEqual(sorted(stored_digests()), sorted([used, pending]))
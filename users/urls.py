@@ -1,11 +1,24 @@
+from django.conf import settings
 from django.contrib.auth.views import LogoutView
 from django.urls import include, path
 
-from .views import (DeleteAccountView, LoginView, ResendVerificationEmailView,
-                    SettingsView, SignupView, VerifyEmailCodeView)
+from . import views
+from .views import (ActivityView, AvatarImageView, AvatarView,
+                    DeleteAccountView, DirectoryView, LocationSuggestionsView,
+                    SettingsView, SignupView)
 
 app_name = "users"
 
+# Native async views when serving over ASGI (see ASYNC_VIEWS in settings)
+if settings.ASYNC_VIEWS:
+    LoginView = views.AsyncLoginView
+    ResendVerificationEmailView = views.AsyncResendVerificationEmailView
+    VerifyEmailCodeView = views.AsyncVerifyEmailCodeView
+else:
+    LoginView = views.LoginView
+    ResendVerificationEmailView = views.ResendVerificationEmailView
+    VerifyEmailCodeView = views.VerifyEmailCodeView
+
 urlpatterns = [
     # Authentication
     path("login/", LoginView.as_view(), name="login"),
@@ -13,7 +26,16 @@ urlpatterns = [
     path("logout/", LogoutView.as_view(next_page="index"), name="logout"),
     # Profile Management
     path("settings/", SettingsView.as_view(), name="settings"),
+    path("settings/avatar/", AvatarView.as_view(), name="avatar"),
+    path(
+        "avatars/<str:digest>/<int:size>.<str:extension>",
+        AvatarImageView.as_view(),
+        name="avatar_image",
+    ),
+    path("activity/", ActivityView.as_view(), name="activity"),
     path("delete-account/", DeleteAccountView.as_view(), name="delete_account"),
+    path("directory/", DirectoryView.as_view(), name="directory"),
+    path("locations/", LocationSuggestionsView.as_view(), name="locations"),
     # Email Verification
     path(
         "resend-verification/",
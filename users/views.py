@@ -1,22 +1,48 @@
-import random
+import secrets
 from datetime import timedelta
 
 from allauth.account.models import EmailAddress, EmailConfirmationHMAC
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib import messages
-from django.contrib.auth import authenticate, get_user_model, login, logout
+from django.contrib.auth import (aauthenticate, alogin, authenticate,
+                                 get_user_model, login, logout)
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.views import LogoutView
 from django.contrib.messages.views import SuccessMessageMixin
 from django.core.mail import send_mail
-from django.http import JsonResponse
+from django.http import (FileResponse, Http404, HttpResponse,
+                         HttpResponseRedirect, JsonResponse)
 from django.shortcuts import redirect, render
 from django.template.loader import render_to_string
 from django.urls import reverse_lazy
 from django.utils import timezone
-from django.views.generic import FormView, UpdateView, View
-
-from .forms import EmailLoginForm, EmailSignupForm, ProfileForm
-from .models import Profile
+from django.utils.cache import patch_cache_control
+from django.utils.decorators import method_decorator
+from django.utils.html import format_html_join
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
+from django.views.generic import FormView, TemplateView, UpdateView, View
+
+from core.htmx import (HtmxFragmentMixin, add_messages_trigger, is_htmx,
+                       render_block_to_string)
+from core.mail import asend_mail
+from core.mixins import AsyncLoginRequiredMixin, resolve_user
+from core.ratelimit import RateLimitMixin, Rule
+
+from . import audit
+from .avatars import (DIGEST, FORMATS, SIZES, AvatarUploadHandler, image_path,
+                      set_avatar)
+from .backends import primary_email_address
+from .deletion import request_account_deletion
+from .directory import search_profiles
+from .forms import AvatarForm, EmailLoginForm, EmailSignupForm, ProfileForm
+from .gazetteer import (
+    LABEL_LENGTH,
+    canonical_location,
+    get_gazetteer,
+    normalize_location,
+)
+from .models import AuditEvent, Profile, VerificationCode
 
 User = get_user_model()
 
@@ -32,19 +58,88 @@ class RedirectAuthenticatedUserMixin:
     redirect_url = reverse_lazy("dashboard")
 
     def dispatch(self, request, *args, **kwargs):
+        if self.view_is_async:
+            return self._aredirect_dispatch(request, *args, **kwargs)
         if request.user.is_authenticated:
             return redirect(self.redirect_url)
         return super().dispatch(request, *args, **kwargs)
 
+    async def _aredirect_dispatch(self, request, *args, **kwargs):
+        user = await resolve_user(request)
+        if user.is_authenticated:
+            return redirect(self.redirect_url)
+        return await super().dispatch(request, *args, **kwargs)
+
+
+class FormRateLimitMixin(RateLimitMixin):
+    """Re-render the form with an error message when rate limited."""
+
+    def ratelimited(self, request, result):
+        messages.error(
+            request,
+            f"Too many attempts. Please try again in {result.retry_after} seconds.",
+        )
+        response = self.render_to_response(self.get_context_data(), status=429)
+        response["Retry-After"] = str(result.retry_after)
+        return response
+
+
+class JsonRateLimitMixin(RateLimitMixin):
+    """Answer rate-limited requests with the JSON shape the modals expect."""
+
+    def ratelimited(self, request, result):
+        response = JsonResponse(
+            {
+                "success": False,
+                "message": f"Too many requests. Please wait {result.retry_after} seconds.",
+            },
+            status=429,
+        )
+        response["Retry-After"] = str(result.retry_after)
+        return response
+
+
+# ---------------------------
+#   Helpers
+# ---------------------------
+
+
+def new_verification_code():
+    """Return a random 6-digit verification code."""
+    return str(secrets.randbelow(900000) + 100000)
+
+
+def get_primary_email_address(user):
+    """Return the user's primary EmailAddress, creating an unverified one if missing."""
+    try:
+        return EmailAddress.objects.get(user=user, primary=True)
+    except EmailAddress.DoesNotExist:
+        return EmailAddress.objects.create(
+            user=user, email=user.email, primary=True, verified=False
+        )
+
+
+async def aget_primary_email_address(user):
+    try:
+        return await EmailAddress.objects.aget(user=user, primary=True)
+    except EmailAddress.DoesNotExist:
+        return await EmailAddress.objects.acreate(
+            user=user, email=user.email, primary=True, verified=False
+        )
+
 
 # ---------------------------
 #   Auth Views
 # ---------------------------
 
 
-class SignupView(RedirectAuthenticatedUserMixin, SuccessMessageMixin, FormView):
+class SignupView(
+    FormRateLimitMixin, RedirectAuthenticatedUserMixin, SuccessMessageMixin, FormView
+):
     """User signup view with email-based authentication."""
 
+    ratelimit_rules = [Rule("RATELIMIT_SIGNUP", key="ip")]
+    query_budget = 10
     template_name = "users/signup.html"
     form_class = EmailSignupForm
     success_url = reverse_lazy("dashboard")
@@ -52,13 +147,21 @@ class SignupView(RedirectAuthenticatedUserMixin, SuccessMessageMixin, FormView):
 
     def form_valid(self, form):
         user = form.save()
-        login(self.request, user, backend="django.contrib.auth.backends.ModelBackend")
+        login(self.request, user, backend="users.backends.EmailBackend")
         return super().form_valid(form)
 
 
-class LoginView(RedirectAuthenticatedUserMixin, FormView):
+class LoginView(FormRateLimitMixin, RedirectAuthenticatedUserMixin, FormView):
     """User login view with email-based authentication."""
 
+    # Throttle before authenticate() so brute force never reaches the hasher
+    ratelimit_rules = [
+        Rule("RATELIMIT_LOGIN", key="ip", algorithm="token_bucket"),
+        # Failed logins per address and IP, so nobody else can lock the
+        # address out
+        Rule("RATELIMIT_LOGIN_EMAIL", key="ip+post:email", failures_only=True),
+    ]
+    query_budget = 8
     template_name = "users/login.html"
     form_class = EmailLoginForm
     success_url = reverse_lazy("dashboard")
@@ -67,16 +170,13 @@ class LoginView(RedirectAuthenticatedUserMixin, FormView):
         email = form.cleaned_data["email"]
         password = form.cleaned_data["password"]
 
-        try:
-            user_obj = User.objects.get(email=email)
-            user = authenticate(username=user_obj.username, password=password)
-        except User.DoesNotExist:
-            user = None
+        user = authenticate(self.request, email=email, password=password)
 
         if user is not None:
             login(self.request, user)
             return super().form_valid(form)
 
+        self.ratelimit_failure(self.request)
         messages.error(self.request, "Invalid email or password.")
         return self.form_invalid(form)
 
@@ -91,18 +191,37 @@ class CustomLogoutView(SuccessMessageMixin, LogoutView):
 # ---------------------------
 
 
-class SettingsView(LoginRequiredMixin, SuccessMessageMixin, UpdateView):
-    """User settings and profile editing view."""
+class SettingsView(
+    LoginRequiredMixin, HtmxFragmentMixin, SuccessMessageMixin, UpdateView
+):
+    """
+    User settings and profile editing view.
+
+    The profile form posts with htmx and gets back only its own fragment;
+    the success message arrives as a toast via HX-Trigger.
+    """
 
     model = Profile
     form_class = ProfileForm
     template_name = "users/settings.html"
     success_url = reverse_lazy("users:settings")
     success_message = "Your profile has been updated successfully!"
+    htmx_blocks = {"profile-form": "profile_form"}
+    query_budget = 6
 
     def get_object(self, queryset=None):
-        profile, _ = Profile.objects.get_or_create(user=self.request.user)
-        return profile
+        # Profiles are created with the user (users/signals.py) and joined in
+        # by EmailBackend; get_or_create only covers older accounts.
+        try:
+            return self.request.user.profile
+        except Profile.DoesNotExist:
+            profile, _ = Profile.objects.get_or_create(user=self.request.user)
+            return profile
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["primary_email"] = primary_email_address(self.request.user)
+        return context
 
     def dispatch(self, request, *args, **kwargs):
         # clear old messages (optional)
@@ -110,13 +229,188 @@ class SettingsView(LoginRequiredMixin, SuccessMessageMixin, UpdateView):
         return super().dispatch(request, *args, **kwargs)
 
 
+@method_decorator(csrf_exempt, name="dispatch")
+class AvatarView(LoginRequiredMixin, RateLimitMixin, View):
+    """
+    Upload a profile picture, or poll for it while it's being rendered.
+
+    Both answer with the ``#avatar`` fragment of the settings page. The
+    upload is streamed to disk by AvatarUploadHandler; the CSRF check runs
+    after the handler is installed, since the middleware's check would read
+    the body with the default handlers.
+    """
+
+    ratelimit_rules = [Rule("RATELIMIT_AVATAR_UPLOAD", key="user", methods=["POST"])]
+    query_budget = 4
+
+    def get_profile(self):
+        # From the database, not the cached user: rendering finishes in the
+        # background.
+        profile, _ = Profile.objects.get_or_create(user=self.request.user)
+        return profile
+
+    def render_avatar(self, profile):
+        if not is_htmx(self.request):
+            return redirect("users:settings")
+        html = render_block_to_string(
+            "users/settings.html", "avatar", {"profile": profile}, self.request
+        )
+        return add_messages_trigger(self.request, HttpResponse(html))
+
+    def get(self, request, *args, **kwargs):
+        return self.render_avatar(self.get_profile())
+
+    def post(self, request, *args, **kwargs):
+        request.upload_handlers = [AvatarUploadHandler(request)]
+        return self.upload(request)
+
+    @method_decorator(csrf_protect)
+    def upload(self, request):
+        form = AvatarForm(request.POST, request.FILES)
+        profile = self.get_profile()
+        if not form.is_valid():
+            messages.error(request, form.errors["avatar"][0])
+            return self.render_avatar(profile)
+        try:
+            set_avatar(profile, form.cleaned_data["avatar"])
+        except ValueError as e:
+            messages.error(request, str(e))
+        else:
+            if profile.avatar_pending:
+                messages.info(request, "Your new picture is being processed.")
+            else:
+                messages.success(request, "Your picture has been updated.")
+        return self.render_avatar(profile)
+
+
+class AvatarImageView(View):
+    """
+    One rendered size of an avatar.
+
+    The URL names the image by its digest, so the response never changes
+    and may be cached for good by browsers and proxies.
+    """
+
+    query_budget = 0
+
+    def get(self, request, digest, size, extension):
+        if not DIGEST.fullmatch(digest) or size not in SIZES:
+            raise Http404
+        if extension not in FORMATS:
+            raise Http404
+        try:
+            file = open(image_path(digest, size, extension), "rb")
+        except FileNotFoundError:
+            raise Http404
+        response = FileResponse(file, content_type=FORMATS[extension][1])
+        response["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
+# ---------------------------
+#   Member Directory
+# ---------------------------
+
+
+class DirectoryView(
+    LoginRequiredMixin, HtmxFragmentMixin, RateLimitMixin, TemplateView
+):
+    """
+    Searchable list of members.
+
+    Typing in the search or location box swaps ``#directory-results``;
+    "Load more" replaces itself with the next page of cards.
+    """
+
+    template_name = "users/directory.html"
+    htmx_blocks = {
+        "directory-results": "results",
+        "directory-more": "results_page",
+    }
+    ratelimit_rules = [Rule("RATELIMIT_DIRECTORY_SEARCH", key="user", methods=["GET"])]
+    query_budget = 4
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        query = self.request.GET.get("q", "").strip()[:100]
+        location = self.request.GET.get("location", "").strip()[:LABEL_LENGTH]
+        profiles, next_cursor = search_profiles(
+            query,
+            after=self.request.GET.get("after"),
+            size=settings.DIRECTORY_PAGE_SIZE,
+            # Profiles store the spelling ProfileForm.clean_location() picked.
+            location=canonical_location(location),
+        )
+        context.update(
+            query=query, location=location, profiles=profiles, next_cursor=next_cursor
+        )
+        return context
+
+
+class ActivityView(LoginRequiredMixin, HtmxFragmentMixin, TemplateView):
+    """
+    The user's security activity timeline (users/audit.py), newest first.
+
+    The dashboard loads it into ``#activity`` after rendering; "Load more"
+    replaces itself with the next page.
+    """
+
+    template_name = "users/activity.html"
+    htmx_blocks = {
+        "activity": "activity",
+        "activity-more": "activity_page",
+    }
+    query_budget = 3
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        events, next_cursor = audit.timeline(
+            self.request.user.pk,
+            size=settings.ACTIVITY_PAGE_SIZE,
+            after=self.request.GET.get("after"),
+        )
+        context.update(events=events, next_cursor=next_cursor)
+        return context
+
+
+class LocationSuggestionsView(View):
+    """
+    ``<option>`` elements for the location ``<datalist>`` of a form.
+
+    Answered from the in-process gazetteer (users/gazetteer.py): no session,
+    no database, and the same answer for everyone, so browsers and proxies
+    may cache it.
+    """
+
+    query_budget = 0
+    cache_seconds = 86400
+
+    def get(self, request, *args, **kwargs):
+        gazetteer = get_gazetteer()
+        # Longer prefixes than any label can't match.
+        prefix = normalize_location(request.GET.get("location", "")[:LABEL_LENGTH])
+        labels = ()
+        if gazetteer:
+            labels = gazetteer.suggest(prefix, settings.LOCATION_SUGGESTIONS)
+        response = HttpResponse(
+            format_html_join("", '<option value="{}"></option>', zip(labels))
+        )
+        patch_cache_control(response, public=True, max_age=self.cache_seconds)
+        return response
+
+
 # ---------------------------
 #   Account Deletion
 # ---------------------------
 
 
 class DeleteAccountView(LoginRequiredMixin, View):
-    """Account deletion view."""
+    """
+    Account deletion view.
+
+    Deactivates the account and logs out at once; the data is purged in the
+    background by ``purge_deleted_accounts`` (see users/deletion.py).
+    """
 
     success_url = reverse_lazy("index")
 
@@ -124,10 +418,10 @@ class DeleteAccountView(LoginRequiredMixin, View):
         user = request.user
         email = user.email
 
+        request_account_deletion(user, request)
         logout(request)
-        user.delete()
 
-        messages.success(request, f"Account '{email}' has been permanently deleted.")
+        messages.success(request, f"Account '{email}' has been deleted.")
         return redirect(self.success_url)
 
 
@@ -136,23 +430,20 @@ class DeleteAccountView(LoginRequiredMixin, View):
 # ---------------------------
 
 
-class ResendVerificationEmailView(LoginRequiredMixin, View):
+class ResendVerificationEmailView(LoginRequiredMixin, JsonRateLimitMixin, View):
     """
     Send 6-digit verification code via email with rate limiting.
 
     Security features:
-    - Rate limiting: cooldown between requests (configurable via .env)
+    - Rate limiting: cooldown between requests plus an hourly cap (configurable via .env)
     - User authentication required
     - Only sends if email is unverified
-    - 6-digit code stored in session with expiry (configurable via .env)
+    - 6-digit code stored hashed in VerificationCode with expiry (configurable via .env)
     - CSRF protection enabled
     """
 
-    # Get settings from Django settings (which reads from .env)
-    from django.conf import settings
-
-    COOLDOWN_SECONDS = settings.EMAIL_VERIFICATION_COOLDOWN
-    CODE_EXPIRY_MINUTES = settings.EMAIL_VERIFICATION_CODE_EXPIRY
+    ratelimit_rules = [Rule("RATELIMIT_RESEND_VERIFICATION", key="user")]
+    query_budget = 10
     success_url = reverse_lazy("users:settings")
 
     def post(self, request, *args, **kwargs):
@@ -160,121 +451,145 @@ class ResendVerificationEmailView(LoginRequiredMixin, View):
         user = request.user
 
         # Get or create user's primary email address
-        try:
-            email_address = EmailAddress.objects.get(user=user, primary=True)
-        except EmailAddress.DoesNotExist:
-            # Create EmailAddress record if it doesn't exist
-            email_address = EmailAddress.objects.create(
-                user=user,
-                email=user.email,
-                primary=True,
-                verified=False
-            )
+        email_address = get_primary_email_address(user)
 
         # Check if email is already verified
         if email_address.verified:
-            return JsonResponse(
-                {"success": False, "message": "Your email is already verified."},
-                status=400,
-            )
-
-        # Rate limiting: Check cooldown period
-        last_sent_key = f"email_verification_sent_{user.id}"
-        last_sent = request.session.get(last_sent_key)
+            return self.already_verified()
 
-        if last_sent:
-            last_sent_time = timezone.datetime.fromisoformat(last_sent)
-            time_since_last = timezone.now() - last_sent_time
-            cooldown_remaining = (
-                timedelta(seconds=self.COOLDOWN_SECONDS) - time_since_last
-            )
-
-            if cooldown_remaining.total_seconds() > 0:
-                seconds_remaining = int(cooldown_remaining.total_seconds())
-                return JsonResponse(
-                    {
-                        "success": False,
-                        "message": f"Please wait {seconds_remaining} seconds before requesting another code.",
-                    },
-                    status=429,
-                )
+        # Rate limiting: Check cooldown period since the last code was issued
+        latest_code = VerificationCode.objects.latest_active(user)
+        if latest_code:
+            response = self.cooldown(latest_code)
+            if response is not None:
+                return response
 
         # Generate 6-digit verification code
-        verification_code = str(random.randint(100000, 999999))
+        verification_code = new_verification_code()
 
-        # Store code in session with timestamp
-        code_key = f"email_verification_code_{user.id}"
-        code_timestamp_key = f"email_verification_code_timestamp_{user.id}"
-        request.session[code_key] = verification_code
-        request.session[code_timestamp_key] = timezone.now().isoformat()
+        # Store hashed code (retires any previous code)
+        code_record = VerificationCode.objects.issue(
+            user, verification_code, self.code_lifetime()
+        )
 
         # Send verification email
         try:
-            # Render HTML email template
-            html_message = render_to_string(
-                "users/email/verification_code_email.html",
-                {
-                    "user": user,
-                    "verification_code": verification_code,
-                    "expiry_minutes": self.CODE_EXPIRY_MINUTES,
-                },
-            )
-
-            # Send email
-            send_mail(
-                subject="Email Verification Code",
-                message=f"Your verification code is: {verification_code}",
-                from_email=None,  # Uses DEFAULT_FROM_EMAIL
-                recipient_list=[user.email],
-                html_message=html_message,
-                fail_silently=False,
-            )
+            send_mail(**self.get_email_kwargs(user, verification_code))
+        except Exception:
+            # Don't hold the user to the cooldown for a code they never got
+            code_record.delete()
+            # Log error in production (don't expose details to user)
+            return self.send_failed()
+        return self.sent()
 
-            # Store timestamp for rate limiting
-            request.session[last_sent_key] = timezone.now().isoformat()
+    def code_lifetime(self):
+        # Read per request, so settings overrides apply.
+        return timedelta(minutes=settings.EMAIL_VERIFICATION_CODE_EXPIRY)
 
-            return JsonResponse(
-                {
-                    "success": True,
-                    "message": "Verification code has been sent to your email!",
-                }
-            )
+    def cooldown(self, latest_code):
+        """Return a 429 response if the last code is too recent, else None."""
+        time_since_last = timezone.now() - latest_code.created_at
+        cooldown = timedelta(seconds=settings.EMAIL_VERIFICATION_COOLDOWN)
+        cooldown_remaining = cooldown - time_since_last
 
-        except Exception as e:
-            # Log error in production (don't expose details to user)
+        if cooldown_remaining.total_seconds() > 0:
+            seconds_remaining = int(cooldown_remaining.total_seconds())
             return JsonResponse(
                 {
                     "success": False,
-                    "message": "Failed to send verification email. Please try again later.",
+                    "message": f"Please wait {seconds_remaining} seconds before requesting another code.",
                 },
-                status=500,
+                status=429,
             )
+        return None
+
+    def get_email_kwargs(self, user, verification_code):
+        # Render HTML email template
+        html_message = render_to_string(
+            "users/email/verification_code_email.html",
+            {
+                "user": user,
+                "verification_code": verification_code,
+                "expiry_minutes": settings.EMAIL_VERIFICATION_CODE_EXPIRY,
+            },
+        )
+        return {
+            "subject": "Email Verification Code",
+            "message": f"Your verification code is: {verification_code}",
+            "from_email": None,  # Uses DEFAULT_FROM_EMAIL
+            "recipient_list": [user.email],
+            "html_message": html_message,
+            "fail_silently": False,
+        }
+
+    def already_verified(self):
+        return JsonResponse(
+            {"success": False, "message": "Your email is already verified."},
+            status=400,
+        )
+
+    def sent(self):
+        return JsonResponse(
+            {
+                "success": True,
+                "message": "Verification code has been sent to your email!",
+            }
+        )
 
+    def send_failed(self):
+        return JsonResponse(
+            {
+                "success": False,
+                "message": "Failed to send verification email. Please try again later.",
+            },
+            status=500,
+        )
 
-class VerifyEmailCodeView(LoginRequiredMixin, View):
+
+class VerifyEmailCodeView(LoginRequiredMixin, JsonRateLimitMixin, View):
     """
     Verify the 6-digit email verification code.
     """
 
-    # Get settings from Django settings (which reads from .env)
-    from django.conf import settings
-
-    CODE_EXPIRY_MINUTES = settings.EMAIL_VERIFICATION_CODE_EXPIRY
+    ratelimit_rules = [Rule("RATELIMIT_VERIFY_EMAIL", key="user")]
+    query_budget = 6
 
     def post(self, request, *args, **kwargs):
         """Handle POST request to verify code."""
         user = request.user
         submitted_code = request.POST.get("code", "").strip()
 
-        # Get stored code from session
-        code_key = f"email_verification_code_{user.id}"
-        code_timestamp_key = f"email_verification_code_timestamp_{user.id}"
-
-        stored_code = request.session.get(code_key)
-        code_timestamp = request.session.get(code_timestamp_key)
+        # Check and consume the code in a single UPDATE
+        if not VerificationCode.objects.consume(
+            user, submitted_code, settings.EMAIL_VERIFICATION_MAX_ATTEMPTS
+        ):
+            audit.record(AuditEvent.Kind.EMAIL_VERIFICATION_FAILED, request, user)
+            return self.rejected(user)
 
+        # Code is valid - mark email as verified
+        email_address = get_primary_email_address(user)
+        email_address.verified = True
+        email_address.save()
+        audit.record(AuditEvent.Kind.EMAIL_VERIFIED, request, user)
+
+        return self.verified()
+
+    def rejected(self, user):
+        """Explain why the submitted code was not accepted."""
+        latest_code = VerificationCode.objects.latest_active(user)
+        response = self.rejection_for(latest_code)
+        if response is None:
+            VerificationCode.objects.record_failed_attempt(latest_code)
+            response = self.invalid_code()
+        return response
+
+    def rejection_for(self, latest_code):
+        """
+        Return the response for a missing, expired or locked-out code, or None
+        if the code was simply wrong (which counts as a failed attempt).
+        """
         # Check if code exists
-        if not stored_code or not code_timestamp:
+        if latest_code is None:
             return JsonResponse(
                 {
                     "success": False,
@@ -284,12 +599,7 @@ class VerifyEmailCodeView(LoginRequiredMixin, View):
             )
 
         # Check if code has expired
-        code_time = timezone.datetime.fromisoformat(code_timestamp)
-        time_elapsed = timezone.now() - code_time
-        if time_elapsed > timedelta(minutes=self.CODE_EXPIRY_MINUTES):
-            # Clear expired code
-            del request.session[code_key]
-            del request.session[code_timestamp_key]
+        if latest_code.is_expired:
             return JsonResponse(
                 {
                     "success": False,
@@ -298,34 +608,118 @@ class VerifyEmailCodeView(LoginRequiredMixin, View):
                 status=400,
             )
 
-        # Verify code
-        if submitted_code != stored_code:
+        # Check if too many wrong codes were submitted
+        if latest_code.attempts >= settings.EMAIL_VERIFICATION_MAX_ATTEMPTS:
             return JsonResponse(
-                {"success": False, "message": "Invalid verification code. Please try again."},
+                {
+                    "success": False,
+                    "message": "Too many incorrect attempts. Please request a new code.",
+                },
                 status=400,
             )
+        return None
 
-        # Code is valid - mark email as verified
-        try:
-            email_address = EmailAddress.objects.get(user=user, primary=True)
-        except EmailAddress.DoesNotExist:
-            # Create EmailAddress record if it doesn't exist
-            email_address = EmailAddress.objects.create(
-                user=user,
-                email=user.email,
-                primary=True,
-                verified=False
-            )
-
-        email_address.verified = True
-        email_address.save()
-
-        # Clear verification code from session
-        del request.session[code_key]
-        del request.session[code_timestamp_key]
-        if f"email_verification_sent_{user.id}" in request.session:
-            del request.session[f"email_verification_sent_{user.id}"]
+    def invalid_code(self):
+        return JsonResponse(
+            {"success": False, "message": "Invalid verification code. Please try again."},
+            status=400,
+        )
 
+    def verified(self):
         return JsonResponse(
             {"success": True, "message": "Email verified successfully!"}
         )
+
+
+# ---------------------------
+#   Async Views (ASGI)
+# ---------------------------
+# Native async variants of the hot auth endpoints, routed in users/urls.py
+# when ASYNC_VIEWS is on. Under an ASGI server they await the async ORM,
+# session and auth APIs instead of hopping through a thread per request.
+# They inherit templates, rate limits and responses from the sync views.
+
+
+class AsyncLoginView(LoginView):
+    """Async LoginView."""
+
+    async def get(self, request, *args, **kwargs):
+        return self.render_to_response(self.get_context_data())
+
+    async def post(self, request, *args, **kwargs):
+        form = self.get_form()
+        if not form.is_valid():
+            return self.form_invalid(form)
+
+        user = await aauthenticate(
+            request,
+            email=form.cleaned_data["email"],
+            password=form.cleaned_data["password"],
+        )
+
+        if user is not None:
+            await alogin(request, user)
+            return HttpResponseRedirect(self.get_success_url())
+
+        await sync_to_async(self.ratelimit_failure)(request)
+        messages.error(request, "Invalid email or password.")
+        return self.form_invalid(form)
+
+    put = post
+
+
+class AsyncResendVerificationEmailView(
+    AsyncLoginRequiredMixin, ResendVerificationEmailView
+):
+    """Async ResendVerificationEmailView; mail goes out through asend_mail()."""
+
+    async def post(self, request, *args, **kwargs):
+        user = request.user
+
+        email_address = await aget_primary_email_address(user)
+        if email_address.verified:
+            return self.already_verified()
+
+        latest_code = await VerificationCode.objects.alatest_active(user)
+        if latest_code:
+            response = self.cooldown(latest_code)
+            if response is not None:
+                return response
+
+        verification_code = new_verification_code()
+        code_record = await VerificationCode.objects.aissue(
+            user, verification_code, self.code_lifetime()
+        )
+
+        try:
+            await asend_mail(**self.get_email_kwargs(user, verification_code))
+        except Exception:
+            await code_record.adelete()
+            return self.send_failed()
+        return self.sent()
+
+
+class AsyncVerifyEmailCodeView(AsyncLoginRequiredMixin, VerifyEmailCodeView):
+    """Async VerifyEmailCodeView."""
+
+    async def post(self, request, *args, **kwargs):
+        user = request.user
+        submitted_code = request.POST.get("code", "").strip()
+
+        if not await VerificationCode.objects.aconsume(
+            user, submitted_code, settings.EMAIL_VERIFICATION_MAX_ATTEMPTS
+        ):
+            audit.record(AuditEvent.Kind.EMAIL_VERIFICATION_FAILED, request, user)
+            latest_code = await VerificationCode.objects.alatest_active(user)
+            response = self.rejection_for(latest_code)
+            if response is None:
+                await VerificationCode.objects.arecord_failed_attempt(latest_code)
+                response = self.invalid_code()
+            return response
+
+        email_address = await aget_primary_email_address(user)
+        email_address.verified = True
+        await email_address.asave()
+        audit.record(AuditEvent.Kind.EMAIL_VERIFIED, request, user)
+
+        return self.verified()